@@ -4,32 +4,46 @@ Agent API Router
 Handles the core voice-to-insight pipeline.
 """
 
+import asyncio
+import hashlib
 import logging
+from collections import OrderedDict
+
+import orjson
 from fastapi import APIRouter, UploadFile, File, HTTPException
 from fastapi.responses import Response, StreamingResponse
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 from typing import Optional
 
-from app.services.gradium_stt import transcribe_audio
+from app.services.gradium_stt import (
+    transcribe_audio_stream,
+    AudioConversionError,
+    AudioTooLargeError,
+)
 from app.services.gradium_tts import (
     text_to_speech,
     text_to_speech_stream,
     text_to_speech_chunked,
     VOICES,
 )
-from app.services.dify_api import call_dify_chat, parse_dify_response
+from app.services.dify_api import DifyParsed, call_dify_chat, parse_dify_response
+from app.services.dify_cache import make_cache_key, get_or_fetch
 from app.services.conversation_session import create_conversation, get_conversation
+from app.config import settings
 
-
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
+# Read size for streaming audio uploads into STT
+UPLOAD_CHUNK_SIZE = 64 * 1024
+
 
 class EmailDraft(BaseModel):
     """Email draft structure."""
 
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
     subject: str = ""
     body: str = ""
     recipient: str = ""
@@ -38,6 +52,8 @@ class EmailDraft(BaseModel):
 class CallAction(BaseModel):
     """Call action returned when agent initiates a call."""
 
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
     call_id: str
     target: str
     status: str
@@ -46,6 +62,8 @@ class CallAction(BaseModel):
 class ProcessAudioResponse(BaseModel):
     """Response model for audio processing."""
 
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
     transcript: str
     explanation: str
     email_draft: EmailDraft
@@ -61,6 +79,171 @@ class ChatRequest(BaseModel):
     conversation_id: Optional[str] = None
 
 
+def _lookup_dify_context(
+    conversation_id: Optional[str],
+) -> tuple[Optional[str], str]:
+    """
+    Find the Dify conversation that one of our conversations continues.
+
+    Turns served from the response cache never reached Dify, so a
+    conversation that started with a cache hit has no Dify ID yet. Its
+    earlier turns are returned as a transcript for the next query to carry.
+
+    Returns:
+        Tuple of (Dify conversation ID, transcript of turns Dify has not seen)
+    """
+    session = get_conversation(conversation_id) if conversation_id else None
+    if not session:
+        return None, ""
+
+    if session.dify_conversation_id:
+        logger.info(
+            "Found Dify conv_id: %s for local conv_id: %s",
+            session.dify_conversation_id,
+            conversation_id,
+        )
+        return session.dify_conversation_id, ""
+
+    history = "\n".join(f"{m.role}: {m.content}" for m in session.messages)
+    return None, history
+
+
+def _is_cacheable(parsed: DifyParsed) -> bool:
+    """Responses that trigger an action belong to the caller who asked."""
+    return not (parsed.action or parsed.call_action)
+
+
+async def get_parsed_dify_response(
+    query: str, dify_conv_id: Optional[str], history: str = ""
+) -> tuple[DifyParsed, str]:
+    """
+    Call Dify and parse the response, serving stateless turns from cache.
+
+    Turns that continue a conversation bypass the cache so answers never
+    bleed across sessions. Responses carrying an action or call are never
+    cached, since replaying them would hand out another user's call.
+
+    Args:
+        query: The user's message
+        dify_conv_id: Dify conversation to continue, if any
+        history: Earlier turns Dify has not seen, sent ahead of the query
+
+    Returns:
+        Tuple of (parsed response, cache status: HIT, MISS or BYPASS)
+    """
+    if history:
+        query_with_history = f"Previous conversation:\n{history}\n\nuser: {query}"
+    else:
+        query_with_history = query
+
+    async def fetch() -> DifyParsed:
+        dify_response = await call_dify_chat(
+            query=query_with_history,
+            conversation_id=dify_conv_id,  # Use Dify's conversation ID, not our local one
+        )
+        return parse_dify_response(dify_response)
+
+    if dify_conv_id or history:
+        return await fetch(), "BYPASS"
+
+    parsed, hit = await get_or_fetch(
+        make_cache_key(query, dify_conv_id), fetch, _is_cacheable
+    )
+    if hit:
+        # The cached Dify conversation belongs to whoever asked first;
+        # start a fresh one rather than sharing it between sessions.
+        # The next turn replays this one so Dify still gets the context.
+        parsed.conversation_id = None
+    return parsed, "HIT" if hit else "MISS"
+
+
+def _persist_turn(
+    conversation_id: Optional[str], user_text: str, parsed: DifyParsed
+) -> str:
+    """
+    Save a user/assistant turn to conversation history.
+
+    Creates the session if the ID is missing or unknown, and keeps the
+    stored Dify conversation ID in sync with the latest response.
+
+    Returns:
+        Our internal conversation ID
+    """
+    dify_id = parsed.conversation_id
+    explanation = parsed.explanation
+
+    session = None
+    if conversation_id:
+        session = get_conversation(conversation_id)
+
+    if not session:
+        # Create new session if ID not provided or not found
+        # Use metadata conversation_id from Dify if available, else new
+        session = create_conversation(dify_id=dify_id)
+    elif dify_id and session.dify_conversation_id != dify_id:
+        # Update dify_conversation_id if Dify returned a new one
+        session.dify_conversation_id = dify_id
+        logger.info("Updated session dify_conversation_id to %s", dify_id)
+
+    # Add user and agent messages with a single save
+    messages = [("user", user_text, None)]
+    if explanation:
+        messages.append(
+            (
+                "assistant",
+                explanation,
+                {
+                    "email_draft": parsed.email_draft,
+                    "call_action": parsed.call_action,
+                },
+            )
+        )
+    session.add_messages(messages)
+
+    return session.conversation_id
+
+
+def _agent_response(
+    transcript: str, parsed: DifyParsed, conversation_id: str, cache_status: str
+) -> Response:
+    """
+    Encode a ProcessAudioResponse-shaped body with orjson.
+
+    The fields come from our own parser, so the body is built directly
+    instead of going through model validation and FastAPI's encoder.
+    ProcessAudioResponse stays as the documented response_model.
+    """
+    email_draft = parsed.email_draft
+    call_action = parsed.call_action
+
+    body = {
+        "transcript": transcript,
+        "explanation": parsed.explanation,
+        "email_draft": {
+            "subject": email_draft.get("subject", ""),
+            "body": email_draft.get("body", ""),
+            "recipient": email_draft.get("recipient", ""),
+        },
+        "conversation_id": conversation_id,
+        "raw_answer": parsed.raw_answer,
+        "call_action": (
+            {
+                "call_id": call_action.get("call_id"),
+                "target": call_action.get("target"),
+                "status": call_action.get("status"),
+            }
+            if call_action
+            else None
+        ),
+    }
+
+    return Response(
+        content=orjson.dumps(body),
+        media_type="application/json",
+        headers={"X-Cache": cache_status},
+    )
+
+
 @router.post("/chat", response_model=ProcessAudioResponse)
 async def process_text(request: ChatRequest):
     """
@@ -69,86 +252,34 @@ async def process_text(request: ChatRequest):
     Same as process-audio but without STT step.
     """
     try:
-        logger.info(f"Chat request: {request.message[:50]}...")
+        logger.info("Chat request: %.50s...", request.message)
 
         # Look up the Dify conversation ID from our session (if exists)
-        dify_conv_id = None
-        if request.conversation_id:
-            existing_session = get_conversation(request.conversation_id)
-            if existing_session and existing_session.dify_conversation_id:
-                dify_conv_id = existing_session.dify_conversation_id
-                logger.info(f"Found Dify conv_id: {dify_conv_id} for local conv_id: {request.conversation_id}")
+        dify_conv_id, history = _lookup_dify_context(request.conversation_id)
 
         # Call Dify for reasoning
         try:
-            dify_response = await call_dify_chat(
-                query=request.message,
-                conversation_id=dify_conv_id,  # Use Dify's conversation ID, not our local one
+            parsed, cache_status = await get_parsed_dify_response(
+                request.message, dify_conv_id, history
             )
-            parsed = parse_dify_response(dify_response)
+            logger.info("Dify cache: %s", cache_status)
         except Exception as e:
-            logger.error(f"Dify API failed: {type(e).__name__}: {e}")
+            logger.error("Dify API failed: %s: %s", type(e).__name__, e)
             raise HTTPException(status_code=500, detail=f"Dify API failed: {str(e)}")
 
-        email_draft_data = parsed.get("email_draft") or {}
-        call_action_data = parsed.get("call_action")
-
         # Save to conversation history
-        session = None
-        if request.conversation_id:
-            session = get_conversation(request.conversation_id)
-
-        if not session:
-            # Create new session if ID not provided or not found
-            # Use metadata conversation_id from Dify if available, else new
-            dify_id = parsed.get("conversation_id")
-            session = create_conversation(dify_id=dify_id)
-        else:
-            # Update dify_conversation_id if Dify returned a new one
-            new_dify_id = parsed.get("conversation_id")
-            if new_dify_id and session.dify_conversation_id != new_dify_id:
-                session.dify_conversation_id = new_dify_id
-                logger.info(f"Updated session dify_conversation_id to {new_dify_id}")
-
-        # Add user message
-        session.add_message("user", request.message)
-
-        # Add agent message
-        explanation = parsed.get("explanation", "")
-        if explanation:
-            session.add_message(
-                "assistant",
-                explanation,
-                metadata={
-                    "email_draft": email_draft_data,
-                    "call_action": call_action_data,
-                },
-            )
-
-        # Update conversation_id in response to be OUR internal ID
-        # But we also want to keep the dify_id for context?
-        # For simplicity, we use our ID as the main one, and store dify_id internally
-        response_conv_id = session.conversation_id
-
-        return ProcessAudioResponse(
-            transcript=request.message,  # Use the typed message as "transcript"
-            explanation=parsed.get("explanation", ""),
-            email_draft=EmailDraft(
-                subject=email_draft_data.get("subject", "") if email_draft_data else "",
-                body=email_draft_data.get("body", "") if email_draft_data else "",
-                recipient=email_draft_data.get("recipient", "")
-                if email_draft_data
-                else "",
-            ),
-            conversation_id=response_conv_id,
-            raw_answer=parsed.get("raw_answer", ""),
-            call_action=CallAction(**call_action_data) if call_action_data else None,
+        # The response carries OUR internal conversation ID; the Dify ID is stored internally
+        response_conv_id = _persist_turn(
+            request.conversation_id, request.message, parsed
         )
 
+        # Use the typed message as "transcript"
+        return _agent_response(request.message, parsed, response_conv_id, cache_status)
+
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Chat error: {type(e).__name__}: {e}")
+        logger.error("Chat error: %s: %s", type(e).__name__, e)
         raise HTTPException(status_code=500, detail=f"Unexpected error: {str(e)}")
 
 
@@ -165,144 +296,86 @@ async def process_audio(
     3. Return structured response with explanation and action
     """
     try:
-        # Read audio bytes
-        audio_bytes = await audio.read()
-        logger.info(
-            f"Received audio: {len(audio_bytes)} bytes, filename: {audio.filename}"
-        )
+        # Read the first chunk up front to reject empty uploads,
+        # then stream the rest into STT instead of buffering the whole file
+        first_chunk = await audio.read(UPLOAD_CHUNK_SIZE)
+        logger.info("Received audio: filename: %s", audio.filename)
 
-        if not audio_bytes:
+        if not first_chunk:
             raise HTTPException(status_code=400, detail="Empty audio file")
 
-        # Step 1: Transcribe audio
-        try:
-            logger.info("Starting transcription...")
-            transcript = await transcribe_audio(
-                audio_bytes, audio.filename or "audio.webm"
-            )
-            logger.info(f"Transcription result: {transcript[:100]}...")
-        except Exception as e:
-            logger.error(f"Transcription failed: {type(e).__name__}: {e}")
-            import traceback
+        async def upload_chunks():
+            yield first_chunk
+            while chunk := await audio.read(UPLOAD_CHUNK_SIZE):
+                yield chunk
+
+        # Step 1: Transcribe audio, looking up the Dify conversation ID
+        # from our session (if exists) in a worker thread meanwhile
+        logger.info("Starting transcription...")
+        stt_task = asyncio.create_task(
+            transcribe_audio_stream(upload_chunks(), audio.filename or "audio.webm")
+        )
+        lookup_task = asyncio.create_task(
+            asyncio.to_thread(_lookup_dify_context, conversation_id)
+        )
+
+        def stop_stt_if_lookup_failed(task: asyncio.Task):
+            # Don't keep reading an upload the request is about to close
+            if task.cancelled() or task.exception() is not None:
+                stt_task.cancel()
 
-            traceback.print_exc()
+        lookup_task.add_done_callback(stop_stt_if_lookup_failed)
+
+        transcript, context = await asyncio.gather(
+            stt_task, lookup_task, return_exceptions=True
+        )
+        if isinstance(context, BaseException):
+            raise context
+        dify_conv_id, history = context
+
+        if isinstance(transcript, AudioTooLargeError):
+            raise HTTPException(status_code=413, detail=str(transcript))
+        if isinstance(transcript, AudioConversionError):
+            raise HTTPException(status_code=415, detail=str(transcript))
+        if isinstance(transcript, BaseException):
+            logger.error(
+                "Transcription failed: %s: %s",
+                type(transcript).__name__,
+                transcript,
+                exc_info=transcript,
+            )
             raise HTTPException(
-                status_code=500, detail=f"Transcription failed: {str(e)}"
+                status_code=500, detail=f"Transcription failed: {str(transcript)}"
             )
-
-        # Look up the Dify conversation ID from our session (if exists)
-        dify_conv_id = None
-        if conversation_id:
-            existing_session = get_conversation(conversation_id)
-            if existing_session and existing_session.dify_conversation_id:
-                dify_conv_id = existing_session.dify_conversation_id
-                logger.info(f"Found Dify conv_id: {dify_conv_id} for local conv_id: {conversation_id}")
+        logger.info("Transcription result: %.100s...", transcript)
 
         # Step 2: Call Dify for reasoning
         try:
             logger.info("Calling Dify API...")
-            dify_response = await call_dify_chat(
-                query=transcript,
-                conversation_id=dify_conv_id,  # Use Dify's conversation ID, not our local one
+            parsed, cache_status = await get_parsed_dify_response(
+                transcript, dify_conv_id, history
             )
-            logger.info("Dify response received")
-            parsed = parse_dify_response(dify_response)
+            logger.info("Dify response received (cache: %s)", cache_status)
         except Exception as e:
-            logger.error(f"Dify API failed: {type(e).__name__}: {e}")
-            import traceback
-
-            traceback.print_exc()
+            logger.exception("Dify API failed: %s: %s", type(e).__name__, e)
             raise HTTPException(status_code=500, detail=f"Dify API failed: {str(e)}")
 
-        # Step 3: Structure response
-        email_draft_data = parsed.get("email_draft") or {}
-        call_action_data = parsed.get("call_action")
-
-        # Save to conversation history
-        session = None
-        if conversation_id:
-            session = get_conversation(conversation_id)
-
-        if not session:
-            # Create new session if ID not provided or not found
-            dify_id = parsed.get("conversation_id")
-            session = create_conversation(dify_id=dify_id)
-        else:
-            # Update dify_conversation_id if Dify returned a new one
-            new_dify_id = parsed.get("conversation_id")
-            if new_dify_id and session.dify_conversation_id != new_dify_id:
-                session.dify_conversation_id = new_dify_id
-                logger.info(f"Updated session dify_conversation_id to {new_dify_id}")
-
-        # Add user message (transcript)
-        session.add_message("user", transcript)
-
-        # Add agent message
-        explanation = parsed.get("explanation", "")
-        if explanation:
-            session.add_message(
-                "assistant",
-                explanation,
-                metadata={
-                    "email_draft": email_draft_data,
-                    "call_action": call_action_data,
-                },
-            )
-
-        response_conv_id = session.conversation_id
-
-        # Save to conversation history
-        session = None
-        if conversation_id:
-            session = get_conversation(conversation_id)
-
-        if not session:
-            # Create new session if ID not provided or not found
-            dify_id = parsed.get("conversation_id")
-            session = create_conversation(dify_id=dify_id)
-
-        # Add user message (transcript)
-        session.add_message("user", transcript)
-
-        # Add agent message
-        explanation = parsed.get("explanation", "")
-        if explanation:
-            session.add_message(
-                "assistant",
-                explanation,
-                metadata={
-                    "email_draft": email_draft_data,
-                    "call_action": call_action_data,
-                },
-            )
+        # Step 3: Save to conversation history and structure response
+        response_conv_id = _persist_turn(conversation_id, transcript, parsed)
 
-        response_conv_id = session.conversation_id
-
-        return ProcessAudioResponse(
-            transcript=transcript,
-            explanation=parsed.get("explanation", ""),
-            email_draft=EmailDraft(
-                subject=email_draft_data.get("subject", "") if email_draft_data else "",
-                body=email_draft_data.get("body", "") if email_draft_data else "",
-                recipient=email_draft_data.get("recipient", "")
-                if email_draft_data
-                else "",
-            ),
-            conversation_id=response_conv_id,
-            raw_answer=parsed.get("raw_answer", ""),
-            call_action=CallAction(**call_action_data) if call_action_data else None,
-        )
+        return _agent_response(transcript, parsed, response_conv_id, cache_status)
 
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Unexpected error: {type(e).__name__}: {e}")
-        import traceback
-
-        traceback.print_exc()
+        logger.exception("Unexpected error: %s: %s", type(e).__name__, e)
         raise HTTPException(status_code=500, detail=f"Unexpected error: {str(e)}")
 
 
+# Voice used when the requested name is unknown
+DEFAULT_VOICE_ID = VOICES["english_female"]
+
+
 class TTSRequest(BaseModel):
     """Request model for TTS."""
 
@@ -311,6 +384,89 @@ class TTSRequest(BaseModel):
         "english_female"  # english_female, english_male, french_female, french_male
     )
 
+    @property
+    def voice_id(self) -> str:
+        """Gradium voice ID for the requested voice name."""
+        return VOICES.get(self.voice) or DEFAULT_VOICE_ID
+
+
+# Canned phrases pre-rendered at startup, per voice name
+TTS_PRECACHE_PHRASES = {
+    "french_female": ["Bonjour", "Au revoir", "Merci"],
+    "english_female": ["Hello", "Goodbye", "Thank you"],
+}
+
+# Pre-rendered WAV audio for canned phrases: (text, voice_id) -> bytes
+TTS_PRECACHE: dict[tuple[str, str], bytes] = {}
+
+# LRU of dynamically synthesized audio, bounded by total size
+TTS_CACHE_MAX_BYTES = 50 * 1024 * 1024  # 50MB
+_tts_cache: "OrderedDict[tuple[str, str], bytes]" = OrderedDict()
+_tts_cache_bytes = 0
+
+
+def _tts_cache_key(text: str, voice_id: str) -> tuple[str, str]:
+    """Hash the text so long inputs don't bloat the cache keys."""
+    return hashlib.sha256(text.encode()).hexdigest(), voice_id
+
+
+def get_cached_tts(text: str, voice_id: str) -> Optional[bytes]:
+    """Look up pre-rendered or previously synthesized audio."""
+    audio = TTS_PRECACHE.get((text, voice_id))
+    if audio is not None:
+        return audio
+
+    key = _tts_cache_key(text, voice_id)
+    audio = _tts_cache.get(key)
+    if audio is not None:
+        _tts_cache.move_to_end(key)
+    return audio
+
+
+def store_cached_tts(text: str, voice_id: str, audio: bytes):
+    """Add synthesized audio to the LRU, evicting oldest entries over budget."""
+    global _tts_cache_bytes
+
+    if len(audio) > TTS_CACHE_MAX_BYTES:
+        return
+
+    key = _tts_cache_key(text, voice_id)
+    previous = _tts_cache.pop(key, None)
+    if previous is not None:
+        _tts_cache_bytes -= len(previous)
+
+    _tts_cache[key] = audio
+    _tts_cache_bytes += len(audio)
+
+    while _tts_cache_bytes > TTS_CACHE_MAX_BYTES:
+        _, evicted = _tts_cache.popitem(last=False)
+        _tts_cache_bytes -= len(evicted)
+
+
+@router.on_event("startup")
+async def precache_tts_phrases():
+    """Pre-render canned TTS phrases so they are served from memory."""
+    if not settings.gradium_api_key:
+        logger.info("Skipping TTS precache: GRADIUM_API_KEY is not configured")
+        return
+
+    async def render(phrase: str, voice_id: str):
+        try:
+            TTS_PRECACHE[(phrase, voice_id)] = await text_to_speech(
+                text=phrase, voice_id=voice_id, output_format="wav"
+            )
+        except Exception as e:
+            logger.warning("TTS precache failed for '%s': %s", phrase, e)
+
+    await asyncio.gather(
+        *[
+            render(phrase, VOICES[voice])
+            for voice, phrases in TTS_PRECACHE_PHRASES.items()
+            for phrase in phrases
+        ]
+    )
+    logger.info("TTS precache ready: %s phrases", len(TTS_PRECACHE))
+
 
 @router.post("/tts")
 async def synthesize_speech(request: TTSRequest):
@@ -320,18 +476,24 @@ async def synthesize_speech(request: TTSRequest):
     Returns WAV audio file.
     """
     try:
-        # Get voice ID from name
-        voice_id = VOICES.get(request.voice, VOICES["english_female"])
-
-        logger.info(f"TTS request: {len(request.text)} chars, voice: {request.voice}")
+        voice_id = request.voice_id
 
-        audio_bytes = await text_to_speech(
-            text=request.text,
-            voice_id=voice_id,
-            output_format="wav",
+        logger.info(
+            "TTS request: %s chars, voice: %s", len(request.text), request.voice
         )
 
-        logger.info(f"TTS complete: {len(audio_bytes)} bytes")
+        audio_bytes = get_cached_tts(request.text, voice_id)
+        if audio_bytes is not None:
+            logger.info("TTS cache hit: %s bytes", len(audio_bytes))
+        else:
+            audio_bytes = await text_to_speech(
+                text=request.text,
+                voice_id=voice_id,
+                output_format="wav",
+            )
+            store_cached_tts(request.text, voice_id, audio_bytes)
+
+            logger.info("TTS complete: %s bytes", len(audio_bytes))
 
         return Response(
             content=audio_bytes,
@@ -340,15 +502,10 @@ async def synthesize_speech(request: TTSRequest):
         )
 
     except Exception as e:
-        logger.error(f"TTS failed: {type(e).__name__}: {e}")
-        import traceback
-
-        traceback.print_exc()
+        logger.exception("TTS failed: %s: %s", type(e).__name__, e)
         raise HTTPException(status_code=500, detail=f"TTS failed: {str(e)}")
 
 
-
-
 @router.post("/tts/stream")
 async def synthesize_speech_stream(request: TTSRequest):
     """
@@ -357,35 +514,31 @@ async def synthesize_speech_stream(request: TTSRequest):
     Returns streaming PCM audio for low-latency playback.
     """
     try:
-        voice_id = VOICES.get(request.voice, VOICES["english_female"])
+        voice_id = request.voice_id
 
         logger.info(
-            f"TTS stream request: {len(request.text)} chars, voice: {request.voice}"
+            "TTS stream request: %s chars, voice: %s", len(request.text), request.voice
         )
 
-        async def audio_stream():
-            async for chunk in text_to_speech_stream(
+        # Hand the TTS generator straight to Starlette - no re-yielding wrapper
+        return StreamingResponse(
+            text_to_speech_stream(
                 text=request.text,
                 voice_id=voice_id,
                 output_format="pcm",
-            ):
-                yield chunk
-
-        return StreamingResponse(
-            audio_stream(),
+            ),
             media_type="audio/pcm",
             headers={
                 "Content-Disposition": "inline; filename=response.pcm",
                 "X-Sample-Rate": "24000",
                 "X-Channels": "1",
+                "Cache-Control": "no-store",
+                "X-Accel-Buffering": "no",  # Don't let proxies buffer the first chunk
             },
         )
 
     except Exception as e:
-        logger.error(f"TTS stream failed: {type(e).__name__}: {e}")
-        import traceback
-
-        traceback.print_exc()
+        logger.exception("TTS stream failed: %s: %s", type(e).__name__, e)
         raise HTTPException(status_code=500, detail=f"TTS stream failed: {str(e)}")
 
 
@@ -400,39 +553,39 @@ async def synthesize_speech_chunked(request: TTSRequest):
     Returns: Multipart stream of WAV audio chunks with JSON metadata.
     """
     try:
-        voice_id = VOICES.get(request.voice, VOICES["english_female"])
+        voice_id = request.voice_id
 
         logger.info(
-            f"TTS chunked request: {len(request.text)} chars, voice: {request.voice}"
+            "TTS chunked request: %s chars, voice: %s", len(request.text), request.voice
         )
 
         async def generate_chunks():
-            import json
-
             async for chunk_data in text_to_speech_chunked(
                 text=request.text,
                 voice_id=voice_id,
                 output_format="wav",
             ):
+                audio = chunk_data["audio"]
+
                 # Send metadata as JSON header
                 metadata = {
                     "chunk_index": chunk_data["chunk_index"],
                     "total_chunks": chunk_data["total_chunks"],
                     "is_last": chunk_data["is_last"],
-                    "audio_size": len(chunk_data["audio"]),
+                    "audio_size": len(audio),
                 }
                 # Format: JSON_LENGTH:JSON_DATA:AUDIO_DATA
-                meta_json = json.dumps(metadata).encode()
-                yield (
-                    f"{len(meta_json)}:".encode()
-                    + meta_json
-                    + b":"
-                    + chunk_data["audio"]
+                meta_json = orjson.dumps(metadata)
+                yield b"".join(
+                    (str(len(meta_json)).encode(), b":", meta_json, b":", audio)
                 )
 
-                logger.info(
-                    f"Sent chunk {chunk_data['chunk_index'] + 1}/{chunk_data['total_chunks']}"
-                )
+                if logger.isEnabledFor(logging.INFO):
+                    logger.info(
+                        "Sent chunk %s/%s",
+                        chunk_data["chunk_index"] + 1,
+                        chunk_data["total_chunks"],
+                    )
 
         return StreamingResponse(
             generate_chunks(),
@@ -441,8 +594,5 @@ async def synthesize_speech_chunked(request: TTSRequest):
         )
 
     except Exception as e:
-        logger.error(f"TTS chunked failed: {type(e).__name__}: {e}")
-        import traceback
-
-        traceback.print_exc()
+        logger.exception("TTS chunked failed: %s: %s", type(e).__name__, e)
         raise HTTPException(status_code=500, detail=f"TTS chunked failed: {str(e)}")
@@ -7,15 +7,65 @@ Handles call initiation, status, and Twilio webhooks.
 from fastapi import APIRouter, HTTPException, Request, Response
 from fastapi.responses import FileResponse
 from pydantic import BaseModel
+from string import Template
 from typing import Optional
+from urllib.parse import parse_qsl
+from xml.sax.saxutils import escape
 import logging
 
-from app.services.call_bridge import call_manager, CallStatus
+from app.services.call_bridge import (
+    call_manager,
+    CallStatus,
+    get_call_audio as get_cached_call_audio,
+    release_call_audio,
+)
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/call", tags=["Call Bridge"])
 
+# Read size when streaming Twilio recordings into STT
+RECORDING_CHUNK_SIZE = 64 * 1024
+
+# Twilio recordings are always hosted on its REST API
+TWILIO_RECORDING_PREFIX = "https://api.twilio.com/"
+
+# TwiML to end the call
+TWIML_HANGUP = b'<?xml version="1.0" encoding="UTF-8"?><Response><Hangup/></Response>'
+
+# TwiML to:
+# 1. Play the French TTS audio
+# 2. Record the response
+TWIML_PLAY_AND_RECORD = Template("""<?xml version="1.0" encoding="UTF-8"?>
+<Response>
+    <Play>$audio_url</Play>
+    <Record 
+        maxLength="120"
+        action="$action"
+        transcribe="false"
+        playBeep="false"
+    />
+    <Say language="fr-FR">Au revoir.</Say>
+</Response>""")
+
+# Escaped recording webhook URL up to the call ID; constant for the process
+RECORDING_ACTION_PREFIX = escape(
+    f"{call_manager.twilio.webhook_base}/api/v1/call/recording/", {'"': "&quot;"}
+)
+
+
+async def _twilio_form(request: Request) -> dict[str, str]:
+    """
+    Parse a Twilio webhook body.
+
+    Twilio always posts small application/x-www-form-urlencoded bodies,
+    so decode them directly rather than going through request.form().
+    """
+    body = await request.body()
+    return dict(
+        parse_qsl(body.decode("utf-8"), keep_blank_values=True, max_num_fields=64)
+    )
+
 
 class InitiateCallRequest(BaseModel):
     """Request to initiate a call."""
@@ -42,7 +92,7 @@ async def initiate_call(request: InitiateCallRequest) -> CallStatusResponse:
 
     The call runs asynchronously. Poll /call/status/{call_id} for updates.
     """
-    logger.info(f"Initiating call to {request.target}: {request.message[:50]}...")
+    logger.info("Initiating call to %s: %.50s...", request.target, request.message)
 
     try:
         session = await call_manager.initiate_call(
@@ -56,7 +106,7 @@ async def initiate_call(request: InitiateCallRequest) -> CallStatusResponse:
             french_message=session.french_message,
         )
     except Exception as e:
-        logger.error(f"Failed to initiate call: {e}")
+        logger.error("Failed to initiate call: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 
@@ -83,6 +133,16 @@ async def get_call_audio(call_id: str):
     """Serve the TTS audio for Twilio to play."""
     import os
 
+    audio = get_cached_call_audio(call_id)
+    if audio is not None:
+        return Response(
+            content=audio,
+            media_type="audio/wav",
+            headers={
+                "Content-Disposition": f'attachment; filename="call_{call_id}.wav"'
+            },
+        )
+
     audio_path = f"/tmp/call_{call_id}.wav"
 
     if not os.path.exists(audio_path):
@@ -103,28 +163,16 @@ async def twiml_handler(call_id: str, request: Request):
     session = call_manager.get_session(call_id)
 
     if not session:
-        logger.error(f"TwiML requested for unknown call: {call_id}")
-        return Response(
-            content='<?xml version="1.0" encoding="UTF-8"?><Response><Hangup/></Response>',
-            media_type="application/xml",
-        )
+        logger.error("TwiML requested for unknown call: %s", call_id)
+        return Response(content=TWIML_HANGUP, media_type="application/xml")
 
-    # Generate TwiML to:
-    # 1. Play the French TTS audio
-    # 2. Record the response
-    twiml = f"""<?xml version="1.0" encoding="UTF-8"?>
-<Response>
-    <Play>{session.audio_url}</Play>
-    <Record 
-        maxLength="120"
-        action="{call_manager.twilio.webhook_base}/api/v1/call/recording/{call_id}"
-        transcribe="false"
-        playBeep="false"
-    />
-    <Say language="fr-FR">Au revoir.</Say>
-</Response>"""
+    twiml = TWIML_PLAY_AND_RECORD.substitute(
+        audio_url=escape(session.audio_url or ""),
+        # call_id matched a known session, so it is one of our UUIDs
+        action=RECORDING_ACTION_PREFIX + call_id,
+    )
 
-    logger.info(f"[{call_id}] Serving TwiML")
+    logger.info("[%s] Serving TwiML", call_id)
     return Response(content=twiml, media_type="application/xml")
 
 
@@ -135,39 +183,33 @@ async def recording_handler(call_id: str, request: Request):
 
     Downloads the recording and processes it.
     """
-    form_data = await request.form()
+    form_data = await _twilio_form(request)
     recording_url = form_data.get("RecordingUrl")
     recording_sid = form_data.get("RecordingSid")
 
-    logger.info(f"[{call_id}] Recording received: {recording_sid}")
+    logger.info("[%s] Recording received: %s", call_id, recording_sid)
 
-    if recording_url:
-        # Download recording from Twilio
-        import httpx
-        from app.config import settings
+    if recording_url and not recording_url.startswith(TWILIO_RECORDING_PREFIX):
+        logger.warning("[%s] Ignoring unexpected recording URL", call_id)
+        recording_url = None
 
-        async with httpx.AsyncClient() as client:
-            # Add .wav extension for format
-            audio_response = await client.get(
-                f"{recording_url}.wav",
-                auth=(settings.twilio_account_sid, settings.twilio_auth_token),
-            )
-            audio_data = audio_response.content
+    if recording_url:
+        # Download recording from Twilio using the shared, authenticated client
+        client = request.app.state.twilio_http
 
-        # Process the recording
+        # Stream the download straight into STT instead of buffering it
         try:
-            english_response = await call_manager.handle_call_response(
-                call_id, audio_data
-            )
-            logger.info(f"[{call_id}] Response processed: {english_response[:100]}...")
+            # Add .wav extension for format
+            async with client.stream("GET", f"{recording_url}.wav") as audio_response:
+                english_response = await call_manager.handle_call_response_stream(
+                    call_id, audio_response.aiter_bytes(RECORDING_CHUNK_SIZE)
+                )
+            logger.info("[%s] Response processed: %.100s...", call_id, english_response)
         except Exception as e:
-            logger.error(f"[{call_id}] Failed to process recording: {e}")
+            logger.error("[%s] Failed to process recording: %s", call_id, e)
 
     # Return TwiML to end the call
-    return Response(
-        content='<?xml version="1.0" encoding="UTF-8"?><Response><Hangup/></Response>',
-        media_type="application/xml",
-    )
+    return Response(content=TWIML_HANGUP, media_type="application/xml")
 
 
 @router.post("/status/{call_id}")
@@ -177,10 +219,10 @@ async def status_callback(call_id: str, request: Request):
 
     Receives updates about call status (ringing, answered, completed, etc.)
     """
-    form_data = await request.form()
+    form_data = await _twilio_form(request)
     call_status = form_data.get("CallStatus")
 
-    logger.info(f"[{call_id}] Twilio status: {call_status}")
+    logger.info("[%s] Twilio status: %s", call_id, call_status)
 
     session = call_manager.get_session(call_id)
     if session:
@@ -191,4 +233,7 @@ async def status_callback(call_id: str, request: Request):
             session.status = CallStatus.FAILED
             session.error = f"Call {call_status}"
 
+    if call_status in ["completed", "busy", "no-answer", "canceled", "failed"]:
+        release_call_audio(call_id)
+
     return {"status": "ok"}
@@ -7,21 +7,27 @@ Handles bidirectional audio streaming between Twilio and Gradium:
 """
 
 import asyncio
-import base64
-import json
+import binascii
 import logging
+import re
 import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Optional
 
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect
 import gradium
+import orjson
 
 from app.config import settings
 from app.services.call_session import CallSession, CallPhase, get_session
 from app.services.audio_bridge import (
+    build_twilio_media_frames,
     twilio_to_gradium_stt,
     GRADIUM_TTS_FORMAT,
+    TWILIO_PAYLOAD_SIZE,
 )
-from app.services.dify_api import translate_text
+from app.services.dify_api import call_dify_chat, parse_dify_response, translate_text
+from app.services.twilio_service import end_call_in_background
 
 logger = logging.getLogger(__name__)
 
@@ -30,11 +36,69 @@ router = APIRouter(prefix="/api/v1/call", tags=["call-media"])
 # French voice ID for TTS (from Gradium) - Elise
 FRENCH_VOICE_ID = "b35yykvVppLXyw_l"
 
+# Outbound audio is batched into media frames of this many bytes
+# (80ms of 8kHz ulaw) instead of one frame per TTS chunk
+TWILIO_MEDIA_FRAME_BYTES = 640
+
+# Phrases that end the call, matched anywhere in a message (case-insensitive)
+TERMINATION_PHRASES = [
+    "au revoir",
+    "goodbye",
+    "bonne journée",
+    "bon journée",
+    "bye",
+    "a bientôt",
+]
+TERMINATION_RE = re.compile(
+    "|".join(map(re.escape, TERMINATION_PHRASES)), re.IGNORECASE
+)
+
+# Short acknowledgements that mean CAF is waiting on us
+ACKNOWLEDGEMENTS = [
+    "sure",
+    "okay",
+    "ok",
+    "d'accord",
+    "bien sûr",
+    "yes",
+    "oui",
+    "understood",
+    "good",
+]
+ACKNOWLEDGEMENT_RE = re.compile(
+    "|".join(map(re.escape, ACKNOWLEDGEMENTS)), re.IGNORECASE
+)
+
+# Seconds to wait for STT to drain after the media stream closes
+STT_SHUTDOWN_TIMEOUT = 2.0
+
+# Sentence boundary in streamed agent replies
+SENTENCE_END_RE = re.compile(r"(?<=[.!?])\s+")
+
+# Max sentence translations in flight per agent reply
+SENTENCE_TRANSLATE_CONCURRENCY = 3
+
+# Inbound 20ms Twilio frames are converted for STT in batches of this size
+# (80ms). Twilio streams continuously, silence included, so a batch always fills.
+STT_BATCH_BYTES = 4 * TWILIO_PAYLOAD_SIZE
+
+# Max batches waiting for STT (~5s of audio); the oldest is dropped beyond
+# this so a stalled STT stream can't grow memory or replay stale audio
+STT_QUEUE_MAX_CHUNKS = 64
+
+# Limits concurrent Gradium TTS streams across calls on this worker
+_TTS_SEMAPHORE = asyncio.Semaphore(settings.tts_concurrency)
+
+# Shared pool for base64/JSON encoding of outbound media frames
+_ENCODE_EXECUTOR = ThreadPoolExecutor(max_workers=2, thread_name_prefix="media-encode")
+
 
 async def translate_to_english(french_text: str) -> str:
     """Translate French to English using Dify/OpenAI"""
     try:
-        result = await translate_text(french_text, source_lang="fr", target_lang="en")
+        result = await translate_text(
+            french_text, source_lang="fr", target_lang="en"
+        )
         return result
     except Exception as e:
         logger.error(f"Translation error: {e}")
@@ -44,45 +108,181 @@ async def translate_to_english(french_text: str) -> str:
 async def translate_to_french(english_text: str) -> str:
     """Translate English to French using Dify/OpenAI"""
     try:
-        result = await translate_text(english_text, source_lang="auto", target_lang="fr")
+        result = await translate_text(
+            english_text, source_lang="auto", target_lang="fr"
+        )
         return result
     except Exception as e:
         logger.error(f"Translation error: {e}")
         return english_text
 
 
+class SentenceTranslator:
+    """
+    Translate an agent reply to French sentence by sentence while Dify
+    is still generating it, so translation overlaps with generation.
+
+    Feed it answer deltas via feed(); translate() then returns the
+    French text, falling back to a whole-message translation when the
+    final message isn't the plain streamed text (e.g. a JSON reply).
+    """
+
+    def __init__(self):
+        self._streamed = ""
+        self._pending = ""
+        self._structured = False
+        self._tasks: list[asyncio.Task] = []
+        self._semaphore = asyncio.Semaphore(SENTENCE_TRANSLATE_CONCURRENCY)
+
+    async def _translate_sentence(self, sentence: str) -> str:
+        async with self._semaphore:
+            return await translate_to_french(sentence)
+
+    def _submit(self, sentence: str):
+        if sentence.strip():
+            self._tasks.append(
+                asyncio.create_task(self._translate_sentence(sentence.strip()))
+            )
+
+    def feed(self, delta: str):
+        """Accept an answer delta, submitting each completed sentence."""
+        self._streamed += delta
+        if self._structured:
+            return
+        if self._streamed.lstrip().startswith("{"):
+            # Structured reply; the spoken text comes from the parser
+            self._structured = True
+            return
+
+        self._pending += delta
+        *sentences, self._pending = SENTENCE_END_RE.split(self._pending)
+        for sentence in sentences:
+            self._submit(sentence)
+
+    async def translate(self, message: str) -> str:
+        """French translation of the final agent message."""
+        if self._structured or message.strip() != self._streamed.strip():
+            self.cancel()
+            return await translate_to_french(message)
+
+        self._submit(self._pending)
+        self._pending = ""
+        return " ".join(await asyncio.gather(*self._tasks))
+
+    def cancel(self):
+        """Stop translating sentences whose translation won't be used."""
+        for task in self._tasks:
+            task.cancel()
+
+
+# Frontend events where only the latest pending one matters
+COALESCED_FRONTEND_EVENTS = {"caf_said"}
+
+# Max events queued for a frontend that isn't keeping up
+FRONTEND_OUTBOX_MAX = 256
+
+
 async def notify_frontend(session: CallSession, event_type: str, data: dict = None):
-    """Send event to connected frontend WebSocket"""
+    """
+    Queue an event for the connected frontend WebSocket.
+
+    Events are sent by drain_frontend_events, so a slow frontend never
+    blocks the caller. A pending partial transcript is replaced by a
+    newer one instead of queueing behind it. The queue is bounded: when
+    it is full, an older event is dropped and the new one is flagged
+    with "backpressure" so the frontend knows it missed updates.
+    """
+    if not session.frontend_ws:
+        return
+
+    message = {"type": event_type}
+    if data:
+        message.update(data)
+
+    outbox = session.frontend_outbox
+    if (
+        event_type in COALESCED_FRONTEND_EVENTS
+        and outbox
+        and outbox[-1]["type"] == event_type
+    ):
+        outbox[-1] = message
+    else:
+        if len(outbox) >= FRONTEND_OUTBOX_MAX:
+            _drop_frontend_event(outbox, event_type)
+            message["backpressure"] = True
+        outbox.append(message)
+    session.frontend_outbox_ready.set()
+
+
+def _drop_frontend_event(outbox, event_type: str):
+    """Make room in a full outbox, preferring a stale event of the same type"""
+    for i, queued in enumerate(outbox):
+        if queued["type"] == event_type:
+            del outbox[i]
+            return
+    outbox.popleft()
+
+
+async def drain_frontend_events(session: CallSession, websocket: WebSocket):
+    """
+    Send queued frontend events in order until cancelled, or until a
+    close is requested and everything queued has been sent.
+
+    Each wakeup takes everything queued so far as one batch, encodes it
+    in a single pass and writes the frames back to back, so a burst of
+    events costs one wakeup rather than one per event.
+    """
+    outbox = session.frontend_outbox
+    while True:
+        await session.frontend_outbox_ready.wait()
+        session.frontend_outbox_ready.clear()
+
+        while outbox:
+            batch = list(outbox)
+            outbox.clear()
+            frames = [orjson.dumps(message).decode() for message in batch]
+            try:
+                for frame in frames:
+                    await websocket.send_text(frame)
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(
+                        f"[{session.call_id}] → Frontend: "
+                        f"{', '.join(m['type'] for m in batch)}"
+                    )
+            except Exception as e:
+                logger.error(f"Failed to notify frontend: {e}")
+
+        if session.frontend_close_requested:
+            await websocket.close()
+            return
+
+
+async def end_frontend(session: CallSession):
+    """Send call_ended to the frontend, then close its WebSocket"""
+    await notify_frontend(session, "call_ended")
     if session.frontend_ws:
-        try:
-            message = {"type": event_type, **(data or {})}
-            await session.frontend_ws.send_json(message)
-            logger.debug(f"[{session.call_id}] → Frontend: {event_type}")
-        except Exception as e:
-            logger.error(f"Failed to notify frontend: {e}")
+        session.frontend_close_requested = True
+        session.frontend_outbox_ready.set()
 
 
 async def get_agent_response(
-    session: CallSession, caf_said: str, user_question: str
+    session: CallSession,
+    caf_said: str,
+    user_question: str,
+    on_answer: Optional[Callable[[str], None]] = None,
 ) -> dict:
     """
     Ask Dify agent for a response to what CAF said.
+    on_answer, if given, receives the answer text as it streams in.
     Returns: Dict with keys 'message' (str) and optional 'action' (dict).
     """
-    from app.services.dify_api import call_dify_chat, parse_dify_response
-
-    # Construct transcript from session history
-    conversation_context = []
-    for entry in session.transcript:
-        speaker_name = "CAF" if entry.speaker == "caf" else "User"
-        conversation_context.append(f"{speaker_name}: {entry.english_text}")
-
     # We provide structured inputs to Dify so the System Prompt can handle the logic.
     # The 'query' trigger is the immediate event (CAF spoke).
     # Pass available session data to help Agent know what it knows
     dify_inputs = {
         "user_question": user_question,
-        "transcript": chr(10).join(conversation_context),
+        # Most recent turns of the call, maintained by add_transcript
+        "transcript": "\n".join(session.recent_context),
         "caf_last_message": caf_said,
         "call_context": "active_call",
         "beneficiary_info": f"Name: {session.user_name or 'Unknown'}, CAF Number: {session.caf_number or 'Unknown'}",
@@ -106,16 +306,17 @@ CRITICAL INSTRUCTIONS:
             query=trigger_query,
             inputs=dify_inputs,
             conversation_id=session.dify_conversation_id,
+            on_answer=on_answer,
         )
 
         parsed = parse_dify_response(dify_response)
 
         # Save conversation ID for context
-        if parsed.get("conversation_id"):
-            session.dify_conversation_id = parsed["conversation_id"]
+        if parsed.conversation_id:
+            session.dify_conversation_id = parsed.conversation_id
 
-        response_text = parsed.get("explanation", "").strip()
-        action = parsed.get("action")
+        response_text = parsed.explanation.strip()
+        action = parsed.action
 
         logger.info(
             f"[{session.call_id}] Agent suggests: {response_text[:50]}... (Action: {action})"
@@ -136,14 +337,11 @@ def is_repetition_loop(session: CallSession, new_response: str) -> bool:
     1. The new response is very similar to the last thing the agent said.
     2. The last thing CAF said was a short acknowledgement (indicating they are waiting).
     """
-    # 1. Get last agent message
-    last_agent_msg = None
-    for entry in reversed(session.transcript):
-        if entry.speaker == "user":
-            last_agent_msg = entry.english_text
-            break
-
-    if not last_agent_msg:
+    # 1. Get last agent and CAF messages in one go (cached on the session)
+    last_agent_msg = session.last_agent_msg
+    last_caf_msg = session.last_caf_msg
+
+    if not last_agent_msg or not last_caf_msg:
         return False
 
     # 2. Check similarity (simple exact match or contains for now)
@@ -155,32 +353,8 @@ def is_repetition_loop(session: CallSession, new_response: str) -> bool:
         return False
 
     # 3. Check if CAF's last message was just an acknowledgement
-    last_caf_msg = None
-    for entry in reversed(session.transcript):
-        if entry.speaker == "caf":
-            last_caf_msg = entry.english_text
-            break
-
-    if not last_caf_msg:
-        return False
-
-    # List of short acknowledgements
-    acks = [
-        "sure",
-        "okay",
-        "ok",
-        "d'accord",
-        "bien sûr",
-        "yes",
-        "oui",
-        "understood",
-        "good",
-    ]
-
     # If CAF said something short (< 20 chars) or contained an ack
-    caf_said_ack = len(last_caf_msg) < 20 or any(
-        ack in last_caf_msg.lower() for ack in acks
-    )
+    caf_said_ack = len(last_caf_msg) < 20 or ACKNOWLEDGEMENT_RE.search(last_caf_msg)
 
     if caf_said_ack:
         logger.warning(
@@ -205,10 +379,12 @@ async def twilio_media_stream(websocket: WebSocket, call_id: str):
     - media: Audio payload (base64 encoded mulaw)
     - stop: Stream stopped
     """
+    # No TCP_NODELAY tweak needed: asyncio and uvloop TCP transports
+    # already disable Nagle on accepted sockets
     await websocket.accept()
     logger.info(f"[{call_id}] Twilio Media Stream connected")
 
-    session = get_session(call_id)
+    session = await get_session(call_id)
     if not session:
         logger.error(f"[{call_id}] Session not found")
         await websocket.close(code=4004)
@@ -220,17 +396,19 @@ async def twilio_media_stream(websocket: WebSocket, call_id: str):
 
     # State for audio processing
     resample_state = None
+    mulaw_batch = bytearray()
     gradium_client = gradium.client.GradiumClient(api_key=settings.gradium_api_key)
+    session.gradium_client = gradium_client
 
     # Audio buffer for STT
-    audio_buffer = asyncio.Queue()
+    audio_buffer = asyncio.Queue(maxsize=STT_QUEUE_MAX_CHUNKS)
 
     # Start STT processing task
     stt_task = asyncio.create_task(process_stt(session, gradium_client, audio_buffer))
 
     try:
         async for message in websocket.iter_text():
-            data = json.loads(message)
+            data = orjson.loads(message)
             event = data.get("event")
 
             if event == "connected":
@@ -262,15 +440,17 @@ async def twilio_media_stream(websocket: WebSocket, call_id: str):
                 # Receive audio from CAF
                 payload = data.get("media", {}).get("payload", "")
                 if payload:
-                    mulaw_audio = base64.b64decode(payload)
+                    mulaw_batch.extend(binascii.a2b_base64(payload))
 
-                    # Convert to Gradium STT format
-                    pcm_audio, resample_state = twilio_to_gradium_stt(
-                        mulaw_audio, resample_state
-                    )
+                    if len(mulaw_batch) >= STT_BATCH_BYTES:
+                        # Convert to Gradium STT format
+                        pcm_audio, resample_state = twilio_to_gradium_stt(
+                            bytes(mulaw_batch), resample_state
+                        )
+                        mulaw_batch.clear()
 
-                    # Queue for STT processing
-                    await audio_buffer.put(pcm_audio)
+                        # Queue for STT processing
+                        queue_stt_audio(audio_buffer, pcm_audio)
 
             elif event == "stop":
                 logger.info(f"[{call_id}] Media stream stopped")
@@ -285,8 +465,64 @@ async def twilio_media_stream(websocket: WebSocket, call_id: str):
         session.error = str(e)
         session.phase = CallPhase.FAILED
     finally:
-        stt_task.cancel()
-        session.twilio_ws = None
+        # Let STT end its stream cleanly, cancelling it if that takes too long
+        queue_stt_audio(audio_buffer, None)
+        try:
+            await asyncio.wait_for(stt_task, timeout=STT_SHUTDOWN_TIMEOUT)
+        except asyncio.TimeoutError:
+            pass
+        finally:
+            session.twilio_ws = None
+            session.gradium_client = None
+
+
+def queue_stt_audio(audio_queue: asyncio.Queue, chunk: Optional[bytes]):
+    """
+    Queue audio (or the None end sentinel) for STT without blocking the
+    Twilio receive loop, dropping the oldest chunk if STT has fallen behind.
+    """
+    if audio_queue.full():
+        audio_queue.get_nowait()
+        logger.warning("STT audio queue full, dropping oldest chunk")
+    audio_queue.put_nowait(chunk)
+
+
+async def translate_partial(
+    session: CallSession,
+    french: str,
+    previous_french: str,
+    previous_english: Optional[asyncio.Task],
+) -> str:
+    """
+    Translate in-progress CAF speech and show it on the frontend.
+
+    When the text extends the previous partial, only the new suffix is
+    translated, alongside the previous partial finishing, and spliced on.
+    Approximate, but this is not final.
+
+    Returns:
+        English translation of french
+    """
+    if previous_english is not None and french.startswith(previous_french):
+        new_french = french[len(previous_french) :]
+        previous, new_english = await asyncio.gather(
+            previous_english, translate_to_english(new_french.strip())
+        )
+        english_text = f"{previous} {new_english}"
+    else:
+        english_text = await translate_to_english(french)
+
+    # Send accumulated French + latest English to frontend
+    await notify_frontend(
+        session,
+        "caf_said",
+        {
+            "french": french,
+            "english": english_text,
+            "is_final": False,
+        },
+    )
+    return english_text
 
 
 async def process_stt(
@@ -300,15 +536,13 @@ async def process_stt(
     # logger.info(f"[{session.call_id}] Starting STT processing") # Reduced log
 
     async def audio_generator():
-        """Yield audio chunks from queue"""
-        while True:
-            try:
-                chunk = await asyncio.wait_for(audio_queue.get(), timeout=1.0)
-                yield chunk
-            except asyncio.TimeoutError:
-                continue
-            except asyncio.CancelledError:
-                break
+        """Yield audio chunks from queue until the None sentinel"""
+        while (chunk := await audio_queue.get()) is not None:
+            yield chunk
+
+    # Latest intermediate translation, running in the background so STT
+    # events keep flowing while it is translated
+    last_translation: Optional[asyncio.Task] = None
 
     try:
         stt_stream = await client.stt_stream(
@@ -322,7 +556,6 @@ async def process_stt(
 
         current_text = ""
         last_translated_text = ""
-        last_translation = ""
         last_translation_time = 0
 
         # New: Track consecutive silence for VAD
@@ -364,22 +597,17 @@ async def process_stt(
                 # 1. We have enough new content (> 20 chars)
                 # 2. AND enough time has passed (> 1.0s)
                 if new_content_len > 20 and time_since_last > 1.0:
-                    english_text = await translate_to_english(current_text)
-                    last_translation = english_text
+                    last_translation = asyncio.create_task(
+                        translate_partial(
+                            session,
+                            current_text,
+                            last_translated_text,
+                            last_translation,
+                        )
+                    )
                     last_translated_text = current_text
                     last_translation_time = now
 
-                    # Send accumulated French + latest English to frontend
-                    await notify_frontend(
-                        session,
-                        "caf_said",
-                        {
-                            "french": current_text,
-                            "english": english_text,
-                            "is_final": False,
-                        },
-                    )
-
             elif msg_type == "step":
                 # VAD: Check if CAF paused or stopped talking
                 vad = msg.get("vad", [])
@@ -394,8 +622,16 @@ async def process_stt(
                         vad_silence_counter = 0
 
                     if vad_silence_counter >= SILENCE_THRESHOLD and current_text:
-                        # CAF finished speaking (Hard Pause)
-                        english_final = await translate_to_english(current_text)
+                        # CAF finished speaking (Hard Pause). The last
+                        # partial is gathered so it reaches the frontend
+                        # before the final text does
+                        pending = [last_translation] if last_translation else []
+                        english_final, *_ = await asyncio.gather(
+                            translate_to_english(current_text), *pending
+                        )
+                        # Partials of the next utterance start from scratch
+                        last_translated_text = ""
+                        last_translation = None
 
                         # Add to transcript
                         session.add_transcript("caf", current_text, english_final)
@@ -408,27 +644,14 @@ async def process_stt(
                         )
 
                         # === AUTO-HANGUP CHECK ===
-                        termination_phrases = [
-                            "au revoir",
-                            "goodbye",
-                            "bonne journée",
-                            "bon journée",
-                            "bye",
-                            "a bientôt",
-                        ]
                         if any(
-                            phrase in english_final.lower()
-                            for phrase in termination_phrases
-                        ) or any(
-                            phrase in current_text.lower()
-                            for phrase in termination_phrases
+                            TERMINATION_RE.search(text)
+                            for text in (english_final, current_text)
                         ):
                             logger.info(
                                 f"[{session.call_id}] Termination phrase detected. Hanging up."
                             )
-                            from app.services.twilio_service import TwilioService
-
-                            TwilioService().end_call(session.twilio_call_sid)
+                            end_call_in_background(session.twilio_call_sid)
                             session.phase = CallPhase.ENDED
                             await notify_frontend(session, "call_ended")
                             break
@@ -457,28 +680,44 @@ async def process_stt(
 
                         # === AGENT-MEDIATED FLOW ===
                         # Ask Dify for suggested response
+                        # while telling the frontend the agent is thinking
+                        # Sentences are translated as the reply streams in
                         session.phase = CallPhase.WAITING_USER
-                        await notify_frontend(
-                            session,
-                            "agent_thinking",
-                            {"message": "Crafting response..."},
-                        )
-
-                        # Get agent's suggested response
-                        agent_result = await get_agent_response(
-                            session,
-                            caf_said=english_final,
-                            user_question=session.user_question,
+                        translator = SentenceTranslator()
+                        agent_result, _ = await asyncio.gather(
+                            get_agent_response(
+                                session,
+                                caf_said=english_final,
+                                user_question=session.user_question,
+                                on_answer=translator.feed,
+                            ),
+                            notify_frontend(
+                                session,
+                                "agent_thinking",
+                                {"message": "Crafting response..."},
+                            ),
                         )
 
                         agent_message = agent_result.get("message")
                         agent_action = agent_result.get("action")
 
+                        # Finish translating in the background; it overlaps
+                        # with the checks and frontend notifications below
+                        french_task = (
+                            asyncio.create_task(translator.translate(agent_message))
+                            if agent_message
+                            else None
+                        )
+                        if french_task is None:
+                            # Sentences may have streamed in without a
+                            # final message to speak
+                            translator.cancel()
+
                         # Handle specific actions
                         if agent_action and agent_action.get("type") == "ask_user":
                             # 1. Speak the filler message to CAF (if valid)
-                            if agent_message:
-                                french_filler = await translate_to_french(agent_message)
+                            if french_task:
+                                french_filler = await french_task
                                 await speak_to_caf(session, french_filler)
 
                             # 2. Ask user for input
@@ -498,10 +737,7 @@ async def process_stt(
 
                         # Check termination in agent response
                         if agent_message:
-                            if any(
-                                phrase in agent_message.lower()
-                                for phrase in termination_phrases
-                            ):
+                            if TERMINATION_RE.search(agent_message):
                                 logger.info(
                                     f"[{session.call_id}] Agent said goodbye. Hanging up soon."
                                 )
@@ -514,6 +750,10 @@ async def process_stt(
                                 logger.warning(
                                     f"[{session.call_id}] Loop detected, stopping auto-response"
                                 )
+                                # Cancelled before it starts, so translate()
+                                # never cleans up the sentence tasks itself
+                                french_task.cancel()
+                                translator.cancel()
                                 await notify_frontend(
                                     session,
                                     "waiting_for_user",
@@ -537,7 +777,7 @@ async def process_stt(
                             )
 
                             # Auto-speak to CAF (agent-mediated mode)
-                            french_response = await translate_to_french(agent_message)
+                            french_response = await french_task
                             session.add_transcript(
                                 "user", french_response, agent_message
                             )
@@ -562,6 +802,9 @@ async def process_stt(
         pass  # Expected on disconnect
     except Exception as e:
         logger.error(f"[{session.call_id}] STT error: {e}")
+    finally:
+        if last_translation is not None:
+            last_translation.cancel()
 
 
 async def speak_to_caf(session: CallSession, french_text: str):
@@ -577,31 +820,70 @@ async def speak_to_caf(session: CallSession, french_text: str):
     await notify_frontend(session, "speaking_to_caf", {"text": french_text})
 
     try:
-        client = gradium.client.GradiumClient(api_key=settings.gradium_api_key)
-
-        tts_stream = await client.tts_stream(
-            setup={
-                "voice_id": FRENCH_VOICE_ID,
-                "output_format": GRADIUM_TTS_FORMAT,  # ulaw_8000 for Twilio
-            },
-            text=french_text,
+        # Reuse the call's client rather than creating one per utterance
+        client = session.gradium_client or gradium.client.GradiumClient(
+            api_key=settings.gradium_api_key
         )
 
-        chunk_count = 0
-        total_bytes = 0
-        async for chunk in tts_stream.iter_bytes():
-            chunk_count += 1
-            total_bytes += len(chunk)
-            # Send audio to Twilio (already in correct format)
-            await session.twilio_ws.send_json(
-                {
-                    "event": "media",
-                    "streamSid": session.twilio_stream_sid,
-                    "media": {"payload": base64.b64encode(chunk).decode()},
-                }
+        loop = asyncio.get_running_loop()
+
+        async def send_media(audio: bytes):
+            # Send audio to Twilio (already in correct format), building
+            # all of its frames in one pass off the event loop
+            frames = await loop.run_in_executor(
+                _ENCODE_EXECUTOR,
+                build_twilio_media_frames,
+                audio,
+                session.twilio_stream_sid,
+                TWILIO_MEDIA_FRAME_BYTES,
+            )
+            for frame in frames:
+                await session.twilio_ws.send_text(frame)
+
+        # Pull TTS audio and push it to Twilio concurrently, so a slow
+        # Twilio write doesn't stall the Gradium stream and vice versa
+        audio_queue: asyncio.Queue = asyncio.Queue(maxsize=8)
+
+        async def receive_tts():
+            async for chunk in tts_stream.iter_bytes():
+                await audio_queue.put(chunk)
+            await audio_queue.put(None)
+
+        async def send_to_twilio():
+            buffer = bytearray()
+            first_frame = True
+            while (chunk := await audio_queue.get()) is not None:
+                buffer.extend(chunk)
+
+                # Flush the first chunk straight away to keep time-to-first-audio low
+                if first_frame or len(buffer) >= TWILIO_MEDIA_FRAME_BYTES:
+                    await send_media(bytes(buffer))
+                    buffer.clear()
+                    first_frame = False
+
+            if buffer:
+                await send_media(bytes(buffer))
+
+        # Cap concurrent TTS streams across calls on this worker
+        async with _TTS_SEMAPHORE:
+            tts_stream = await client.tts_stream(
+                setup={
+                    "voice_id": FRENCH_VOICE_ID,
+                    "output_format": GRADIUM_TTS_FORMAT,  # ulaw_8000 for Twilio
+                },
+                text=french_text,
             )
 
-        # logger.info(f"[{session.call_id}] Sent {chunk_count} chunks") # Reduced log
+            tasks = [
+                asyncio.create_task(receive_tts()),
+                asyncio.create_task(send_to_twilio()),
+            ]
+            try:
+                await asyncio.gather(*tasks)
+            finally:
+                for task in tasks:
+                    task.cancel()
+
         session.phase = CallPhase.CAF_SPEAKING
         await notify_frontend(session, "finished_speaking")
 
@@ -7,14 +7,28 @@ Handles real-time communication with the React frontend during a call:
 - Manages call lifecycle events
 """
 
+import asyncio
 import logging
 from typing import Optional
 
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect, HTTPException
 from pydantic import BaseModel
-
+import orjson
+
+from app.api.v1.call_media import (
+    drain_frontend_events,
+    end_frontend,
+    notify_frontend,
+    speak_to_caf,
+    translate_to_french,
+)
+from app.api.v1.streaming import OrjsonResponse
 from app.services.call_session import CallPhase, create_session, get_session
-from app.services.twilio_service import TwilioService, get_hotline_number
+from app.services.twilio_service import (
+    end_call_in_background,
+    get_hotline_number,
+    get_twilio,
+)
 from app.config import settings
 
 logger = logging.getLogger(__name__)
@@ -22,6 +36,11 @@ logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/api/v1/call", tags=["call-websocket"])
 
 
+async def _send_json(websocket: WebSocket, data: dict):
+    """Send a JSON text frame, encoded with orjson"""
+    await websocket.send_text(orjson.dumps(data).decode())
+
+
 class StartCallRequest(BaseModel):
     """Request to start a new interactive call"""
 
@@ -72,20 +91,24 @@ async def dial_call(call_id: str):
 
     This is separate from start so frontend can connect WebSocket first.
     """
-    session = get_session(call_id)
+    session = await get_session(call_id)
     if not session:
         raise HTTPException(status_code=404, detail="Session not found")
 
     session.phase = CallPhase.DIALING
 
     try:
-        twilio = TwilioService()
+        twilio = get_twilio()
 
         # Generate TwiML that uses Media Streams
-        media_stream_url = f"wss://{settings.backend_public_url.replace('https://', '')}/api/v1/call/media/{call_id}"
+        media_stream_url = (
+            f"wss://{settings.backend_ws_host}/api/v1/call/media/{call_id}"
+        )
 
-        # Initiate call with Media Streams
-        call_sid = twilio.initiate_media_stream_call(
+        # Initiate call with Media Streams (the Twilio SDK blocks, so
+        # the request runs in a worker thread)
+        call_sid = await asyncio.to_thread(
+            twilio.initiate_media_stream_call,
             to_number=get_hotline_number(session.target),
             call_id=call_id,
             media_stream_url=media_stream_url,
@@ -142,16 +165,17 @@ async def initiate_interactive_call(
     )
 
     try:
-        twilio = TwilioService()
+        twilio = get_twilio()
 
         # Generate Media Streams URL
-        backend_host = settings.backend_public_url.replace("https://", "").replace(
-            "http://", ""
+        media_stream_url = (
+            f"wss://{settings.backend_ws_host}/api/v1/call/media/{session.call_id}"
         )
-        media_stream_url = f"wss://{backend_host}/api/v1/call/media/{session.call_id}"
 
-        # Initiate call with Media Streams
-        call_sid = twilio.initiate_media_stream_call(
+        # Initiate call with Media Streams (the Twilio SDK blocks, so
+        # the request runs in a worker thread)
+        call_sid = await asyncio.to_thread(
+            twilio.initiate_media_stream_call,
             to_number=get_hotline_number(request.target),
             call_id=session.call_id,
             media_stream_url=media_stream_url,
@@ -224,26 +248,32 @@ async def frontend_websocket(websocket: WebSocket, call_id: str):
     await websocket.accept()
     logger.info(f"[{call_id}] Frontend WebSocket connected")
 
-    session = get_session(call_id)
+    session = await get_session(call_id)
     if not session:
-        await websocket.send_json({"type": "error", "message": "Session not found"})
+        await _send_json(websocket, {"type": "error", "message": "Session not found"})
         await websocket.close(code=4004)
         return
 
     session.frontend_ws = websocket
 
-    # Send current state
-    await websocket.send_json(
+    # Events from the call flow are queued and sent by this task
+    drain_task = asyncio.create_task(drain_frontend_events(session, websocket))
+
+    # Send current state through the same queue so it can't interleave
+    # with call events already being drained
+    await notify_frontend(
+        session,
+        "session_state",
         {
-            "type": "session_state",
             "phase": session.phase.value,
             "target": session.target,
             "question": session.user_question,
-        }
+        },
     )
 
     try:
-        async for message in websocket.iter_json():
+        async for text in websocket.iter_text():
+            message = orjson.loads(text)
             msg_type = message.get("type")
 
             if msg_type == "user_response":
@@ -254,9 +284,6 @@ async def frontend_websocket(websocket: WebSocket, call_id: str):
 
                 logger.info(f"[{call_id}] User response: {english_text[:50]}...")
 
-                # Import here to avoid circular dependency
-                from app.api.v1.call_media import speak_to_caf, translate_to_french
-
                 # Translate and speak to CAF
                 french_text = await translate_to_french(english_text)
                 session.add_transcript("user", french_text, english_text)
@@ -267,15 +294,14 @@ async def frontend_websocket(websocket: WebSocket, call_id: str):
             elif msg_type == "hangup":
                 logger.info(f"[{call_id}] User requested hangup")
 
-                # Hangup Twilio call
+                # Hangup Twilio call without waiting on its REST round-trip
                 if session.twilio_call_sid:
-                    try:
-                        TwilioService().end_call(session.twilio_call_sid)
-                    except Exception as e:
-                        logger.error(f"[{call_id}] Failed to hangup Twilio call: {e}")
+                    end_call_in_background(session.twilio_call_sid)
 
                 session.phase = CallPhase.ENDED
-                await websocket.send_json({"type": "call_ended"})
+                # Queued behind any pending events; the drain task closes
+                # the WebSocket once everything has been sent
+                await end_frontend(session)
                 break
 
     except WebSocketDisconnect:
@@ -283,17 +309,26 @@ async def frontend_websocket(websocket: WebSocket, call_id: str):
     except Exception as e:
         logger.error(f"[{call_id}] WebSocket error: {e}")
     finally:
+        if session.frontend_close_requested:
+            try:
+                await drain_task
+            except Exception as e:
+                logger.error(f"[{call_id}] Failed to close frontend: {e}")
+        else:
+            drain_task.cancel()
         session.frontend_ws = None
+        session.frontend_outbox.clear()
+        session.frontend_close_requested = False
 
 
 @router.get("/session/{call_id}")
 async def get_call_session(call_id: str):
     """Get current session state (for polling fallback)"""
-    session = get_session(call_id)
+    session = await get_session(call_id)
     if not session:
         raise HTTPException(status_code=404, detail="Session not found")
 
-    return session.to_dict()
+    return OrjsonResponse(session.to_dict())
 
 
 @router.delete("/session/{call_id}")
@@ -302,25 +337,17 @@ async def end_call_session(call_id: str):
     End an active call session.
     Doesn't delete the record, just terminates the active call.
     """
-    session = get_session(call_id)
+    session = await get_session(call_id)
     if not session:
         raise HTTPException(status_code=404, detail="Session not found")
 
-    # Hangup Twilio call if active
+    # Hangup Twilio call if active, without waiting on its REST round-trip
     if session.twilio_call_sid:
-        try:
-            TwilioService().end_call(session.twilio_call_sid)
-        except Exception as e:
-            logger.error(f"[{call_id}] Failed to hangup Twilio call: {e}")
+        end_call_in_background(session.twilio_call_sid)
 
     session.phase = CallPhase.ENDED
 
-    # Notify frontend
-    if session.frontend_ws:
-        try:
-            await session.frontend_ws.send_json({"type": "call_ended"})
-            await session.frontend_ws.close()
-        except Exception:
-            pass
+    # Notify frontend; its own handler sends the event and closes the socket
+    await end_frontend(session)
 
     return {"status": "ended", "call_id": call_id}
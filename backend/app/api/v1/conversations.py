@@ -4,11 +4,12 @@ Conversation History API
 API endpoints for retrieving and managing chat history.
 """
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Query
 from typing import List, Dict, Any
 
+from app.api.v1.streaming import OrjsonResponse, stream_json_array
 from app.services.conversation_session import (
-    list_conversations,
+    list_conversation_summaries,
     get_conversation,
     delete_conversation,
 )
@@ -17,23 +18,14 @@ router = APIRouter(tags=["conversations"])
 
 
 @router.get("/", response_model=List[Dict[str, Any]])
-async def get_all_conversations():
+async def get_all_conversations(
+    limit: int = Query(50, ge=1, le=500), offset: int = Query(0, ge=0)
+):
     """
-    Get list of all past conversations.
+    Get a page of past conversations, most recently updated first.
     Returns summary info for each conversation.
     """
-    sessions = list_conversations()
-    # Return basic info only
-    return [
-        {
-            "conversation_id": s.conversation_id,
-            "title": s.title or "New Conversation",
-            "created_at": s.created_at.isoformat(),
-            "updated_at": s.updated_at.isoformat(),
-            "message_count": len(s.messages),
-        }
-        for s in sessions
-    ]
+    return stream_json_array(list_conversation_summaries(limit=limit, offset=offset))
 
 
 @router.get("/{conversation_id}", response_model=Dict[str, Any])
@@ -45,7 +37,7 @@ async def get_single_conversation(conversation_id: str):
     if not session:
         raise HTTPException(status_code=404, detail="Conversation not found")
 
-    return session.to_dict()
+    return OrjsonResponse(session.to_dict())
 
 
 @router.delete("/{conversation_id}")
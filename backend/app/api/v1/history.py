@@ -1,19 +1,22 @@
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Query
 from typing import List, Dict, Any
 
+from app.api.v1.streaming import stream_json_array
 from app.services.call_session import list_sessions, get_session, delete_session
 
 router = APIRouter(tags=["history"])
 
 
 @router.get("/", response_model=List[Dict[str, Any]])
-async def get_call_history():
+async def get_call_history(
+    limit: int = Query(50, ge=1, le=500), offset: int = Query(0, ge=0)
+):
     """
-    Get list of all past calls.
+    Get a page of past calls, newest first.
     Returns summary info for each call.
     """
-    sessions = list_sessions()
-    return [s.to_dict() for s in sessions]
+    sessions = await list_sessions(limit=limit, offset=offset)
+    return stream_json_array(s.to_dict() for s in sessions)
 
 
 @router.delete("/{call_id}")
@@ -21,7 +24,7 @@ async def delete_call_history(call_id: str):
     """
     Delete a specific call record.
     """
-    session = get_session(call_id)
+    session = await get_session(call_id)
     if not session:
         raise HTTPException(status_code=404, detail="Call not found")
 
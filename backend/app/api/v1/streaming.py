@@ -0,0 +1,50 @@
+"""
+Streaming Responses
+
+Helpers for sending JSON encoded with orjson:
+- Large listings are streamed without building them in memory
+- Single records skip FastAPI's jsonable_encoder pass
+"""
+
+from typing import Any, AsyncIterator, Dict, Iterable
+
+import orjson
+from fastapi.responses import JSONResponse, StreamingResponse
+
+
+class OrjsonResponse(JSONResponse):
+    """
+    JSON response rendered with orjson.
+
+    Return it directly from a route: FastAPI then sends it as-is instead
+    of walking the content with jsonable_encoder first.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content)
+
+
+async def _json_array_chunks(rows: Iterable[Dict[str, Any]]) -> AsyncIterator[bytes]:
+    """
+    Yield a JSON array one encoded row at a time.
+
+    Async so Starlette consumes it on the event loop rather than handing
+    each chunk to a worker thread.
+    """
+    yield b"["
+    for i, row in enumerate(rows):
+        yield orjson.dumps(row) if i == 0 else b"," + orjson.dumps(row)
+    yield b"]"
+
+
+def stream_json_array(rows: Iterable[Dict[str, Any]]) -> StreamingResponse:
+    """
+    Stream rows as a JSON array.
+
+    Args:
+        rows: Iterable of JSON-serializable dicts, consumed lazily
+
+    Returns:
+        StreamingResponse with media type application/json
+    """
+    return StreamingResponse(_json_array_chunks(rows), media_type="application/json")
@@ -1,4 +1,5 @@
-import os
+from functools import cached_property, lru_cache
+
 from pydantic_settings import BaseSettings
 from dotenv import load_dotenv
 
@@ -9,29 +10,56 @@ class Settings(BaseSettings):
     """Application settings loaded from environment variables."""
 
     # Gradium AI
-    gradium_api_key: str = os.getenv("GRADIUM_API_KEY", "")
+    gradium_api_key: str = ""
 
     # Dify
-    dify_api_key: str = os.getenv("DIFY_API_KEY", "")
-    dify_api_url: str = os.getenv("DIFY_API_URL", "https://api.dify.ai/v1")
+    dify_api_key: str = ""
+    dify_api_url: str = "https://api.dify.ai/v1"
 
     # OpenAI (optional fallback)
-    openai_api_key: str = os.getenv("OPENAI_API_KEY", "")
+    openai_api_key: str = ""
 
     # Twilio (for call bridge)
-    twilio_account_sid: str = os.getenv("TWILIO_ACCOUNT_SID", "")
-    twilio_auth_token: str = os.getenv("TWILIO_AUTH_TOKEN", "")
-    twilio_phone_number: str = os.getenv("TWILIO_PHONE_NUMBER", "")
-    
+    twilio_account_sid: str = ""
+    twilio_auth_token: str = ""
+    twilio_phone_number: str = ""
+
     # Test phone number (overrides all hotlines in dev)
-    test_phone_number: str = os.getenv("TEST_PHONE_NUMBER", "")
+    test_phone_number: str = ""
 
     # Backend public URL (for Twilio webhooks)
-    backend_public_url: str = os.getenv("BACKEND_PUBLIC_URL", "")
+    backend_public_url: str = ""
+
+    @cached_property
+    def backend_ws_host(self) -> str:
+        """Public backend host (and path prefix) without scheme or trailing slash."""
+        return (
+            self.backend_public_url.removeprefix("https://")
+            .removeprefix("http://")
+            .rstrip("/")
+        )
+
+    # Max concurrent Gradium TTS streams for live calls, per worker
+    tts_concurrency: int = 3
+
+    # Comma-separated CORS origins; empty allows any origin
+    allowed_origins: str = ""
+
+    @property
+    def cors_origins(self) -> list[str]:
+        """Allowed CORS origins, or ["*"] when none are configured."""
+        origins = [o.strip() for o in self.allowed_origins.split(",") if o.strip()]
+        return origins or ["*"]
 
     class Config:
         env_file = ".env"
         extra = "ignore"
 
 
-settings = Settings()
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Build settings once per process; usable as a FastAPI dependency."""
+    return Settings()
+
+
+settings = get_settings()
@@ -1,12 +1,22 @@
+import logging
+
+import httpx
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
+from app.config import settings
 from app.api.v1 import agent
 from app.api.v1 import call_bridge
 from app.api.v1 import call_media
 from app.api.v1 import call_websocket
 from app.api.v1 import history
 from app.api.v1 import conversations
+from app.services.call_bridge import close_openai_client
+from app.services.call_session import flush_sessions
+from app.services.conversation_session import flush_conversations
+from app.services.dify_api import close_dify_client
+
+logging.basicConfig(level=logging.INFO)
 
 app = FastAPI(
     title="Life Admin Copilot API",
@@ -14,13 +24,15 @@ app = FastAPI(
     version="0.1.0",
 )
 
-# CORS for Lovable frontend
+# CORS for Lovable frontend; set ALLOWED_ORIGINS to restrict in production
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],  # For hackathon; restrict in production
-    allow_credentials=True,
+    allow_origins=settings.cors_origins,
+    # Credentials only with an explicit origin list, never with a wildcard
+    allow_credentials=settings.cors_origins != ["*"],
     allow_methods=["*"],
     allow_headers=["*"],
+    max_age=86400,  # let browsers cache preflight responses for a day
 )
 
 # Include routers
@@ -36,6 +48,31 @@ app.include_router(
 )
 
 
+@app.on_event("startup")
+async def create_http_clients():
+    """Create shared HTTP clients so webhooks reuse pooled connections."""
+    app.state.twilio_http = httpx.AsyncClient(
+        timeout=15.0,
+        limits=httpx.Limits(max_keepalive_connections=64),
+        auth=(settings.twilio_account_sid, settings.twilio_auth_token),
+    )
+
+
+@app.on_event("shutdown")
+async def close_http_clients():
+    """Close shared HTTP clients."""
+    await app.state.twilio_http.aclose()
+    await close_openai_client()
+    await close_dify_client()
+
+
+@app.on_event("shutdown")
+async def flush_session_stores():
+    """Write session changes still waiting on the debounce."""
+    flush_sessions()
+    flush_conversations()
+
+
 @app.get("/health")
 async def health_check():
     """Health check endpoint."""
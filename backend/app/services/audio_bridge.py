@@ -10,8 +10,12 @@ Key insight: Gradium TTS supports `ulaw_8000` output,
 so TTS→Twilio requires NO conversion.
 """
 
-import audioop
-from typing import Tuple
+import base64
+from functools import lru_cache
+from typing import Iterator, List, Tuple
+
+import numpy as np
+import orjson
 
 
 # Twilio Media Streams format
@@ -26,6 +30,39 @@ GRADIUM_STT_ENCODING = "pcm"
 GRADIUM_TTS_FORMAT = "ulaw_8000"  # Native Twilio format!
 
 
+def _build_ulaw_tables() -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Build G.711 mu-law lookup tables.
+
+    Returns:
+        Tuple of (256-entry int16 decode table, 65536-entry uint8 encode
+        table indexed by the int16 sample's unsigned bit pattern)
+    """
+    # Decode: invert, then rebuild the biased magnitude from segment/mantissa
+    ulaw = ~np.arange(256, dtype=np.uint8)
+    exponent = (ulaw >> 4) & 0x07
+    mantissa = (ulaw & 0x0F).astype(np.int32)
+    magnitude = (((mantissa << 3) + 0x84) << exponent) - 0x84
+    decode = np.where(ulaw & 0x80, -magnitude, magnitude).astype(np.int16)
+
+    # Encode: work on 14-bit magnitudes, clipped and biased, as in the
+    # G.711 reference encoder
+    pcm = np.arange(65536, dtype=np.uint16).view(np.int16).astype(np.int32) >> 2
+    mask = np.where(pcm < 0, 0x7F, 0xFF)
+    biased = np.minimum(np.abs(pcm), 8159) + (0x84 >> 2)
+    segment = np.searchsorted(
+        np.array([0x3F, 0x7F, 0xFF, 0x1FF, 0x3FF, 0x7FF, 0xFFF, 0x1FFF]), biased
+    )
+    uval = (segment << 4) | ((biased >> (segment + 1)) & 0x0F)
+    uval = np.where(segment >= 8, 0x7F, uval)  # out of range: clip to max
+    encode = (uval ^ mask).astype(np.uint8)
+
+    return decode, encode
+
+
+_ULAW2PCM, _PCM2ULAW = _build_ulaw_tables()
+
+
 def mulaw_to_pcm(mulaw_data: bytes) -> bytes:
     """
     Convert mu-law encoded audio to PCM 16-bit.
@@ -36,7 +73,8 @@ def mulaw_to_pcm(mulaw_data: bytes) -> bytes:
     Returns:
         PCM 16-bit audio bytes
     """
-    return audioop.ulaw2lin(mulaw_data, 2)  # 2 = 16-bit width
+    # take() skips fancy indexing's generic path; same result, less overhead
+    return _ULAW2PCM.take(np.frombuffer(mulaw_data, dtype=np.uint8)).tobytes()
 
 
 def pcm_to_mulaw(pcm_data: bytes) -> bytes:
@@ -49,7 +87,29 @@ def pcm_to_mulaw(pcm_data: bytes) -> bytes:
     Returns:
         mu-law encoded audio bytes
     """
-    return audioop.lin2ulaw(pcm_data, 2)
+    return _PCM2ULAW.take(np.frombuffer(pcm_data, dtype=np.uint16)).tobytes()
+
+
+# Lowpass length per polyphase branch used by resample
+RESAMPLE_TAPS_PER_PHASE = 16
+
+
+@lru_cache(maxsize=None)
+def _resample_filter(factor: int) -> np.ndarray:
+    """
+    Design the anti-aliasing lowpass for an integer resampling ratio.
+
+    Args:
+        factor: Up- or downsampling factor
+
+    Returns:
+        Hamming-windowed sinc taps with unity DC gain, cut off at the
+        lower Nyquist frequency
+    """
+    n = factor * RESAMPLE_TAPS_PER_PHASE
+    t = np.arange(n) - (n - 1) / 2
+    taps = np.sinc(t / factor) * np.hamming(n)
+    return taps / taps.sum()
 
 
 def resample(
@@ -58,6 +118,9 @@ def resample(
     """
     Resample audio from one sample rate to another.
 
+    Uses a polyphase FIR filter, so only integer ratios (e.g. 8000 →
+    24000 or 24000 → 8000) are supported.
+
     Args:
         audio_data: PCM 16-bit audio bytes
         from_rate: Source sample rate (e.g., 8000)
@@ -67,15 +130,44 @@ def resample(
     Returns:
         Tuple of (resampled audio bytes, new state)
     """
-    resampled, new_state = audioop.ratecv(
-        audio_data,
-        2,  # 16-bit width
-        1,  # Mono
-        from_rate,
-        to_rate,
-        state,
-    )
-    return resampled, new_state
+    if from_rate == to_rate:
+        return audio_data, state
+
+    if to_rate % from_rate == 0:
+        up, down = to_rate // from_rate, 1
+    elif from_rate % to_rate == 0:
+        up, down = 1, from_rate // to_rate
+    else:
+        raise ValueError(f"Unsupported resampling ratio: {from_rate} → {to_rate}")
+
+    taps = _resample_filter(max(up, down))
+    samples = np.frombuffer(audio_data, dtype=np.int16).astype(np.float64)
+
+    # State carries the previous input tail (filter history) and, when
+    # decimating, how many filtered samples to skip before the next output
+    history, skip = state if state is not None else (None, 0)
+
+    if up > 1:
+        phases = taps.reshape(-1, up).T * up  # one branch per output phase
+        if history is None:
+            history = np.zeros(phases.shape[1] - 1, dtype=np.float64)
+        padded = np.concatenate((history, samples))
+        out = np.empty((len(samples), up), dtype=np.float64)
+        for p, branch in enumerate(phases):
+            out[:, p] = np.convolve(padded, branch, mode="valid")
+        out = out.ravel()
+        history = padded[len(padded) - (phases.shape[1] - 1) :]
+    else:
+        if history is None:
+            history = np.zeros(len(taps) - 1, dtype=np.float64)
+        padded = np.concatenate((history, samples))
+        filtered = np.convolve(padded, taps, mode="valid")
+        out = filtered[skip::down]
+        skip = (skip - len(filtered)) % down
+        history = padded[len(padded) - (len(taps) - 1) :]
+
+    pcm = np.clip(np.rint(out), -32768, 32767).astype(np.int16)
+    return pcm.tobytes(), (history, skip)
 
 
 def twilio_to_gradium_stt(mulaw_8k: bytes, resample_state=None) -> Tuple[bytes, any]:
@@ -122,19 +214,52 @@ def gradium_tts_to_twilio(ulaw_8k: bytes) -> bytes:
 TWILIO_PAYLOAD_SIZE = 160  # 20ms of audio at 8kHz
 
 
-def chunk_audio(audio_data: bytes, chunk_size: int = TWILIO_PAYLOAD_SIZE) -> list:
+def chunk_audio(
+    audio_data: bytes, chunk_size: int = TWILIO_PAYLOAD_SIZE
+) -> Iterator[memoryview]:
     """
     Split audio into chunks for streaming.
 
+    Chunks are zero-copy views into audio_data, produced lazily.
+
     Args:
         audio_data: Audio bytes
         chunk_size: Size of each chunk
 
     Returns:
-        List of audio chunks
+        Iterator of audio chunks
+    """
+    view = memoryview(audio_data)
+    for i in range(0, len(view), chunk_size):
+        yield view[i : i + chunk_size]
+
+
+def build_twilio_media_frames(
+    ulaw_8k: bytes, stream_sid: str, chunk_size: int = TWILIO_PAYLOAD_SIZE
+) -> List[str]:
+    """
+    Build ready-to-send Twilio Media Stream messages for a block of audio.
+
+    All base64 and JSON encoding happens here in one pass, so the send
+    loop only writes the prepared frames.
+
+    Args:
+        ulaw_8k: mu-law 8kHz audio
+        stream_sid: Twilio stream SID the audio belongs to
+        chunk_size: Audio bytes per media message
+
+    Returns:
+        List of JSON text frames, one per chunk
     """
     return [
-        audio_data[i : i + chunk_size] for i in range(0, len(audio_data), chunk_size)
+        orjson.dumps(
+            {
+                "event": "media",
+                "streamSid": stream_sid,
+                "media": {"payload": base64.b64encode(chunk).decode()},
+            }
+        ).decode()
+        for chunk in chunk_audio(ulaw_8k, chunk_size)
     ]
 
 
@@ -142,7 +267,7 @@ def chunk_audio(audio_data: bytes, chunk_size: int = TWILIO_PAYLOAD_SIZE) -> lis
 GRADIUM_STT_CHUNK_SIZE = 1920  # 80ms at 24kHz
 
 
-def chunk_for_gradium_stt(pcm_24k: bytes) -> list:
+def chunk_for_gradium_stt(pcm_24k: bytes) -> Iterator[memoryview]:
     """
     Split PCM audio into chunks for Gradium STT.
 
@@ -152,7 +277,7 @@ def chunk_for_gradium_stt(pcm_24k: bytes) -> list:
         pcm_24k: PCM 24kHz audio
 
     Returns:
-        List of audio chunks
+        Iterator of audio chunks
     """
     # 1920 samples * 2 bytes/sample = 3840 bytes
     chunk_bytes = GRADIUM_STT_CHUNK_SIZE * 2
@@ -14,15 +14,18 @@ Orchestrates the text-to-call flow:
 import asyncio
 import uuid
 import logging
+import os
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
-from typing import Dict, Optional
+from typing import AsyncIterator, Dict, Optional
 import httpx
 
-from app.services.twilio_service import TwilioService, get_hotline_number
+from app.services.twilio_service import get_twilio, get_hotline_number
 from app.services.gradium_streaming import GradiumSTTStream, VOICE_IDS
 from app.services.gradium_tts import text_to_speech
+from app.services.dify_api import cached_translation
 from app.config import settings
 
 logger = logging.getLogger(__name__)
@@ -70,60 +73,115 @@ class CallSession:
 # In-memory storage (use Redis in production)
 _call_sessions: Dict[str, CallSession] = {}
 
+# Rendered TTS audio per call, served to Twilio without touching disk
+CALL_AUDIO_MAX_BYTES = 64 * 1024 * 1024  # 64MB
+_call_audio: "OrderedDict[str, bytes]" = OrderedDict()
+_call_audio_bytes = 0
 
-async def translate_to_french(text: str) -> str:
-    """Translate English text to French using OpenAI."""
-    async with httpx.AsyncClient() as client:
-        response = await client.post(
-            "https://api.openai.com/v1/chat/completions",
-            headers={"Authorization": f"Bearer {settings.openai_api_key}"},
+
+def store_call_audio(call_id: str, audio: bytes):
+    """Keep a call's audio in memory, evicting oldest calls over budget."""
+    global _call_audio_bytes
+
+    release_call_audio(call_id)
+    if len(audio) > CALL_AUDIO_MAX_BYTES:
+        return
+
+    _call_audio[call_id] = audio
+    _call_audio_bytes += len(audio)
+
+    while _call_audio_bytes > CALL_AUDIO_MAX_BYTES:
+        _, evicted = _call_audio.popitem(last=False)
+        _call_audio_bytes -= len(evicted)
+
+
+def _write_file(path: str, data: bytes):
+    """
+    Write bytes to a file (blocking; run via asyncio.to_thread).
+
+    Written to a temp file and renamed into place, so the audio endpoint
+    never serves a half-written WAV.
+    """
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+
+
+def get_call_audio(call_id: str) -> Optional[bytes]:
+    """Get a call's in-memory audio, if still cached."""
+    audio = _call_audio.get(call_id)
+    if audio is not None:
+        _call_audio.move_to_end(call_id)
+    return audio
+
+
+def release_call_audio(call_id: str):
+    """Drop a call's audio once Twilio no longer needs it."""
+    global _call_audio_bytes
+
+    audio = _call_audio.pop(call_id, None)
+    if audio is not None:
+        _call_audio_bytes -= len(audio)
+
+
+# Shared client so translations reuse pooled keep-alive connections
+_openai_http = httpx.AsyncClient(
+    base_url="https://api.openai.com/v1",
+    headers={"Authorization": f"Bearer {settings.openai_api_key}"},
+    timeout=30.0,
+    limits=httpx.Limits(max_keepalive_connections=32, max_connections=64),
+)
+
+
+async def close_openai_client():
+    """Close the shared OpenAI HTTP client (call on app shutdown)."""
+    await _openai_http.aclose()
+
+
+async def _openai_translate(system_prompt: str, text: str) -> str:
+    """Run a translation chat completion against OpenAI, cached per text."""
+
+    async def translate() -> str:
+        response = await _openai_http.post(
+            "/chat/completions",
             json={
                 "model": "gpt-4o-mini",
                 "messages": [
-                    {
-                        "role": "system",
-                        "content": "You are a professional translator. Translate the following English text to formal French suitable for a phone call with a government agency. Only output the translation, nothing else.",
-                    },
+                    {"role": "system", "content": system_prompt},
                     {"role": "user", "content": text},
                 ],
                 "temperature": 0.3,
             },
-            timeout=30.0,
         )
         response.raise_for_status()
         data = response.json()
         return data["choices"][0]["message"]["content"].strip()
 
+    return await cached_translation(system_prompt, text, translate)
+
+
+async def translate_to_french(text: str) -> str:
+    """Translate English text to French using OpenAI."""
+    return await _openai_translate(
+        "You are a professional translator. Translate the following English text to formal French suitable for a phone call with a government agency. Only output the translation, nothing else.",
+        text,
+    )
+
 
 async def translate_to_english(text: str) -> str:
     """Translate French text to English using OpenAI."""
-    async with httpx.AsyncClient() as client:
-        response = await client.post(
-            "https://api.openai.com/v1/chat/completions",
-            headers={"Authorization": f"Bearer {settings.openai_api_key}"},
-            json={
-                "model": "gpt-4o-mini",
-                "messages": [
-                    {
-                        "role": "system",
-                        "content": "You are a professional translator. Translate the following French text to English. Only output the translation, nothing else.",
-                    },
-                    {"role": "user", "content": text},
-                ],
-                "temperature": 0.3,
-            },
-            timeout=30.0,
-        )
-        response.raise_for_status()
-        data = response.json()
-        return data["choices"][0]["message"]["content"].strip()
+    return await _openai_translate(
+        "You are a professional translator. Translate the following French text to English. Only output the translation, nothing else.",
+        text,
+    )
 
 
 class CallBridgeManager:
     """Manages text-to-call bridge operations."""
 
     def __init__(self):
-        self.twilio = TwilioService()
+        self.twilio = get_twilio()
 
     async def initiate_call(
         self, user_message: str, target: str = "caf"
@@ -159,24 +217,25 @@ class CallBridgeManager:
         try:
             # Step 1: Translate to French
             session.status = CallStatus.TRANSLATING
-            logger.info(f"[{session.call_id}] Translating to French...")
+            logger.info("[%s] Translating to French...", session.call_id)
             session.french_message = await translate_to_french(session.user_message)
-            logger.info(f"[{session.call_id}] French: {session.french_message}")
+            logger.info("[%s] French: %s", session.call_id, session.french_message)
 
             # Step 2: Generate TTS audio
             session.status = CallStatus.GENERATING_AUDIO
-            logger.info(f"[{session.call_id}] Generating French TTS...")
+            logger.info("[%s] Generating French TTS...", session.call_id)
             audio_bytes = await text_to_speech(
                 session.french_message,
                 voice_id=VOICE_IDS["french_female"],
                 output_format="wav",
             )
 
-            # Save audio temporarily (in production, upload to S3/GCS)
-            audio_filename = f"call_{session.call_id}.wav"
-            audio_path = f"/tmp/{audio_filename}"
-            with open(audio_path, "wb") as f:
-                f.write(audio_bytes)
+            # Keep in memory for Twilio's (possibly repeated) <Play> fetches,
+            # and save to disk as a fallback (in production, upload to S3/GCS).
+            # The disk write runs in a thread so it never stalls the loop.
+            store_call_audio(session.call_id, audio_bytes)
+            audio_path = f"/tmp/call_{session.call_id}.wav"
+            await asyncio.to_thread(_write_file, audio_path, audio_bytes)
 
             # Use public URL for Twilio to fetch
             session.audio_url = (
@@ -185,19 +244,23 @@ class CallBridgeManager:
 
             # Step 3: Initiate Twilio call
             session.status = CallStatus.CALLING
-            logger.info(f"[{session.call_id}] Calling {session.target_number}...")
-            session.twilio_sid = self.twilio.initiate_call(
+            logger.info("[%s] Calling %s...", session.call_id, session.target_number)
+            # The Twilio SDK blocks, so the request runs in a worker thread
+            session.twilio_sid = await asyncio.to_thread(
+                self.twilio.initiate_call,
                 to_number=session.target_number,
                 call_id=session.call_id,
             )
 
             session.status = CallStatus.IN_PROGRESS
-            logger.info(f"[{session.call_id}] Call in progress: {session.twilio_sid}")
+            logger.info(
+                "[%s] Call in progress: %s", session.call_id, session.twilio_sid
+            )
 
             # Note: The rest of the flow (transcription) happens via Twilio webhooks
 
         except Exception as e:
-            logger.error(f"[{session.call_id}] Call flow failed: {e}")
+            logger.error("[%s] Call flow failed: %s", session.call_id, e)
             session.status = CallStatus.FAILED
             session.error = str(e)
 
@@ -209,6 +272,28 @@ class CallBridgeManager:
             call_id: The call session ID
             audio_data: Audio bytes from Twilio
 
+        Returns:
+            English translation of the response
+        """
+
+        async def single_chunk():
+            yield audio_data
+
+        return await self.handle_call_response_stream(call_id, single_chunk())
+
+    async def handle_call_response_stream(
+        self, call_id: str, audio_chunks: AsyncIterator[bytes]
+    ) -> str:
+        """
+        Handle a streamed audio response from the call (CAF's response).
+
+        Audio is forwarded to STT as it arrives, so the recording download
+        overlaps with transcription upload.
+
+        Args:
+            call_id: The call session ID
+            audio_chunks: Async iterator of audio bytes from Twilio
+
         Returns:
             English translation of the response
         """
@@ -223,15 +308,21 @@ class CallBridgeManager:
             stt = GradiumSTTStream(input_format="wav", language="fr")
             await stt.connect()
 
-            # Send audio in chunks
+            # Send audio in fixed-size chunks as it arrives
             chunk_size = 1920 * 2  # 80ms at 24kHz, 16-bit
-            for i in range(0, len(audio_data), chunk_size):
-                await stt.send_audio(audio_data[i : i + chunk_size])
+            pending = bytearray()
+            async for data in audio_chunks:
+                pending.extend(data)
+                while len(pending) >= chunk_size:
+                    await stt.send_audio(bytes(pending[:chunk_size]))
+                    del pending[:chunk_size]
+            if pending:
+                await stt.send_audio(bytes(pending))
 
             session.french_response = await stt.receive_transcription()
             await stt.close()
 
-            logger.info(f"[{call_id}] French response: {session.french_response}")
+            logger.info("[%s] French response: %s", call_id, session.french_response)
 
             # Translate to English
             session.english_response = await translate_to_english(
@@ -239,12 +330,12 @@ class CallBridgeManager:
             )
             session.status = CallStatus.COMPLETED
 
-            logger.info(f"[{call_id}] English response: {session.english_response}")
+            logger.info("[%s] English response: %s", call_id, session.english_response)
 
             return session.english_response
 
         except Exception as e:
-            logger.error(f"[{call_id}] Response handling failed: {e}")
+            logger.error("[%s] Response handling failed: %s", call_id, e)
             session.status = CallStatus.FAILED
             session.error = str(e)
             raise
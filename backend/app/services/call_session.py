@@ -5,18 +5,22 @@ Manages the state of interactive call sessions, including:
 - Pre-call info gathering
 - Live call phase tracking
 - WebSocket connections (frontend + Twilio)
-- Audio queues for bidirectional streaming
 """
 
+from collections import OrderedDict, deque
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Optional, Dict, Any, List
+from itertools import islice
+from typing import Optional, Dict, Any, List, Deque
 import asyncio
+import heapq
+import sys
+import time
 import uuid
 from datetime import datetime
 import logging
-import json
-import os
+
+from app.services.sqlite_store import SqliteStore, isoformat_to_ns, ns_to_isoformat
 
 logger = logging.getLogger(__name__)
 
@@ -38,25 +42,79 @@ class CallPhase(Enum):
     FAILED = "failed"  # Call failed
 
 
-@dataclass
+# Phases after which a call never changes again
+TERMINAL_PHASES = {CallPhase.ENDED, CallPhase.FAILED}
+
+# Fields written to the store; assigning one on a cached session saves it
+PERSISTED_FIELDS = frozenset(
+    {
+        "phase",
+        "target",
+        "caf_number",
+        "user_name",
+        "user_question",
+        "twilio_call_sid",
+        "error",
+    }
+)
+
+# Display names used when formatting the transcript for the agent
+SPEAKER_NAMES = {"caf": "CAF", "user": "User"}
+
+# Number of most recent transcript lines sent to the agent as context
+RECENT_CONTEXT_TURNS = 20
+
+
+@dataclass(slots=True, frozen=True)
 class TranscriptEntry:
     """Single entry in the call transcript"""
 
     speaker: str  # "caf" or "user"
     french_text: str
     english_text: str
-    timestamp: datetime = field(default_factory=datetime.now)
+    timestamp_ns: int = field(default_factory=time.time_ns)
+
+    # Entries never change once added, so serialize them only once
+    _cached_dict: Optional[Dict[str, Any]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     def to_dict(self):
-        return {
-            "speaker": self.speaker,
-            "french_text": self.french_text,
-            "english_text": self.english_text,
-            "timestamp": self.timestamp.isoformat(),
-        }
+        if self._cached_dict is None:
+            # Frozen, so the cache has to bypass the generated __setattr__
+            object.__setattr__(
+                self,
+                "_cached_dict",
+                {
+                    "speaker": self.speaker,
+                    "french_text": self.french_text,
+                    "english_text": self.english_text,
+                    "timestamp": ns_to_isoformat(self.timestamp_ns),
+                },
+            )
+        return self._cached_dict
 
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "TranscriptEntry":
+        """Reconstruct entry from dict, accepting the old french/english keys"""
+        french = data.get("french_text")
+        if french is None:
+            french = data.get("french", "")
+        english = data.get("english_text")
+        if english is None:
+            english = data.get("english", "")
+        timestamp = data.get("timestamp")
+        return cls(
+            speaker=sys.intern(data["speaker"]),
+            french_text=french,
+            english_text=english,
+            timestamp_ns=(
+                time.time_ns() if timestamp is None else isoformat_to_ns(timestamp)
+            ),
+        )
 
-@dataclass
+
+@dataclass(slots=True)
 class CallSession:
     """
     Represents an interactive call session.
@@ -79,13 +137,26 @@ class CallSession:
     # Transcript
     transcript: List[TranscriptEntry] = field(default_factory=list)
 
+    # Derived from transcript, kept in sync by add_transcript (NOT PERSISTED)
+    last_agent_msg: Optional[str] = None
+    last_caf_msg: Optional[str] = None
+    recent_context: Deque[str] = field(
+        default_factory=lambda: deque(maxlen=RECENT_CONTEXT_TURNS)
+    )
+
     # WebSocket references (set at runtime - NOT PERSISTED)
     frontend_ws: Optional[Any] = None
     twilio_ws: Optional[Any] = None
 
-    # Audio queues for async streaming (NOT PERSISTED)
-    to_caf_queue: asyncio.Queue = field(default_factory=asyncio.Queue)
-    from_caf_queue: asyncio.Queue = field(default_factory=asyncio.Queue)
+    # Gradium client shared by STT and TTS for the call (NOT PERSISTED)
+    gradium_client: Optional[Any] = None
+
+    # Outbound frontend events awaiting send, drained by the frontend
+    # WebSocket handler (NOT PERSISTED)
+    frontend_outbox: Deque[dict] = field(default_factory=deque)
+    frontend_outbox_ready: asyncio.Event = field(default_factory=asyncio.Event)
+    # Set to close the frontend WebSocket once the outbox is sent
+    frontend_close_requested: bool = False
 
     # Error tracking
     error: Optional[str] = None
@@ -93,6 +164,13 @@ class CallSession:
     # Dify conversation ID
     dify_conversation_id: Optional[str] = None
 
+    def __setattr__(self, name: str, value: Any):
+        object.__setattr__(self, name, value)
+        # Sessions being built or loaded aren't cached yet, so only
+        # changes to the live session are written
+        if name in PERSISTED_FIELDS and _sessions.get(self.call_id) is self:
+            _store.mark_dirty(self.call_id)
+
     def is_info_complete(self) -> bool:
         """Check if we have all required info to make the call"""
         return all(
@@ -104,14 +182,26 @@ class CallSession:
     def add_transcript(self, speaker: str, french: str, english: str):
         """Add entry to transcript"""
         entry = TranscriptEntry(
-            speaker=speaker,
+            speaker=sys.intern(speaker),
             french_text=french,
             english_text=english,
         )
         self.transcript.append(entry)
+        self._index_transcript_entry(entry)
         save_session(self)  # Auto-save on transcript update
         logger.info(f"[{self.call_id}] {speaker}: {english[:50]}...")
 
+    def _index_transcript_entry(self, entry: TranscriptEntry):
+        """Update the last-message pointers and recent agent context"""
+        if entry.speaker == "caf":
+            self.last_caf_msg = entry.english_text
+        elif entry.speaker == "user":
+            self.last_agent_msg = entry.english_text
+
+        self.recent_context.append(
+            f"{SPEAKER_NAMES.get(entry.speaker, 'User')}: {entry.english_text}"
+        )
+
     def to_dict(self) -> Dict[str, Any]:
         """Serialize for API responses"""
         return {
@@ -140,80 +230,82 @@ class CallSession:
             error=data.get("error"),
             dify_conversation_id=data.get("dify_conversation_id"),
         )
-        if "phase" in data:
+        phase = data.get("phase")
+        if phase is not None:
             try:
-                session.phase = CallPhase(data["phase"])
+                session.phase = CallPhase(phase)
             except ValueError:
                 session.phase = CallPhase.ENDED
 
-        if "created_at" in data:
-            session.created_at = datetime.fromisoformat(data["created_at"])
-
-        if "transcript" in data:
-            session.transcript = []
-            for t_data in data["transcript"]:
-                session.transcript.append(
-                    TranscriptEntry(
-                        speaker=t_data["speaker"],
-                        french_text=t_data["french_text"]
-                        if "french_text" in t_data
-                        else t_data.get("french", ""),
-                        english_text=t_data["english_text"]
-                        if "english_text" in t_data
-                        else t_data.get("english", ""),
-                        timestamp=datetime.fromisoformat(t_data["timestamp"])
-                        if "timestamp" in t_data
-                        else datetime.now(),
-                    )
-                )
+        created_at = data.get("created_at")
+        if created_at is not None:
+            session.created_at = datetime.fromisoformat(created_at)
+
+        transcript = data.get("transcript")
+        if transcript is not None:
+            session.transcript = list(map(TranscriptEntry.from_dict, transcript))
+            for entry in session.transcript:
+                session._index_transcript_entry(entry)
 
         return session
 
 
-# In-memory cache backed by file
-_sessions: Dict[str, CallSession] = {}
+# Most recently used sessions, kept in memory; the rest are read back from
+# the store on demand. Only idle sessions of finished calls are evicted, so
+# a handler holding a session never ends up writing to a dropped copy
+SESSION_CACHE_MAX = 512
+_sessions: "OrderedDict[str, CallSession]" = OrderedDict()
 
 
-SESSIONS_FILE = "sessions.json"
+SESSIONS_DB = "sessions.db"
 
+# One row per session, so a save rewrites only that session
+_store = SqliteStore(
+    SESSIONS_DB,
+    get_record=lambda cid: _sessions[cid].to_dict() if cid in _sessions else None,
+    legacy_json_path="sessions.json",
+    sort_field="created_at",
+)
 
-def load_sessions():
-    """Load sessions from disk"""
-    global _sessions
-    if not os.path.exists(SESSIONS_FILE):
+
+def _cache_session(session: CallSession):
+    """Mark a session most recently used, evicting an idle one if full"""
+    _sessions[session.call_id] = session
+    _sessions.move_to_end(session.call_id)
+    if len(_sessions) <= SESSION_CACHE_MAX:
         return
 
-    try:
-        with open(SESSIONS_FILE, "r") as f:
-            data = json.load(f)
-            for cid, s_data in data.items():
-                try:
-                    _sessions[cid] = CallSession.from_dict(s_data)
-                except Exception as e:
-                    logger.error(f"Failed to load session {cid}: {e}")
-        logger.info(f"Loaded {len(_sessions)} sessions from disk")
-    except Exception as e:
-        logger.error(f"Error loading sessions: {e}")
+    for cid, cached in _sessions.items():
+        if (
+            cached.phase in TERMINAL_PHASES
+            and cached.frontend_ws is None
+            and cached.twilio_ws is None
+        ):
+            # Pending changes are read from the cache, so serialize them
+            # first; the write itself finishes in the background
+            _store.flush_in_background()
+            del _sessions[cid]
+            return
 
 
 def save_all_sessions():
-    """Save all sessions to disk"""
+    """Save all cached sessions to disk"""
     try:
-        data = {cid: s.to_dict() for cid, s in _sessions.items()}
-        with open(SESSIONS_FILE, "w") as f:
-            json.dump(data, f, indent=2)
+        _store.flush()
+        _store.write({cid: s.to_dict() for cid, s in _sessions.items()})
     except Exception as e:
         logger.error(f"Error saving sessions: {e}")
 
 
-def save_session(session: CallSession):
-    """Save single session (trigger full save for simplicity)"""
-    _sessions[session.call_id] = session
-    save_all_sessions()
+def flush_sessions():
+    """Write any pending session changes now"""
+    _store.flush()
 
 
-# Load on module import
-load_sessions()
+def save_session(session: CallSession):
+    """Save single session; writes are batched by the store"""
+    _cache_session(session)
+    _store.mark_dirty(session.call_id)
 
 
 def create_session(target: str = "caf") -> CallSession:
@@ -225,20 +317,62 @@ def create_session(target: str = "caf") -> CallSession:
     return session
 
 
-def get_session(call_id: str) -> Optional[CallSession]:
-    """Get session by ID"""
-    return _sessions.get(call_id)
+async def get_session(call_id: str) -> Optional[CallSession]:
+    """Get session by ID, reading it from disk if it isn't cached"""
+    session = _sessions.get(call_id)
+    if session is None:
+        if call_id in _store.pending_ids():
+            # Deleted, but the delete hasn't been written yet
+            return None
+        try:
+            record = await _store.read_async(_store.get, call_id)
+            if record is None:
+                return None
+            # Another request may have loaded it while we were reading
+            session = _sessions.get(call_id) or CallSession.from_dict(record)
+        except Exception as e:
+            logger.error(f"Failed to load session {call_id}: {e}")
+            return None
+    _cache_session(session)
+    return session
 
 
 def delete_session(call_id: str):
     """Remove session from store"""
-    if call_id in _sessions:
-        del _sessions[call_id]
-        save_all_sessions()
-        logger.info(f"Deleted session {call_id}")
-
+    _sessions.pop(call_id, None)
+    _store.mark_dirty(call_id)
+    logger.info(f"Deleted session {call_id}")
+
+
+async def list_sessions(
+    limit: Optional[int] = None, offset: int = 0
+) -> List[CallSession]:
+    """List sessions, newest first, optionally one page at a time"""
+    # Sessions changed moments ago may not have been written yet, so their
+    # stored rows are skipped and the cached sessions merged in instead
+    pending = _store.pending_ids()
+    stop = None if limit is None else offset + limit
+    rows = await _store.read_async(
+        lambda: list(_store.page(None if stop is None else stop + len(pending)))
+    )
 
-def list_sessions() -> List[CallSession]:
-    """List all active sessions"""
-    # Sort by created_at desc
-    return sorted(_sessions.values(), key=lambda s: s.created_at, reverse=True)
+    fresh = sorted(
+        (_sessions[cid] for cid in pending if cid in _sessions),
+        key=lambda s: s.created_at,
+        reverse=True,
+    )
+    merged = heapq.merge(
+        ((s.created_at.isoformat(), s.call_id, s) for s in fresh),
+        (
+            (record.get("created_at") or "", cid, record)
+            for cid, record in rows
+            if cid not in pending
+        ),
+        reverse=True,
+    )
+    return [
+        item
+        if isinstance(item, CallSession)
+        else _sessions.get(cid) or CallSession.from_dict(item)
+        for _, cid, item in islice(merged, offset, stop)
+    ]
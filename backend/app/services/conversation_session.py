@@ -4,50 +4,60 @@ Conversation Session Manager
 Manages the state of chat conversations, including:
 - Message history (user and agent)
 - Metadata (timestamps, conversation ID)
-- Persistence to disk (conversations.json)
+- Persistence to disk (conversations.db)
 """
 
 from dataclasses import dataclass, field
-from typing import Optional, Dict, Any, List
+from itertools import islice
+from typing import Optional, Dict, Any, Iterator, List, Tuple
+import time
 import uuid
 from datetime import datetime
 import logging
-import json
-import os
+
+from app.services.sqlite_store import SqliteStore, isoformat_to_ns, ns_to_isoformat
 
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class Message:
     """Single message in the conversation"""
 
     role: str  # "user" or "assistant"
     content: str
-    timestamp: datetime = field(default_factory=datetime.now)
+    timestamp_ns: int = field(default_factory=time.time_ns)
     metadata: Dict[str, Any] = field(default_factory=dict)
 
+    # Messages never change once added, so serialize them only once
+    _cached_dict: Optional[Dict[str, Any]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
     def to_dict(self):
-        return {
-            "role": self.role,
-            "content": self.content,
-            "timestamp": self.timestamp.isoformat(),
-            "metadata": self.metadata,
-        }
+        if self._cached_dict is None:
+            self._cached_dict = {
+                "role": self.role,
+                "content": self.content,
+                "timestamp": ns_to_isoformat(self.timestamp_ns),
+                "metadata": self.metadata,
+            }
+        return self._cached_dict
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]):
+        timestamp = data.get("timestamp")
         return cls(
             role=data["role"],
             content=data["content"],
-            timestamp=datetime.fromisoformat(data["timestamp"])
-            if "timestamp" in data
-            else datetime.now(),
+            timestamp_ns=(
+                time.time_ns() if timestamp is None else isoformat_to_ns(timestamp)
+            ),
             metadata=data.get("metadata", {}),
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class ConversationSession:
     """
     Represents a chat conversation history.
@@ -64,14 +74,22 @@ class ConversationSession:
 
     def add_message(self, role: str, content: str, metadata: Dict[str, Any] = None):
         """Add message to history"""
-        msg = Message(role=role, content=content, metadata=metadata or {})
-        self.messages.append(msg)
-        self.updated_at = datetime.now()
+        self.add_messages([(role, content, metadata)])
+
+    def add_messages(
+        self, messages: List[Tuple[str, str, Optional[Dict[str, Any]]]]
+    ):
+        """Add several (role, content, metadata) messages with a single save"""
+        for role, content, metadata in messages:
+            self.messages.append(
+                Message(role=role, content=content, metadata=metadata or {})
+            )
 
-        # Auto-generate title from first user message if missing
-        if not self.title and role == "user":
-            self.title = content[:50] + "..." if len(content) > 50 else content
+            # Auto-generate title from first user message if missing
+            if not self.title and role == "user":
+                self.title = content[:50] + "..." if len(content) > 50 else content
 
+        self.updated_at = datetime.now()
         save_session(self)
 
     def to_dict(self) -> Dict[str, Any]:
@@ -88,6 +106,16 @@ class ConversationSession:
             "messages": [m.to_dict() for m in self.messages],
         }
 
+    def to_summary(self) -> Dict[str, Any]:
+        """Serialize the listing fields only, without messages"""
+        return {
+            "conversation_id": self.conversation_id,
+            "title": self.title or "New Conversation",
+            "created_at": self.created_at.isoformat(),
+            "updated_at": self.updated_at.isoformat(),
+            "message_count": len(self.messages),
+        }
+
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "ConversationSession":
         """Reconstruct session from dict"""
@@ -97,37 +125,50 @@ class ConversationSession:
             dify_conversation_id=data.get("dify_conversation_id"),
         )
 
-        if "created_at" in data:
-            session.created_at = datetime.fromisoformat(data["created_at"])
-        if "updated_at" in data:
-            session.updated_at = datetime.fromisoformat(data["updated_at"])
+        created_at = data.get("created_at")
+        if created_at is not None:
+            session.created_at = datetime.fromisoformat(created_at)
+        updated_at = data.get("updated_at")
+        if updated_at is not None:
+            session.updated_at = datetime.fromisoformat(updated_at)
 
-        if "messages" in data:
-            session.messages = [Message.from_dict(m) for m in data["messages"]]
+        messages = data.get("messages")
+        if messages is not None:
+            session.messages = list(map(Message.from_dict, messages))
 
         return session
 
 
-# In-memory cache backed by file
+# In-memory cache backed by file, ordered oldest to newest by updated_at
 _conversations: Dict[str, ConversationSession] = {}
-CONVERSATIONS_FILE = "conversations.json"
+CONVERSATIONS_DB = "conversations.db"
+
+# One row per conversation, so a save rewrites only that conversation
+_store = SqliteStore(
+    CONVERSATIONS_DB,
+    get_record=lambda cid: (
+        _conversations[cid].to_dict() if cid in _conversations else None
+    ),
+    legacy_json_path="conversations.json",
+)
 
 
 def load_conversations():
     """Load conversations from disk"""
     global _conversations
-    if not os.path.exists(CONVERSATIONS_FILE):
-        return
-
     try:
-        with open(CONVERSATIONS_FILE, "r") as f:
-            data = json.load(f)
-            for cid, s_data in data.items():
-                try:
-                    _conversations[cid] = ConversationSession.from_dict(s_data)
-                except Exception as e:
-                    logger.error(f"Failed to load conversation {cid}: {e}")
-        logger.info(f"Loaded {len(_conversations)} conversations from disk")
+        data = _store.load()
+        for cid, s_data in data.items():
+            try:
+                _conversations[cid] = ConversationSession.from_dict(s_data)
+            except Exception as e:
+                logger.error(f"Failed to load conversation {cid}: {e}")
+        # Keep the store in update order so listing needs no sort
+        _conversations = dict(
+            sorted(_conversations.items(), key=lambda i: i[1].updated_at)
+        )
+        if _conversations:
+            logger.info(f"Loaded {len(_conversations)} conversations from disk")
     except Exception as e:
         logger.error(f"Error loading conversations: {e}")
 
@@ -135,17 +176,23 @@ def load_conversations():
 def save_all_conversations():
     """Save all conversations to disk"""
     try:
-        data = {cid: s.to_dict() for cid, s in _conversations.items()}
-        with open(CONVERSATIONS_FILE, "w") as f:
-            json.dump(data, f, indent=2)
+        _store.flush()
+        _store.write({cid: s.to_dict() for cid, s in _conversations.items()})
     except Exception as e:
         logger.error(f"Error saving conversations: {e}")
 
 
+def flush_conversations():
+    """Write any pending conversation changes now"""
+    _store.flush()
+
+
 def save_session(session: ConversationSession):
-    """Save single session"""
+    """Save single session; writes are batched by the store"""
+    # Re-insert so the most recently updated conversation is last
+    _conversations.pop(session.conversation_id, None)
     _conversations[session.conversation_id] = session
-    save_all_conversations()
+    _store.mark_dirty(session.conversation_id)
 
 
 # Load on module import
@@ -170,10 +217,20 @@ def delete_conversation(conv_id: str):
     """Remove conversation from store"""
     if conv_id in _conversations:
         del _conversations[conv_id]
-        save_all_conversations()
+        _store.mark_dirty(conv_id)
         logger.info(f"Deleted conversation {conv_id}")
 
 
-def list_conversations() -> List[ConversationSession]:
-    """List all active conversations"""
-    return sorted(_conversations.values(), key=lambda s: s.updated_at, reverse=True)
+def list_conversations(
+    limit: Optional[int] = None, offset: int = 0
+) -> List[ConversationSession]:
+    """List conversations, most recently updated first, optionally paged"""
+    stop = None if limit is None else offset + limit
+    return list(islice(reversed(_conversations.values()), offset, stop))
+
+
+def list_conversation_summaries(
+    limit: Optional[int] = None, offset: int = 0
+) -> Iterator[Dict[str, Any]]:
+    """Summaries of conversations, most recently updated first, built lazily"""
+    return (s.to_summary() for s in list_conversations(limit=limit, offset=offset))
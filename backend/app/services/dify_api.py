@@ -6,18 +6,52 @@ Handles communication with the Dify API for RAG-powered reasoning.
 
 import httpx
 import logging
-import json
-from typing import Optional
+import re
+import orjson
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Awaitable, Callable, Optional
 from app.config import settings
 
 logger = logging.getLogger(__name__)
 
+# Bytes read from the Dify SSE stream per chunk
+SSE_READ_CHUNK_SIZE = 8192
+
+# Tokens that matter when matching JSON braces: escapes, quotes, braces
+_JSON_TOKEN_RE = re.compile(r'\\.|[{}"]', re.S)
+
+# Shared client so Dify calls reuse pooled keep-alive connections
+_dify_http = httpx.AsyncClient(
+    timeout=60.0,
+    limits=httpx.Limits(max_keepalive_connections=20, max_connections=50),
+)
+
+
+async def close_dify_client():
+    """Close the shared Dify HTTP client (call on app shutdown)."""
+    await _dify_http.aclose()
+
+
+@dataclass(slots=True)
+class DifyParsed:
+    """Structured result of parse_dify_response."""
+
+    explanation: str = ""
+    raw_answer: str = ""
+    conversation_id: Optional[str] = None
+    email_draft: dict = field(default_factory=dict)
+    action: Optional[dict] = None
+    call_action: Optional[dict] = None
+
 
 async def call_dify_chat(
     query: str,
     inputs: dict = None,
     conversation_id: Optional[str] = None,
     user_id: str = "hackathon-user",
+    on_answer: Optional[Callable[[str], None]] = None,
 ) -> dict:
     """
     Call Dify chat-messages API to get explanation and email draft.
@@ -27,6 +61,7 @@ async def call_dify_chat(
         inputs: Optional dictionary of context variables for the Dify workflow
         conversation_id: Optional conversation ID for context continuity
         user_id: User identifier
+        on_answer: Optional callback receiving each answer delta as it streams in
 
     Returns:
         Dict with Dify response containing explanation and action
@@ -55,33 +90,34 @@ async def call_dify_chat(
         f"Calling Dify (streaming): query='{query[:50]}...', conv_id={conversation_id}"
     )
 
-    async with httpx.AsyncClient(timeout=60.0) as client:
-        # First attempt
-        should_retry = False
-
-        async with client.stream(
+    # First attempt
+    should_retry = False
+
+    async with _dify_http.stream(
+        "POST", url, json=payload, headers=headers
+    ) as response:
+        if response.status_code == 400 and conversation_id:
+            should_retry = True
+            logger.warning(
+                f"Dify 400 error with conv_id {conversation_id}, retrying without it..."
+            )
+        else:
+            return await _process_stream(response, on_answer)
+
+    # Retry with new request if needed
+    if should_retry:
+        if "conversation_id" in payload:
+            del payload["conversation_id"]
+
+        async with _dify_http.stream(
             "POST", url, json=payload, headers=headers
-        ) as response:
-            if response.status_code == 400 and conversation_id:
-                should_retry = True
-                logger.warning(
-                    f"Dify 400 error with conv_id {conversation_id}, retrying without it..."
-                )
-            else:
-                return await _process_stream(response)
-
-        # Retry with new request if needed
-        if should_retry:
-            if "conversation_id" in payload:
-                del payload["conversation_id"]
-
-            async with client.stream(
-                "POST", url, json=payload, headers=headers
-            ) as new_response:
-                return await _process_stream(new_response)
-
-
-async def _process_stream(response) -> dict:
+        ) as new_response:
+            return await _process_stream(new_response, on_answer)
+
+
+async def _process_stream(
+    response, on_answer: Optional[Callable[[str], None]] = None
+) -> dict:
     """Process Dify SSE stream and accumulate answer."""
 
     if response.status_code != 200:
@@ -90,27 +126,27 @@ async def _process_stream(response) -> dict:
             f"Dify API error {response.status_code}: {error_text.decode()}"
         )
 
-    full_answer = ""
+    answer_parts = []
     conversation_id = None
 
-    async for line in response.aiter_lines():
-        if not line or not line.startswith("data: "):
-            continue
-
-        data_str = line[6:]  # Skip "data: "
+    async for data_bytes in _iter_sse_data(response):
         try:
-            data = json.loads(data_str)
+            data = orjson.loads(data_bytes)
+        except orjson.JSONDecodeError:
+            continue
 
-            event = data.get("event")
+        event = data.get("event")
 
-            if event in ["message", "agent_message"]:
-                full_answer += data.get("answer", "")
-            elif event == "message_end":
-                conversation_id = data.get("conversation_id")
-                # Metadata usage etc can be captured here if needed
+        if event in ["message", "agent_message"]:
+            delta = data.get("answer", "")
+            answer_parts.append(delta)
+            if on_answer and delta:
+                on_answer(delta)
+        elif event == "message_end":
+            conversation_id = data.get("conversation_id")
+            # Metadata usage etc can be captured here if needed
 
-        except json.JSONDecodeError:
-            continue
+    full_answer = "".join(answer_parts)
 
     # Return structured dict compatible with existing code
     return {
@@ -121,7 +157,58 @@ async def _process_stream(response) -> dict:
     }
 
 
-def parse_dify_response(dify_response: dict) -> dict:
+async def _iter_sse_data(response):
+    """
+    Yield the payload of each SSE "data:" line as bytes.
+
+    Splits the raw byte stream itself, so payloads go to orjson without
+    being decoded to str first.
+    """
+    buffer = bytearray()
+    async for chunk in response.aiter_bytes(SSE_READ_CHUNK_SIZE):
+        buffer.extend(chunk)
+        start = 0
+        while (end := buffer.find(b"\n", start)) != -1:
+            if buffer.startswith(b"data: ", start):
+                yield bytes(buffer[start + 6 : end]).rstrip(b"\r")
+            start = end + 1
+        del buffer[:start]
+
+    # Stream ended without a trailing newline
+    if buffer.startswith(b"data: "):
+        yield bytes(buffer[6:]).rstrip(b"\r")
+
+
+def _extract_json(text: str) -> Optional[str]:
+    """
+    Return the first balanced {...} region of text, or None.
+
+    Braces inside JSON string literals (including escaped quotes) don't
+    count. The regex jumps straight to quotes, braces and escapes, so
+    the scan never steps through ordinary characters in Python.
+    """
+    start = text.find("{")
+    if start == -1:
+        return None
+
+    depth = 0
+    in_string = False
+    for match in _JSON_TOKEN_RE.finditer(text, start):
+        token = match.group()
+        if token == '"':
+            in_string = not in_string
+        elif in_string:
+            continue
+        elif token == "{":
+            depth += 1
+        elif token == "}":
+            depth -= 1
+            if depth == 0:
+                return text[start : match.end()]
+    return None
+
+
+def parse_dify_response(dify_response: dict) -> DifyParsed:
     """
     Parse the Dify response to extract explanation, email draft, and call action.
 
@@ -135,7 +222,7 @@ def parse_dify_response(dify_response: dict) -> dict:
         dify_response: Raw response from Dify API
 
     Returns:
-        Structured dict with explanation, email_draft, and optionally call_action
+        DifyParsed with explanation, email_draft, and optionally an action
     """
     # Extract the answer from Dify response
     answer = dify_response.get("answer", "")
@@ -146,61 +233,126 @@ def parse_dify_response(dify_response: dict) -> dict:
     tool_outputs = metadata.get("tool_outputs", [])
 
     # Initialize result structure
-    result = {
-        "explanation": answer,
-        "email_draft": {},
-        "action": None,
-        "conversation_id": conversation_id,
-    }
+    result = DifyParsed(
+        explanation=answer,
+        raw_answer=dify_response.get("raw_answer", answer),
+        conversation_id=conversation_id,
+    )
 
     # Check tool outputs for details
     for output in tool_outputs:
         if isinstance(output, dict):
             if "call_action" in output:
-                result["action"] = {"type": "call", **output["call_action"]}
+                result.action = {"type": "call", **output["call_action"]}
                 break
             if "ask_user" in output:
-                result["action"] = {"type": "ask_user", **output["ask_user"]}
+                result.action = {"type": "ask_user", **output["ask_user"]}
                 break
 
     # Try to parse as JSON if Dify returns structured output in text
     try:
-        import json
-
         # Attempt to find JSON in the answer
-        if "{" in answer and "}" in answer:
-            start = answer.find("{")
-            end = answer.rfind("}") + 1
-            json_str = answer[start:end]
-            parsed = json.loads(json_str)
+        json_str = _extract_json(answer)
+        if json_str is not None:
+            parsed = orjson.loads(json_str)
 
-            result["explanation"] = parsed.get("explanation", answer)
-            result["email_draft"] = parsed.get("email_draft", {})
+            result.explanation = parsed.get("explanation", answer)
+            result.email_draft = parsed.get("email_draft") or {}
 
             # Extract actions from parsed JSON
             if "action" in parsed:
                 # Direct action field
-                result["action"] = parsed["action"]
+                result.action = parsed["action"]
             elif "call_action" in parsed:
-                result["action"] = {"type": "call", **parsed["call_action"]}
+                result.action = {"type": "call", **parsed["call_action"]}
             elif "ask_user" in parsed:
-                result["action"] = {"type": "ask_user", **parsed["ask_user"]}
+                result.action = {"type": "ask_user", **parsed["ask_user"]}
 
             # If we found JSON, update everything but keep conversation_id
             return result
 
-    except (json.JSONDecodeError, ValueError):
+    except ValueError:  # Includes orjson.JSONDecodeError
         pass
 
     return result
 
 
+@lru_cache(maxsize=1)
+def _get_openai_client():
+    """Shared OpenAI client, so translations reuse its connection pool."""
+    import openai
+
+    return openai.AsyncOpenAI(api_key=settings.openai_api_key)
+
+
+_LANG_NAMES = {"en": "English", "fr": "French", "de": "German", "es": "Spanish"}
+
+
+@lru_cache(maxsize=64)
+def _translation_prompt(source_lang: str, target_lang: str) -> str:
+    """Build the translator system prompt for a language pair."""
+    target = _LANG_NAMES.get(target_lang, target_lang)
+
+    if source_lang == "auto":
+        # More explicit prompt to avoid translating target language to another language
+        return f"""You are a translator. Your task:
+1. First, detect the language of the input text.
+2. If the text is already in {target}, return it EXACTLY as provided with NO changes.
+3. If the text is in a different language, translate it to {target}.
+
+CRITICAL: If the input is already in {target}, do NOT translate it to any other language. Return it unchanged.
+Only output the final text, nothing else."""
+
+    source = _LANG_NAMES.get(source_lang, source_lang)
+    return f"You are a translator. Translate the following text from {source} to {target}. Only output the translation, nothing else."
+
+
+# LRU of recent translations: (system prompt, normalized text) -> translation.
+# Calls to government hotlines repeat the same short phrases and boilerplate.
+TRANSLATION_CACHE_MAX_ENTRIES = 512
+_translation_cache: "OrderedDict[tuple[str, str], str]" = OrderedDict()
+
+
+async def cached_translation(
+    system_prompt: str, text: str, translate: Callable[[], Awaitable[str]]
+) -> str:
+    """
+    Return the cached translation of text, or run translate() and cache it.
+
+    Text is matched ignoring case and whitespace, per system prompt.
+
+    Args:
+        system_prompt: Translator prompt, which fixes the language pair
+        text: Text to translate
+        translate: Coroutine factory producing the translation on a miss
+
+    Returns:
+        Translated text
+    """
+    key = (system_prompt, " ".join(text.lower().split()))
+    cached = _translation_cache.get(key)
+    if cached is not None:
+        _translation_cache.move_to_end(key)
+        return cached
+
+    result = await translate()
+
+    _translation_cache[key] = result
+    _translation_cache.move_to_end(key)
+    while len(_translation_cache) > TRANSLATION_CACHE_MAX_ENTRIES:
+        _translation_cache.popitem(last=False)
+
+    return result
+
+
 async def translate_text(
     text: str, source_lang: str = "en", target_lang: str = "fr"
 ) -> str:
     """
     Translate text between languages using OpenAI.
 
+    Results are cached, so repeated phrases skip the API call.
+
     Args:
         text: Text to translate
         source_lang: Source language code (en, fr, auto)
@@ -209,40 +361,26 @@ async def translate_text(
     Returns:
         Translated text
     """
-    import openai
-
     if not settings.openai_api_key:
         raise ValueError("OPENAI_API_KEY is not configured")
 
-    client = openai.AsyncOpenAI(api_key=settings.openai_api_key)
-
-    lang_names = {"en": "English", "fr": "French", "de": "German", "es": "Spanish"}
-    target = lang_names.get(target_lang, target_lang)
-
-    if source_lang == "auto":
-        # More explicit prompt to avoid translating target language to another language
-        system_prompt = f"""You are a translator. Your task:
-1. First, detect the language of the input text.
-2. If the text is already in {target}, return it EXACTLY as provided with NO changes.
-3. If the text is in a different language, translate it to {target}.
-
-CRITICAL: If the input is already in {target}, do NOT translate it to any other language. Return it unchanged.
-Only output the final text, nothing else."""
-    else:
-        source = lang_names.get(source_lang, source_lang)
-        system_prompt = f"You are a translator. Translate the following text from {source} to {target}. Only output the translation, nothing else."
-
-    response = await client.chat.completions.create(
-        model="gpt-4o-mini",  # Better at following instructions than gpt-3.5-turbo
-        messages=[
-            {
-                "role": "system",
-                "content": system_prompt,
-            },
-            {"role": "user", "content": text},
-        ],
-        temperature=0.1,  # Lower temperature for more deterministic output
-        max_tokens=1000,
-    )
+    client = _get_openai_client()
+
+    system_prompt = _translation_prompt(source_lang, target_lang)
+
+    async def translate() -> str:
+        response = await client.chat.completions.create(
+            model="gpt-4o-mini",  # Better at following instructions than gpt-3.5-turbo
+            messages=[
+                {
+                    "role": "system",
+                    "content": system_prompt,
+                },
+                {"role": "user", "content": text},
+            ],
+            temperature=0.1,  # Lower temperature for more deterministic output
+            max_tokens=1000,
+        )
+        return response.choices[0].message.content.strip()
 
-    return response.choices[0].message.content.strip()
+    return await cached_translation(system_prompt, text, translate)
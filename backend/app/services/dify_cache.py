@@ -0,0 +1,118 @@
+"""
+Dify Response Cache
+
+In-process TTL cache for parsed Dify chat responses.
+Only stateless turns (no Dify conversation ID) are cached, so repeated
+FAQ-style questions skip the full LLM round-trip. Identical misses that
+arrive while a fetch is in flight share that fetch.
+"""
+
+import asyncio
+import copy
+import hashlib
+import json
+import logging
+import time
+from collections import OrderedDict
+from typing import Awaitable, Callable, Optional, Tuple, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+CACHE_TTL_SECONDS = 1800  # 30 minutes
+CACHE_MAX_ENTRIES = 1000
+
+# key -> (expiry timestamp, parsed response), ordered by recency for LRU eviction
+_cache: "OrderedDict[str, Tuple[float, object]]" = OrderedDict()
+_lock = asyncio.Lock()
+
+# key -> future for the fetch currently running for that key
+_inflight: "dict[str, asyncio.Future]" = {}
+
+# Result handed to waiters when the shared fetch can't be reused
+_RETRY = object()
+
+
+def make_cache_key(query: str, dify_conversation_id: Optional[str] = None) -> str:
+    """Build a cache key from the normalized query and Dify conversation ID."""
+    raw = json.dumps({"q": query.lower().strip(), "c": dify_conversation_id})
+    return hashlib.sha256(raw.encode()).hexdigest()
+
+
+async def get_or_fetch(
+    key: str,
+    fetch: Callable[[], Awaitable[T]],
+    cacheable: Callable[[T], bool] = lambda value: True,
+) -> Tuple[T, bool]:
+    """
+    Return the cached response for key, or fetch and cache it.
+
+    The lock only guards the dicts; the fetch itself runs unlocked so
+    unrelated queries are not serialized behind each other. Concurrent
+    callers for the same key await the first caller's fetch. If that
+    fetch is cancelled or its response is not cacheable, the waiters
+    fetch again instead of sharing it.
+
+    Args:
+        key: Cache key from make_cache_key
+        fetch: Coroutine factory producing the parsed Dify response
+        cacheable: Whether a response may be cached and shared
+
+    Returns:
+        Tuple of (parsed response, True if served from cache or a shared fetch)
+    """
+    while True:
+        now = time.monotonic()
+
+        async with _lock:
+            entry = _cache.get(key)
+            if entry:
+                expiry, value = entry
+                if expiry > now:
+                    _cache.move_to_end(key)
+                    return copy.copy(value), True
+                del _cache[key]
+
+            inflight = _inflight.get(key)
+            if inflight is None:
+                inflight = asyncio.get_running_loop().create_future()
+                _inflight[key] = inflight
+                break
+
+        value = await asyncio.shield(inflight)
+        if value is not _RETRY:
+            return copy.copy(value), True
+
+    try:
+        value = await fetch()
+    except Exception as e:
+        inflight.set_exception(e)
+        # Mark retrieved so a fetch with no waiters doesn't log a warning
+        inflight.exception()
+        raise
+    except BaseException:
+        # The owner's cancellation is not the waiters' failure; they retry
+        inflight.set_result(_RETRY)
+        raise
+    finally:
+        _inflight.pop(key, None)
+
+    if not cacheable(value):
+        inflight.set_result(_RETRY)
+        return value, False
+
+    inflight.set_result(value)
+
+    async with _lock:
+        _cache[key] = (time.monotonic() + CACHE_TTL_SECONDS, value)
+        _cache.move_to_end(key)
+        while len(_cache) > CACHE_MAX_ENTRIES:
+            _cache.popitem(last=False)
+
+    return copy.copy(value), False
+
+
+def clear_cache():
+    """Drop all cached responses."""
+    _cache.clear()
@@ -5,10 +5,10 @@ WebSocket clients for real-time STT and TTS with Gradium.
 """
 
 import asyncio
-import base64
-import json
+import binascii
 import logging
 from typing import AsyncGenerator, Callable, Optional
+import orjson
 import websockets
 from app.config import settings
 
@@ -18,6 +18,9 @@ logger = logging.getLogger(__name__)
 GRADIUM_STT_URL = "wss://eu.api.gradium.ai/api/speech/asr"
 GRADIUM_TTS_URL = "wss://eu.api.gradium.ai/api/speech/tts"
 
+# Sent as-is to end every stream
+END_OF_STREAM_MESSAGE = orjson.dumps({"type": "end_of_stream"}).decode()
+
 
 class GradiumSTTStream:
     """
@@ -29,6 +32,13 @@ class GradiumSTTStream:
     def __init__(self, input_format: str = "pcm", language: str = "fr"):
         self.input_format = input_format
         self.language = language
+        self._setup_message = orjson.dumps(
+            {
+                "type": "setup",
+                "model_name": "default",
+                "input_format": input_format,
+            }
+        ).decode()
         self.ws: Optional[websockets.WebSocketClientProtocol] = None
         self.transcript = ""
         self.is_speaking = True
@@ -40,16 +50,11 @@ class GradiumSTTStream:
         self.ws = await websockets.connect(GRADIUM_STT_URL, extra_headers=headers)
 
         # Send setup message
-        setup = {
-            "type": "setup",
-            "model_name": "default",
-            "input_format": self.input_format,
-        }
-        await self.ws.send(json.dumps(setup))
+        await self.ws.send(self._setup_message)
 
         # Wait for ready
         ready = await self.ws.recv()
-        ready_data = json.loads(ready)
+        ready_data = orjson.loads(ready)
         if ready_data.get("type") != "ready":
             raise Exception(f"Unexpected response: {ready_data}")
 
@@ -60,8 +65,9 @@ class GradiumSTTStream:
         if not self.ws:
             raise Exception("Not connected")
 
-        msg = {"type": "audio", "audio": base64.b64encode(audio_chunk).decode()}
-        await self.ws.send(json.dumps(msg))
+        audio_b64 = binascii.b2a_base64(audio_chunk, newline=False).decode("ascii")
+        msg = {"type": "audio", "audio": audio_b64}
+        await self.ws.send(orjson.dumps(msg).decode())
 
     async def receive_transcription(
         self, on_text: Optional[Callable[[str], None]] = None
@@ -73,47 +79,67 @@ class GradiumSTTStream:
         """
         full_transcript = ""
 
-        while not self._stop_event.is_set():
-            try:
-                msg = await asyncio.wait_for(self.ws.recv(), timeout=1.0)
-                data = json.loads(msg)
-
-                if data.get("type") == "text":
-                    text = data.get("text", "")
-                    full_transcript = text  # Gradium sends cumulative
-                    if on_text:
-                        on_text(text)
-                    logger.debug(f"STT: {text}")
-
-                elif data.get("type") == "step":
-                    # VAD - check if speaker finished
-                    vad = data.get("vad", [])
-                    if len(vad) >= 3:
-                        inactivity_prob = vad[2].get("inactivity_prob", 0)
-                        if inactivity_prob > 0.85:
-                            logger.info(
-                                f"VAD: Speaker finished (prob={inactivity_prob})"
-                            )
-                            self.is_speaking = False
-                            break
-
-                elif data.get("type") == "end_of_stream":
+        # Wait on close() directly rather than polling for it
+        stop = asyncio.create_task(self._stop_event.wait())
+        try:
+            while True:
+                try:
+                    msg = await self._recv_unless_stopped(stop)
+                    if msg is None:
+                        break
+                    data = orjson.loads(msg)
+                    msg_type = data.get("type")
+
+                    if msg_type == "text":
+                        text = data.get("text", "")
+                        full_transcript = text  # Gradium sends cumulative
+                        if on_text:
+                            on_text(text)
+                        logger.debug(f"STT: {text}")
+
+                    elif msg_type == "step":
+                        # VAD - check if speaker finished
+                        vad = data.get("vad", [])
+                        if len(vad) >= 3:
+                            inactivity_prob = vad[2].get("inactivity_prob", 0)
+                            if inactivity_prob > 0.85:
+                                logger.info(
+                                    f"VAD: Speaker finished (prob={inactivity_prob})"
+                                )
+                                self.is_speaking = False
+                                break
+
+                    elif msg_type == "end_of_stream":
+                        break
+
+                except websockets.exceptions.ConnectionClosed:
                     break
-
-            except asyncio.TimeoutError:
-                continue
-            except websockets.exceptions.ConnectionClosed:
-                break
+        finally:
+            stop.cancel()
 
         self.transcript = full_transcript
         return full_transcript
 
+    async def _recv_unless_stopped(self, stop: asyncio.Task) -> Optional[str]:
+        """Next message, or None if close() is called first."""
+        recv = asyncio.ensure_future(self.ws.recv())
+        try:
+            await asyncio.wait({recv, stop}, return_when=asyncio.FIRST_COMPLETED)
+        except asyncio.CancelledError:
+            recv.cancel()
+            raise
+
+        if not recv.done():
+            recv.cancel()
+            return None
+        return recv.result()
+
     async def close(self):
         """Close the WebSocket connection."""
         self._stop_event.set()
         if self.ws:
             # Send end of stream
-            await self.ws.send(json.dumps({"type": "end_of_stream"}))
+            await self.ws.send(END_OF_STREAM_MESSAGE)
             await self.ws.close()
             self.ws = None
 
@@ -128,6 +154,14 @@ class GradiumTTSStream:
     def __init__(self, voice_id: str = "b35yykvVppLXyw_l", output_format: str = "pcm"):
         self.voice_id = voice_id  # Default: Elise (French)
         self.output_format = output_format
+        self._setup_message = orjson.dumps(
+            {
+                "type": "setup",
+                "model_name": "default",
+                "voice_id": voice_id,
+                "output_format": output_format,
+            }
+        ).decode()
         self.ws: Optional[websockets.WebSocketClientProtocol] = None
 
     async def connect(self):
@@ -136,17 +170,11 @@ class GradiumTTSStream:
         self.ws = await websockets.connect(GRADIUM_TTS_URL, extra_headers=headers)
 
         # Send setup message
-        setup = {
-            "type": "setup",
-            "model_name": "default",
-            "voice_id": self.voice_id,
-            "output_format": self.output_format,
-        }
-        await self.ws.send(json.dumps(setup))
+        await self.ws.send(self._setup_message)
 
         # Wait for ready
         ready = await self.ws.recv()
-        ready_data = json.loads(ready)
+        ready_data = orjson.loads(ready)
         if ready_data.get("type") != "ready":
             raise Exception(f"Unexpected response: {ready_data}")
 
@@ -166,23 +194,24 @@ class GradiumTTSStream:
             raise Exception("Not connected")
 
         # Send text
-        await self.ws.send(json.dumps({"type": "text", "text": text}))
+        await self.ws.send(orjson.dumps({"type": "text", "text": text}).decode())
 
         # Signal end of text
-        await self.ws.send(json.dumps({"type": "end_of_stream"}))
+        await self.ws.send(END_OF_STREAM_MESSAGE)
 
         # Receive audio chunks
         while True:
             try:
                 msg = await self.ws.recv()
-                data = json.loads(msg)
+                data = orjson.loads(msg)
+                msg_type = data.get("type")
 
-                if data.get("type") == "audio":
+                if msg_type == "audio":
                     audio_b64 = data.get("audio", "")
                     if audio_b64:
-                        yield base64.b64decode(audio_b64)
+                        yield binascii.a2b_base64(audio_b64)
 
-                elif data.get("type") == "end_of_stream":
+                elif msg_type == "end_of_stream":
                     break
 
             except websockets.exceptions.ConnectionClosed:
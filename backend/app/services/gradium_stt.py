@@ -5,20 +5,35 @@ Handles speech-to-text transcription using the Gradium SDK.
 """
 
 import asyncio
+import os
 import tempfile
 from pathlib import Path
+from typing import AsyncIterator, Optional
 
-import gradium
+from app.services.gradium_tts import get_gradium_client
 
-from app.config import settings
+# Bytes of audio per message sent to Gradium
+STT_CHUNK_SIZE = 1920
 
 
-async def convert_to_wav(input_path: str, output_path: str) -> bool:
-    """Convert audio file to WAV format using ffmpeg."""
+async def start_pcm_conversion(
+    input_path: str = "pipe:0",
+) -> Optional[asyncio.subprocess.Process]:
+    """
+    Start ffmpeg converting audio to 24kHz mono s16le PCM on stdout.
+
+    Raw PCM is used rather than WAV because ffmpeg can't fill in the WAV
+    header sizes when writing to a pipe.
+
+    Args:
+        input_path: File to convert, or "pipe:0" to read audio from stdin
+
+    Returns:
+        The ffmpeg process, or None if ffmpeg isn't available
+    """
     try:
-        process = await asyncio.create_subprocess_exec(
+        return await asyncio.create_subprocess_exec(
             "ffmpeg",
-            "-y",
             "-i",
             input_path,
             "-ar",
@@ -26,15 +41,38 @@ async def convert_to_wav(input_path: str, output_path: str) -> bool:
             "-ac",
             "1",  # Mono
             "-f",
-            "wav",
-            output_path,
-            stdout=asyncio.subprocess.DEVNULL,
+            "s16le",
+            "pipe:1",
+            stdin=(
+                asyncio.subprocess.PIPE
+                if input_path == "pipe:0"
+                else asyncio.subprocess.DEVNULL
+            ),
+            stdout=asyncio.subprocess.PIPE,
             stderr=asyncio.subprocess.DEVNULL,
         )
-        await process.wait()
-        return process.returncode == 0
-    except Exception:
-        return False
+    except OSError:
+        return None
+
+
+# Upload formats Gradium reads directly, without converting through ffmpeg
+# (PCM is expected to be 24kHz mono s16le)
+PASSTHROUGH_FORMATS = {".wav": "wav", ".pcm": "pcm", ".raw": "pcm"}
+
+# MP4-family containers may keep their index (moov atom) at the end of the
+# file, e.g. Safari/iOS recordings, so ffmpeg needs a seekable file for them
+SEEKABLE_INPUT_FORMATS = {".mp4", ".m4a", ".mov", ".3gp"}
+
+# Upper bound for a single uploaded recording
+MAX_AUDIO_BYTES = 25 * 1024 * 1024  # 25MB
+
+
+class AudioTooLargeError(ValueError):
+    """Raised when an audio stream exceeds MAX_AUDIO_BYTES."""
+
+
+class AudioConversionError(ValueError):
+    """Raised when ffmpeg can't decode an uploaded recording."""
 
 
 async def transcribe_audio(audio_bytes: bytes, filename: str = "audio.webm") -> str:
@@ -48,60 +86,167 @@ async def transcribe_audio(audio_bytes: bytes, filename: str = "audio.webm") ->
     Returns:
         Transcribed text string
     """
-    if not settings.gradium_api_key:
-        raise ValueError("GRADIUM_API_KEY is not configured")
 
-    client = gradium.client.GradiumClient(api_key=settings.gradium_api_key)
+    async def single_chunk():
+        yield audio_bytes
 
-    # Save audio to temp file
-    suffix = Path(filename).suffix or ".webm"
-    with tempfile.NamedTemporaryFile(suffix=suffix, delete=False) as tmp:
-        tmp.write(audio_bytes)
-        tmp_path = tmp.name
+    return await transcribe_audio_stream(single_chunk(), filename)
 
-    wav_path = None
 
-    try:
-        # Convert to WAV if not already wav format
-        if suffix.lower() != ".wav":
-            wav_path = tmp_path.replace(suffix, ".wav")
-            converted = await convert_to_wav(tmp_path, wav_path)
-            if converted and Path(wav_path).exists():
-                audio_path = wav_path
-                input_format = "wav"
-            else:
-                # Fallback: try original format
-                audio_path = tmp_path
-                input_format = "opus" if suffix in [".opus", ".ogg", ".webm"] else "wav"
-        else:
-            audio_path = tmp_path
-            input_format = "wav"
+async def transcribe_audio_stream(
+    chunks: AsyncIterator[bytes],
+    filename: str = "audio.webm",
+    max_bytes: int = MAX_AUDIO_BYTES,
+) -> str:
+    """
+    Transcribe an audio byte stream to text using Gradium SDK.
+
+    Audio Gradium can't read directly is piped through ffmpeg as it
+    arrives, so the full recording is never held in memory. MP4-family
+    uploads are spooled to a temp file first, since ffmpeg may need to
+    seek to their index.
 
-        # Use SDK streaming STT
-        async def audio_generator(data, chunk_size=1920):
-            for i in range(0, len(data), chunk_size):
-                yield data[i : i + chunk_size]
+    Args:
+        chunks: Async iterator of raw audio data
+        filename: Original filename (for format detection)
+        max_bytes: Maximum accepted audio size
+
+    Returns:
+        Transcribed text string
+    """
+    client = get_gradium_client()
+
+    suffix = (Path(filename).suffix or ".webm").lower()
+    audio = _limit_size(chunks, max_bytes)
+
+    passthrough_format = PASSTHROUGH_FORMATS.get(suffix)
+    if passthrough_format:
+        return await _stt(client, passthrough_format, _split(audio))
 
-        # Read file as bytes for streaming
-        with open(audio_path, "rb") as f:
-            audio_data = f.read()
+    if suffix not in SEEKABLE_INPUT_FORMATS:
+        return await _transcribe_converted(client, suffix, audio)
 
-        stream = await client.stt_stream(
-            {"model_name": "default", "input_format": input_format},
-            audio_generator(audio_data),
+    spool_path = await _spool_to_file(audio, suffix)
+    try:
+        return await _transcribe_converted(
+            client, suffix, _read_file(spool_path), spool_path
         )
+    finally:
+        os.unlink(spool_path)
 
-        transcribed_text = ""
-        async for message in stream.iter_text():
-            # message is TextWithTimestamps object with .text attribute
-            if hasattr(message, "text"):
-                transcribed_text += message.text + " "
-            else:
-                transcribed_text += str(message) + " "
 
-        return transcribed_text.strip()
+async def _transcribe_converted(
+    client,
+    suffix: str,
+    audio: AsyncIterator[bytes],
+    input_path: Optional[str] = None,
+) -> str:
+    """
+    Convert audio to PCM through ffmpeg and transcribe it.
 
+    Audio is piped into ffmpeg as it arrives unless input_path names a
+    file ffmpeg should read instead.
+    """
+    process = await start_pcm_conversion(input_path or "pipe:0")
+    if process is None:
+        # Fallback: try original format
+        input_format = "opus" if suffix in [".opus", ".ogg", ".webm"] else "wav"
+        return await _stt(client, input_format, _split(audio))
+
+    feeder = None
+    if input_path is None:
+        feeder = asyncio.create_task(_feed_process(process, audio))
+    try:
+        text = await _stt(client, "pcm", _read_process(process))
+        if feeder:
+            try:
+                await feeder  # Surfaces AudioTooLargeError
+            except (BrokenPipeError, ConnectionResetError):
+                pass  # ffmpeg exited early; its exit status says why
+        if await process.wait() != 0:
+            # Undecodable audio gives empty output, not an empty transcript
+            raise AudioConversionError(f"Could not decode {suffix} audio")
+        return text
     finally:
-        Path(tmp_path).unlink(missing_ok=True)
-        if wav_path:
-            Path(wav_path).unlink(missing_ok=True)
+        if feeder:
+            feeder.cancel()
+        if process.returncode is None:
+            process.kill()
+        await process.wait()
+
+
+async def _spool_to_file(chunks: AsyncIterator[bytes], suffix: str) -> str:
+    """Write chunks to a temp file and return its path."""
+    tmp = tempfile.NamedTemporaryFile(suffix=suffix, delete=False)
+    try:
+        with tmp:
+            async for chunk in chunks:
+                await asyncio.to_thread(tmp.write, chunk)
+    except BaseException:
+        os.unlink(tmp.name)
+        raise
+    return tmp.name
+
+
+async def _read_file(path: str) -> AsyncIterator[bytes]:
+    """Yield a file's contents in STT_CHUNK_SIZE pieces."""
+    with open(path, "rb") as f:
+        while chunk := await asyncio.to_thread(f.read, STT_CHUNK_SIZE):
+            yield chunk
+
+
+async def _limit_size(
+    chunks: AsyncIterator[bytes], max_bytes: int
+) -> AsyncIterator[bytes]:
+    """Pass chunks through, enforcing the size limit as bytes flow in."""
+    total_bytes = 0
+    async for chunk in chunks:
+        total_bytes += len(chunk)
+        if total_bytes > max_bytes:
+            raise AudioTooLargeError(f"Audio exceeds {max_bytes} byte limit")
+        yield chunk
+
+
+async def _split(chunks: AsyncIterator[bytes]) -> AsyncIterator[bytes]:
+    """Re-slice chunks into STT_CHUNK_SIZE pieces."""
+    async for chunk in chunks:
+        for start in range(0, len(chunk), STT_CHUNK_SIZE):
+            yield chunk[start : start + STT_CHUNK_SIZE]
+
+
+async def _feed_process(
+    process: asyncio.subprocess.Process, chunks: AsyncIterator[bytes]
+):
+    """Write chunks to the process's stdin, then close it."""
+    try:
+        async for chunk in chunks:
+            process.stdin.write(chunk)
+            await process.stdin.drain()
+        process.stdin.close()
+    except BaseException:
+        # End the output stream so transcription stops waiting for it
+        process.kill()
+        raise
+
+
+async def _read_process(process: asyncio.subprocess.Process) -> AsyncIterator[bytes]:
+    """Yield the process's stdout until it closes."""
+    while chunk := await process.stdout.read(STT_CHUNK_SIZE):
+        yield chunk
+
+
+async def _stt(client, input_format: str, audio: AsyncIterator[bytes]) -> str:
+    """Run streaming STT over audio chunks and join the text segments."""
+    stream = await client.stt_stream(
+        {"model_name": "default", "input_format": input_format}, audio
+    )
+
+    transcribed_text = ""
+    async for message in stream.iter_text():
+        # message is TextWithTimestamps object with .text attribute
+        if hasattr(message, "text"):
+            transcribed_text += message.text + " "
+        else:
+            transcribed_text += str(message) + " "
+
+    return transcribed_text.strip()
@@ -5,11 +5,15 @@ Handles text-to-speech using the Gradium SDK.
 Supports chunking long text and merging audio for responses that exceed API limits.
 """
 
+import asyncio
 import gradium
 import logging
 import io
+import re
+import struct
 import wave
-from typing import List
+from functools import lru_cache
+from typing import List, Tuple
 
 from app.config import settings
 
@@ -18,6 +22,17 @@ logger = logging.getLogger(__name__)
 # Gradium free tier has a session length limit - chunk to stay safe
 MAX_CHUNK_CHARS = 1000  # Safe limit per chunk
 
+# Preferred split points, best first: sentence end, clause break, space.
+# The greedy prefix makes each a single scan for the last occurrence
+_SPLIT_PATTERNS = [
+    re.compile(r".*[.!?][ \n]", re.S),
+    re.compile(r".*[,;] ", re.S),
+    re.compile(r".* ", re.S),
+]
+
+# Chunks of one text synthesized at the same time (keeps under rate limits)
+TTS_CONCURRENCY = 4
+
 
 def chunk_text(text: str, max_chars: int = MAX_CHUNK_CHARS) -> List[str]:
     """
@@ -43,27 +58,15 @@ def chunk_text(text: str, max_chars: int = MAX_CHUNK_CHARS) -> List[str]:
 
         # Find a good split point (sentence boundary)
         chunk = remaining[:max_chars]
-        split_point = -1
-
-        # Try to find sentence endings
-        for end in [". ", "! ", "? ", ".\n", "!\n", "?\n"]:
-            last_end = chunk.rfind(end)
-            if last_end > max_chars // 2:
-                split_point = last_end + len(end)
+        # Split after the last preferred separator in the second half,
+        # or hard split as a last resort
+        split_point = max_chars
+        for pattern in _SPLIT_PATTERNS:
+            match = pattern.match(chunk, max_chars // 2 + 1)
+            if match:
+                split_point = match.end()
                 break
 
-        # Fallback to comma or space
-        if split_point == -1:
-            for sep in [", ", "; ", " "]:
-                last_sep = chunk.rfind(sep)
-                if last_sep > max_chars // 2:
-                    split_point = last_sep + len(sep)
-                    break
-
-        # Last resort: hard split
-        if split_point == -1:
-            split_point = max_chars
-
         chunks.append(remaining[:split_point].strip())
         remaining = remaining[split_point:].strip()
 
@@ -71,10 +74,60 @@ def chunk_text(text: str, max_chars: int = MAX_CHUNK_CHARS) -> List[str]:
     return chunks
 
 
+@lru_cache(maxsize=1)
+def get_gradium_client() -> gradium.client.GradiumClient:
+    """
+    Get the shared GradiumClient.
+
+    The client only holds the API key and endpoints (each request opens
+    its own connection), so one instance serves every request. The key
+    is checked here once rather than by every caller.
+
+    Raises:
+        ValueError: If GRADIUM_API_KEY is not configured
+    """
+    if not settings.gradium_api_key:
+        raise ValueError("GRADIUM_API_KEY is not configured")
+    return gradium.client.GradiumClient(api_key=settings.gradium_api_key)
+
+
+def _split_wav(wav_bytes: bytes) -> Tuple[bytes, memoryview]:
+    """
+    Locate the format and audio data of a WAV file without copying the audio.
+
+    Args:
+        wav_bytes: WAV audio bytes
+
+    Returns:
+        Tuple of (fmt chunk body, view of the data chunk body)
+    """
+    if wav_bytes[:4] != b"RIFF" or wav_bytes[8:12] != b"WAVE":
+        raise ValueError("Not a WAV file")
+
+    view = memoryview(wav_bytes)
+    fmt = None
+    pos = 12
+    while pos + 8 <= len(view):
+        chunk_id, size = struct.unpack_from("<4sI", view, pos)
+        body = pos + 8
+        if chunk_id == b"fmt ":
+            fmt = bytes(view[body : body + size])
+        elif chunk_id == b"data" and fmt is not None:
+            # Streamed WAVs may leave the size unset; slicing clamps to the end
+            return fmt, view[body : body + size]
+        # Chunks are padded to an even length
+        pos = body + size + (size & 1)
+
+    raise ValueError("WAV file has no audio data")
+
+
 def merge_wav_audio(audio_chunks: List[bytes]) -> bytes:
     """
     Merge multiple WAV audio chunks into a single WAV file.
 
+    The audio data of each chunk is copied once, straight into the output,
+    behind a header built for the combined length.
+
     Args:
         audio_chunks: List of WAV audio bytes
 
@@ -84,29 +137,23 @@ def merge_wav_audio(audio_chunks: List[bytes]) -> bytes:
     if len(audio_chunks) == 1:
         return audio_chunks[0]
 
-    # Read first chunk to get audio parameters
-    first_wav = wave.open(io.BytesIO(audio_chunks[0]), "rb")
-    params = first_wav.getparams()
-
-    # Collect all audio frames
-    all_frames = []
-    for chunk_bytes in audio_chunks:
-        wav_file = wave.open(io.BytesIO(chunk_bytes), "rb")
-        all_frames.append(wav_file.readframes(wav_file.getnframes()))
-        wav_file.close()
-
-    first_wav.close()
-
-    # Write merged audio
-    output = io.BytesIO()
-    merged_wav = wave.open(output, "wb")
-    merged_wav.setparams(params)
-    for frames in all_frames:
-        merged_wav.writeframes(frames)
-    merged_wav.close()
+    # Every chunk shares the first chunk's audio parameters
+    fmt, _ = _split_wav(audio_chunks[0])
+    frames = [_split_wav(chunk_bytes)[1] for chunk_bytes in audio_chunks]
+    data_size = sum(len(f) for f in frames)
+
+    header = struct.pack(
+        "<4sI4s4sI",
+        b"RIFF",
+        4 + (8 + len(fmt)) + (8 + data_size),
+        b"WAVE",
+        b"fmt ",
+        len(fmt),
+    )
+    data_header = struct.pack("<4sI", b"data", data_size)
 
     logger.info(f"Merged {len(audio_chunks)} audio chunks")
-    return output.getvalue()
+    return b"".join([header, fmt, data_header, *frames])
 
 
 def extract_wav_frames(wav_bytes: bytes) -> tuple:
@@ -125,42 +172,44 @@ async def text_to_speech_chunked(
     Generate TTS for long text, yielding audio chunks progressively.
 
     This allows the frontend to start playing audio immediately while
-    still generating the remaining chunks.
+    still generating the remaining chunks; each chunk is generated while
+    the previous one is being consumed.
 
     Yields:
         dict with 'audio' (bytes), 'chunk_index', 'total_chunks', 'is_last'
     """
-    if not settings.gradium_api_key:
-        raise ValueError("GRADIUM_API_KEY is not configured")
+    client = get_gradium_client()
 
     chunks = chunk_text(text)
     total_chunks = len(chunks)
 
     logger.info(f"Streaming TTS: {len(text)} chars in {total_chunks} chunks")
 
-    # client = gradium.client.GradiumClient(api_key=settings.gradium_api_key)
-
-    for i, chunk in enumerate(chunks):
+    def generate(i: int) -> "asyncio.Task[bytes]":
+        chunk = chunks[i]
         logger.info(f"Generating chunk {i + 1}/{total_chunks} ({len(chunk)} chars)")
-
-        # Instantiate client per chunk to avoid session timeout
-        client = gradium.client.GradiumClient(api_key=settings.gradium_api_key)
-
-        result = await client.tts(
-            setup={
-                "model_name": "default",
-                "voice_id": voice_id,
-                "output_format": output_format,
-            },
-            text=chunk,
+        return asyncio.create_task(
+            _tts_single_chunk(client, chunk, voice_id, output_format)
         )
 
-        yield {
-            "audio": result.raw_data,
-            "chunk_index": i,
-            "total_chunks": total_chunks,
-            "is_last": i == total_chunks - 1,
-        }
+    # Generate the next chunk while the caller sends the current one,
+    # staying at most one chunk ahead
+    pending = generate(0)
+    try:
+        for i in range(total_chunks):
+            audio = await pending
+            if i + 1 < total_chunks:
+                pending = generate(i + 1)
+
+            yield {
+                "audio": audio,
+                "chunk_index": i,
+                "total_chunks": total_chunks,
+                "is_last": i == total_chunks - 1,
+            }
+    finally:
+        # The caller stopped early (e.g. client disconnected)
+        pending.cancel()
 
 
 # Voice IDs from Gradium docs
@@ -205,14 +254,11 @@ async def text_to_speech(
     Returns:
         Audio bytes
     """
-    if not settings.gradium_api_key:
-        raise ValueError("GRADIUM_API_KEY is not configured")
+    client = get_gradium_client()
 
     # Split text into chunks
     chunks = chunk_text(text)
 
-    client = gradium.client.GradiumClient(api_key=settings.gradium_api_key)
-
     if len(chunks) == 1:
         # Single chunk - no merging needed
         return await _tts_single_chunk(client, chunks[0], voice_id, output_format)
@@ -220,12 +266,17 @@ async def text_to_speech(
     # Multiple chunks - generate in parallel and merge
     logger.info(f"Generating TTS for {len(chunks)} chunks...")
 
-    # Generate audio for each chunk (sequentially to maintain order and avoid rate limits)
-    audio_chunks = []
-    for i, chunk in enumerate(chunks):
-        logger.info(f"Processing chunk {i + 1}/{len(chunks)} ({len(chunk)} chars)")
-        audio = await _tts_single_chunk(client, chunk, voice_id, output_format)
-        audio_chunks.append(audio)
+    # Chunks are independent requests; gather keeps them in order
+    semaphore = asyncio.Semaphore(TTS_CONCURRENCY)
+
+    async def generate(i: int, chunk: str) -> bytes:
+        async with semaphore:
+            logger.info(f"Processing chunk {i + 1}/{len(chunks)} ({len(chunk)} chars)")
+            return await _tts_single_chunk(client, chunk, voice_id, output_format)
+
+    audio_chunks = await asyncio.gather(
+        *(generate(i, chunk) for i, chunk in enumerate(chunks))
+    )
 
     # Merge audio chunks
     if output_format == "wav":
@@ -244,14 +295,11 @@ async def text_to_speech_stream(
     Yields:
         Audio chunks as bytes
     """
-    if not settings.gradium_api_key:
-        raise ValueError("GRADIUM_API_KEY is not configured")
+    client = get_gradium_client()
 
     # For streaming, we process chunks sequentially
     chunks = chunk_text(text)
 
-    client = gradium.client.GradiumClient(api_key=settings.gradium_api_key)
-
     for chunk in chunks:
         stream = await client.tts_stream(
             setup={
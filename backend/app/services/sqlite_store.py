@@ -0,0 +1,293 @@
+"""
+SQLite Store
+
+Persists a keyed collection of JSON records as one row per record in a
+SQLite database running in WAL mode:
+- Saving a record rewrites only its own row
+- Processes sharing the database never overwrite each other's records
+- Saves made while the event loop is running are debounced, so a burst
+  of changes to a record costs a single write, and that write runs on a
+  background thread instead of blocking the loop
+- Records can be read back one at a time, or a page at a time ordered
+  by one of their fields; read_async runs those reads on the writer
+  thread so the event loop never waits on disk
+
+A database that is still empty imports the legacy JSON file it replaces
+(e.g. sessions.json) once.
+"""
+
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import datetime
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    FrozenSet,
+    Iterator,
+    Optional,
+    Set,
+    Tuple,
+    TypeVar,
+    Union,
+)
+import asyncio
+import atexit
+import logging
+import os
+import sqlite3
+
+import orjson
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# Seconds to gather changes before writing them
+FLUSH_DELAY = 0.1
+
+
+def ns_to_isoformat(timestamp_ns: int) -> str:
+    """Format a time.time_ns() value as a local ISO 8601 timestamp."""
+    seconds, ns = divmod(timestamp_ns, 1_000_000_000)
+    return datetime.fromtimestamp(seconds).replace(microsecond=ns // 1000).isoformat()
+
+
+def isoformat_to_ns(value: Union[str, int]) -> int:
+    """Parse a stored timestamp (ISO string or nanoseconds) into nanoseconds."""
+    if isinstance(value, int):
+        return value
+    dt = datetime.fromisoformat(value)
+    return (int(dt.timestamp()) * 1_000_000 + dt.microsecond) * 1000
+
+
+class SqliteStore:
+    """
+    One-row-per-record SQLite persistence for JSON records.
+
+    Args:
+        db_path: SQLite database file
+        get_record: Current serialized record for an ID, None if deleted
+        legacy_json_path: JSON file of {id: record} to import when empty
+        sort_field: Record field that page() orders by (e.g. "created_at")
+    """
+
+    def __init__(
+        self,
+        db_path: str,
+        get_record: Callable[[str], Optional[Dict[str, Any]]],
+        legacy_json_path: Optional[str] = None,
+        sort_field: Optional[str] = None,
+    ):
+        self.db_path = db_path
+        self.legacy_json_path = legacy_json_path
+        self.sort_field = sort_field
+        self._get_record = get_record
+        self._conn: Optional[sqlite3.Connection] = None
+
+        # All writes go through one thread with its own connection, so they
+        # commit in order and never share a connection with readers
+        self._writer = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="sqlite-store"
+        )
+        self._write_conn: Optional[sqlite3.Connection] = None
+
+        # Records changed since the last flush, and the loop a flush is
+        # scheduled on (None when nothing is pending)
+        self._dirty: Set[str] = set()
+        self._flush_loop: Optional[asyncio.AbstractEventLoop] = None
+        atexit.register(self.flush)
+
+    def load(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Read every record.
+
+        Returns:
+            Dict of record ID to record
+        """
+        rows = self._connect().execute("SELECT id, data FROM records")
+        return {record_id: orjson.loads(data) for record_id, data in rows}
+
+    def get(self, record_id: str) -> Optional[Dict[str, Any]]:
+        """Read one record, or None if it doesn't exist."""
+        row = (
+            self._connect()
+            .execute("SELECT data FROM records WHERE id = ?", (record_id,))
+            .fetchone()
+        )
+        return orjson.loads(row[0]) if row else None
+
+    def page(
+        self, limit: Optional[int] = None, offset: int = 0
+    ) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """
+        Read records ordered by sort_field, highest first.
+
+        Args:
+            limit: Max records to return, None for all
+            offset: Records to skip
+
+        Returns:
+            Iterator of (record ID, record)
+        """
+        rows = self._connect().execute(
+            "SELECT id, data FROM records ORDER BY sort_key DESC LIMIT ? OFFSET ?",
+            (-1 if limit is None else limit, offset),
+        )
+        for record_id, data in rows:
+            yield record_id, orjson.loads(data)
+
+    def mark_dirty(self, record_id: str):
+        """
+        Schedule a record to be written (or deleted) on the next flush.
+
+        Inside a running event loop the flush happens FLUSH_DELAY later,
+        coalescing further changes, and is written in the background;
+        otherwise it happens immediately.
+        """
+        self._dirty.add(record_id)
+
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self.flush()
+            return
+
+        # A flush scheduled on another (possibly closed) loop may never run
+        if self._flush_loop is not loop:
+            self._flush_loop = loop
+            loop.call_later(FLUSH_DELAY, self.flush_in_background)
+
+    def flush(self):
+        """
+        Write every pending change, returning once it and any background
+        write still in flight have committed.
+        """
+        try:
+            self.write(self._take_dirty())
+        except sqlite3.Error as e:
+            logger.error(f"Error saving to {self.db_path}: {e}")
+
+    def write(self, records: Dict[str, Optional[Dict[str, Any]]]):
+        """
+        Upsert or delete records in one transaction and wait for it.
+
+        Args:
+            records: Record ID to record, or to None to delete it
+        """
+        self._connect()
+        try:
+            future = self._writer.submit(self._write_now, records)
+        except RuntimeError:
+            # Interpreter exit: the writer thread has already finished
+            self._write_now(records)
+            return
+        future.result()
+
+    def _take_dirty(self) -> Dict[str, Optional[Dict[str, Any]]]:
+        """Serialize pending changes; runs on the caller's thread."""
+        self._flush_loop = None
+        dirty, self._dirty = self._dirty, set()
+        return {record_id: self._get_record(record_id) for record_id in dirty}
+
+    def pending_ids(self) -> FrozenSet[str]:
+        """IDs of records changed since the last flush."""
+        return frozenset(self._dirty)
+
+    async def read_async(self, read: Callable[..., T], *args) -> T:
+        """
+        Run a blocking read (e.g. get or page) without blocking the loop.
+
+        The read runs on the writer thread, so it sees every write queued
+        before it, including background flushes still in flight.
+        """
+        self._connect()
+        return await asyncio.get_running_loop().run_in_executor(
+            self._writer, read, *args
+        )
+
+    def flush_in_background(self):
+        """Serialize pending changes now and write them without waiting."""
+        records = self._take_dirty()
+        if records:
+            self._connect()
+            self._writer.submit(self._write_now, records).add_done_callback(
+                self._log_write_error
+            )
+
+    def _log_write_error(self, future: Future):
+        if future.exception() is not None:
+            logger.error(f"Error saving to {self.db_path}: {future.exception()}")
+
+    def _write_now(self, records: Dict[str, Optional[Dict[str, Any]]]):
+        if not records:
+            return
+
+        upserts = [
+            (record_id, orjson.dumps(record), self._sort_key(record))
+            for record_id, record in records.items()
+            if record is not None
+        ]
+        deletes = [
+            (record_id,) for record_id, record in records.items() if record is None
+        ]
+
+        if self._write_conn is None:
+            self._write_conn = self._open_connection()
+        conn = self._write_conn
+        with conn:
+            conn.executemany(
+                "INSERT OR REPLACE INTO records (id, data, sort_key) "
+                "VALUES (?, ?, ?)",
+                upserts,
+            )
+            conn.executemany("DELETE FROM records WHERE id = ?", deletes)
+
+    def _open_connection(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        conn.execute("PRAGMA journal_mode=WAL")
+        # WAL makes NORMAL safe against corruption; a power loss can only
+        # drop the last few commits
+        conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
+
+    def _connect(self) -> sqlite3.Connection:
+        """Reading connection, creating the schema on first use."""
+        if self._conn is None:
+            conn = self._open_connection()
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS records "
+                "(id TEXT PRIMARY KEY, data BLOB NOT NULL, sort_key)"
+            )
+            columns = [row[1] for row in conn.execute("PRAGMA table_info(records)")]
+            if "sort_key" not in columns:
+                # Database written before records had a sort key
+                conn.execute("ALTER TABLE records ADD COLUMN sort_key")
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS records_sort_key ON records (sort_key)"
+            )
+            self._conn = conn
+
+            empty = conn.execute("SELECT 1 FROM records LIMIT 1").fetchone() is None
+            if self.legacy_json_path and empty:
+                self._import_legacy_json()
+            elif "sort_key" not in columns and self.sort_field:
+                self.write(self.load())
+        return self._conn
+
+    def _sort_key(self, record: Dict[str, Any]) -> Any:
+        return record.get(self.sort_field) if self.sort_field else None
+
+    def _import_legacy_json(self):
+        if not os.path.exists(self.legacy_json_path):
+            return
+
+        with open(self.legacy_json_path, "rb") as f:
+            records = orjson.loads(f.read())
+        self.write(records)
+
+        # Keep the old file around, but never import it twice
+        os.replace(self.legacy_json_path, f"{self.legacy_json_path}.migrated")
+        logger.info(
+            f"Imported {len(records)} records from {self.legacy_json_path} "
+            f"into {self.db_path}"
+        )
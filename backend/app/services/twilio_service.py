@@ -4,13 +4,33 @@ Twilio Service
 Handles outbound phone calls for the text-to-call bridge.
 """
 
+import asyncio
+from functools import lru_cache
+from xml.sax.saxutils import escape
+
 from twilio.rest import Client
-from twilio.twiml.voice_response import VoiceResponse, Gather, Connect
 from app.config import settings
 import logging
 
 logger = logging.getLogger(__name__)
 
+# TwiML only varies by URL, so it is filled in directly rather than built
+# through VoiceResponse on every call (same output)
+PLAY_TWIML_TEMPLATE = (
+    '<?xml version="1.0" encoding="UTF-8"?>'
+    "<Response><Play>{audio_url}</Play>"
+    '<Gather action="{gather_callback}" input="speech" language="fr-FR" '
+    'speechTimeout="auto" timeout="30" />'
+    '<Say language="fr-FR">Au revoir.</Say></Response>'
+)
+STREAM_TWIML_TEMPLATE = (
+    '<?xml version="1.0" encoding="UTF-8"?>'
+    '<Response><Connect><Stream url="{url}" /></Connect></Response>'
+)
+
+# Entities for URLs placed in an attribute value
+_ATTRIBUTE_ENTITIES = {'"': "&quot;"}
+
 
 class TwilioService:
     """Service for managing Twilio phone calls."""
@@ -76,25 +96,12 @@ class TwilioService:
         Returns:
             TwiML XML string
         """
-        response = VoiceResponse()
-
-        # Play the French TTS audio
-        response.play(audio_url)
-
-        # Gather the response (record what CAF says)
-        gather = Gather(
-            input="speech",
-            action=gather_callback,
-            language="fr-FR",
-            speech_timeout="auto",
-            timeout=30,
+        # Play the French TTS audio, gather the response (record what CAF
+        # says), and if no input, hang up
+        return PLAY_TWIML_TEMPLATE.format(
+            audio_url=escape(audio_url),
+            gather_callback=escape(gather_callback, _ATTRIBUTE_ENTITIES),
         )
-        response.append(gather)
-
-        # If no input, hang up
-        response.say("Au revoir.", language="fr-FR")
-
-        return str(response)
 
     @staticmethod
     def generate_stream_twiml(stream_url: str) -> str:
@@ -111,14 +118,9 @@ class TwilioService:
         Returns:
             TwiML XML string
         """
-        response = VoiceResponse()
-
-        # Use Connect with Stream for bidirectional audio
-        connect = Connect()
-        connect.stream(url=stream_url)
-        response.append(connect)
-
-        return str(response)
+        return STREAM_TWIML_TEMPLATE.format(
+            url=escape(stream_url, _ATTRIBUTE_ENTITIES)
+        )
 
     def initiate_media_stream_call(
         self, to_number: str, call_id: str, media_stream_url: str
@@ -149,6 +151,49 @@ class TwilioService:
         return call.sid
 
 
+@lru_cache(maxsize=1)
+def get_twilio() -> TwilioService:
+    """
+    Get the shared TwilioService.
+
+    Reusing one REST client keeps its HTTP session (and the pooled TLS
+    connections to api.twilio.com) alive across requests.
+    """
+    return TwilioService()
+
+
+# Background hangups in flight, referenced until they finish
+_pending_hangups: set = set()
+
+
+def end_call_in_background(call_sid: str) -> asyncio.Task:
+    """
+    Hang up a call without blocking the event loop.
+
+    The Twilio SDK is synchronous, so end_call runs in a worker thread
+    and the caller doesn't wait for Twilio's response.
+
+    Args:
+        call_sid: Twilio Call SID
+
+    Returns:
+        Task resolving to end_call's result
+    """
+    task = asyncio.create_task(
+        asyncio.to_thread(lambda: get_twilio().end_call(call_sid))
+    )
+    _pending_hangups.add(task)
+    task.add_done_callback(_on_hangup_done)
+    return task
+
+
+def _on_hangup_done(task: asyncio.Task):
+    """Forget a finished hangup, logging any failure"""
+    _pending_hangups.discard(task)
+    if not task.cancelled() and task.exception():
+        logger.error(f"Failed to end call: {task.exception()}")
+
+
 # French hotline numbers
 HOTLINE_NUMBERS = {
     "caf": "+33780827985",  # TEST NUMBER
@@ -0,0 +1,43 @@
+"""
+Shared fixtures
+"""
+
+from collections import OrderedDict
+
+import pytest
+
+from app.services import call_session, conversation_session
+from app.services.sqlite_store import SqliteStore
+
+
+@pytest.fixture
+def session_store(tmp_path, monkeypatch):
+    """Point the call session store at a fresh database for one test."""
+    monkeypatch.setattr(call_session, "_sessions", OrderedDict())
+    store = SqliteStore(
+        str(tmp_path / "sessions.db"),
+        get_record=lambda cid: (
+            call_session._sessions[cid].to_dict()
+            if cid in call_session._sessions
+            else None
+        ),
+        sort_field="created_at",
+    )
+    monkeypatch.setattr(call_session, "_store", store)
+    return store
+
+
+@pytest.fixture
+def conversation_store(tmp_path, monkeypatch):
+    """Point the conversation store at a fresh database for one test."""
+    monkeypatch.setattr(conversation_session, "_conversations", {})
+    store = SqliteStore(
+        str(tmp_path / "conversations.db"),
+        get_record=lambda cid: (
+            conversation_session._conversations[cid].to_dict()
+            if cid in conversation_session._conversations
+            else None
+        ),
+    )
+    monkeypatch.setattr(conversation_session, "_store", store)
+    return store
@@ -2,20 +2,75 @@
 import asyncio
 import sys
 import unittest
+from pathlib import Path
+from types import ModuleType, SimpleNamespace
 from unittest.mock import MagicMock, AsyncMock, patch
 
-# Add backend to path
-sys.path.append("/Users/nischay/Documents/GitHub/tech-europe/backend")
+import uvloop
 
-# Mock dependencies BEFORE importing app modules
-sys.modules["app.config"] = MagicMock()
-sys.modules["app.services.call_session"] = MagicMock()
-sys.modules["app.services.dify_api"] = MagicMock()
-sys.modules["app.services.twilio_service"] = MagicMock()
-sys.modules["gradium"] = MagicMock()
-sys.modules["gradium.client"] = MagicMock()
+# Add backend to path, ahead of site-packages
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(BACKEND_DIR))
 
-from app.api.v1.call_media import process_stt
+
+# Stub dependencies BEFORE importing app modules, with plain modules that
+# only carry the names call_media imports (attribute access stays cheap)
+def _stub_module(name, **attrs):
+    module = ModuleType(name)
+    module.__dict__.update(attrs)
+    sys.modules[name] = module
+    return module
+
+
+async def _async_noop(*args, **kwargs):
+    return ""
+
+
+_stub_module(
+    "app.config", settings=SimpleNamespace(tts_concurrency=1, gradium_api_key="")
+)
+_stub_module(
+    "app.services.call_session",
+    CallSession=object,
+    CallPhase=SimpleNamespace(
+        CONNECTED="connected",
+        WAITING_GREETING_RESPONSE="waiting_greeting_response",
+        CAF_SPEAKING="caf_speaking",
+        WAITING_USER="waiting_user",
+        USER_SPEAKING="user_speaking",
+        ENDED="ended",
+        FAILED="failed",
+    ),
+    get_session=lambda call_id: None,
+)
+_stub_module(
+    "app.services.dify_api",
+    call_dify_chat=_async_noop,
+    parse_dify_response=lambda response: {},
+    translate_text=_async_noop,
+)
+_stub_module(
+    "app.services.twilio_service", end_call_in_background=lambda call_sid: None
+)
+_stub_module("gradium", client=_stub_module("gradium.client", GradiumClient=object))
+
+from app.api.v1.call_media import STT_QUEUE_MAX_CHUNKS, process_stt
+
+
+class StubSession:
+    """The session attributes process_stt touches"""
+
+    __slots__ = ("call_id", "phase", "user_question", "twilio_call_sid", "transcript")
+
+    def __init__(self, call_id):
+        self.call_id = call_id
+        self.phase = None
+        self.user_question = None
+        self.twilio_call_sid = None
+        self.transcript = []
+
+    def add_transcript(self, speaker, french, english):
+        self.transcript.append((speaker, french, english))
 
 class MockStream:
     def __init__(self, events):
@@ -24,18 +79,15 @@ class MockStream:
     async def _generator(self, events):
         for event in events:
             yield event
-            await asyncio.sleep(0.1) # Simulate some time passing
+            await asyncio.sleep(0)  # Yield to the loop; time.time is patched, so no real wait
 
 class TestThrottling(unittest.IsolatedAsyncioTestCase):
     async def test_throttling_logic(self):
         # Setup mocks
-        session = MagicMock()
-        session.call_id = "test-call"
-        session.transcript = []
-        session.add_transcript = MagicMock()
-        
-        client = MagicMock()
-        audio_queue = asyncio.Queue()
+        session = StubSession("test-call")
+
+        # Bounded like the queue twilio_media_stream feeds
+        audio_queue = asyncio.Queue(maxsize=STT_QUEUE_MAX_CHUNKS)
         
         # Mock translate function
         translation_counts = 0
@@ -65,7 +117,7 @@ class TestThrottling(unittest.IsolatedAsyncioTestCase):
             {"type": "text", "text": " my name is John Doe"}, # Total: "Hello my name is John Doe" (25 chars). 
             # Note: In real app, time passes between events. 
             # We need to simulate time passing in the mock stream or by sleeping in the test?
-            # The MockStream generator has a `sleep(0.1)`...
+            # The MockStream generator only yields to the loop (`sleep(0)`)...
             
             # Let's make the text chunks arrive slowly
         ]
@@ -80,13 +132,15 @@ class TestThrottling(unittest.IsolatedAsyncioTestCase):
             translation_counts += 1
             return f"Translated: {text}"
             
-        with patch("app.api.v1.call_media.translate_to_english", side_effect=mock_translate) as mock_tr, \
-             patch("app.api.v1.call_media.notify_frontend", side_effect=mock_notify), \
-             patch("app.api.v1.call_media.get_agent_response", new_callable=AsyncMock) as mock_agent, \
-             patch("app.api.v1.call_media.time.time") as mock_time:
-            
-            mock_time.return_value = base_time
-            
+        mock_time = MagicMock(return_value=base_time)
+
+        with patch.multiple(
+            "app.api.v1.call_media",
+            translate_to_english=mock_translate,
+            notify_frontend=mock_notify,
+            get_agent_response=AsyncMock(return_value={}),
+            time=SimpleNamespace(time=mock_time),
+        ):
             # Helper to advance time
             def advance_time(seconds):
                 mock_time.return_value += seconds
@@ -118,13 +172,11 @@ class TestThrottling(unittest.IsolatedAsyncioTestCase):
                 yield {"type": "step", "vad": [{}, {}, {"inactivity_prob": 0.95}]}
                 yield {"type": "step", "vad": [{}, {}, {"inactivity_prob": 0.95}]}
 
-            # Make client.stt_stream an AsyncMock so it can be awaited
+            # client.stt_stream is awaited, so it is a plain coroutine function
             async def mock_stt_stream(*args, **kwargs):
-                mock_resp = MagicMock()
-                mock_resp._stream = event_generator()
-                return mock_resp
-            
-            client.stt_stream = AsyncMock(side_effect=mock_stt_stream)
+                return SimpleNamespace(_stream=event_generator())
+
+            client = SimpleNamespace(stt_stream=mock_stt_stream)
             
             await process_stt(session, client, audio_queue)
             
@@ -133,4 +185,6 @@ class TestThrottling(unittest.IsolatedAsyncioTestCase):
             self.assertEqual(translation_counts, 3)
 
 if __name__ == "__main__":
+    # Same loop the server runs on (uvicorn --loop uvloop)
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
     unittest.main()
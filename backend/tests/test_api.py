@@ -2,21 +2,30 @@
 Tests for Call Bridge API
 """
 
+import asyncio
+
 import pytest
 from fastapi.testclient import TestClient
 from app.main import app
 from unittest.mock import patch
 
+from app.services.conversation_session import get_conversation
+
 client = TestClient(app)
 
 
+@pytest.fixture(autouse=True)
+def isolated_stores(conversation_store, session_store):
+    """Keep API tests out of the databases in the working directory."""
+
+
 @pytest.mark.asyncio
 @pytest.mark.asyncio
 async def test_initiate_call_flow():
-    # Mock TwilioService
-    with patch("app.api.v1.call_websocket.TwilioService") as MockTwilioService:
+    # Mock the shared TwilioService
+    with patch("app.api.v1.call_websocket.get_twilio") as mock_get_twilio:
         # Configure mock instance
-        mock_instance = MockTwilioService.return_value
+        mock_instance = mock_get_twilio.return_value
         mock_instance.initiate_media_stream_call.return_value = "CA12345"
 
         # Test the endpoint
@@ -39,3 +48,128 @@ def test_health_check():
     response = client.get("/health")
     assert response.status_code == 200
     assert response.json() == {"status": "ok"}
+
+
+def test_process_audio_saves_turn_once():
+    dify_response = {"answer": "Voici la réponse", "conversation_id": "dify-1"}
+
+    with patch(
+        "app.api.v1.agent.transcribe_audio_stream", return_value="Bonjour"
+    ), patch("app.api.v1.agent.call_dify_chat", return_value=dify_response):
+        response = client.post(
+            "/api/v1/agent/process-audio",
+            files={"audio": ("audio.wav", b"RIFF", "audio/wav")},
+        )
+
+    assert response.status_code == 200
+    session = get_conversation(response.json()["conversation_id"])
+    assert len(session.messages) == 2
+
+
+def test_chat_does_not_cache_call_actions():
+    from app.services.dify_cache import clear_cache
+
+    clear_cache()
+    dify_response = {
+        "answer": '{"explanation": "Je vous appelle", "call_action": {"target": "caf"}}',
+        "conversation_id": "dify-call",
+    }
+
+    with patch(
+        "app.api.v1.agent.call_dify_chat", return_value=dify_response
+    ) as mock_dify:
+        first = client.post("/api/v1/agent/chat", json={"message": "Appelle la CAF"})
+        second = client.post("/api/v1/agent/chat", json={"message": "Appelle la CAF"})
+
+    assert mock_dify.call_count == 2
+    assert first.headers["X-Cache"] == second.headers["X-Cache"] == "MISS"
+
+
+def test_chat_replays_cached_turn_to_dify():
+    from app.services.dify_cache import clear_cache
+
+    clear_cache()
+    dify_response = {"answer": "Le RSA est une aide", "conversation_id": "dify-rsa"}
+
+    with patch(
+        "app.api.v1.agent.call_dify_chat", return_value=dify_response
+    ) as mock_dify:
+        client.post("/api/v1/agent/chat", json={"message": "C'est quoi le RSA ?"})
+        cached = client.post(
+            "/api/v1/agent/chat", json={"message": "C'est quoi le RSA ?"}
+        )
+        conversation_id = cached.json()["conversation_id"]
+        follow_up = client.post(
+            "/api/v1/agent/chat",
+            json={"message": "Et pour moi ?", "conversation_id": conversation_id},
+        )
+
+    assert cached.headers["X-Cache"] == "HIT"
+    assert follow_up.headers["X-Cache"] == "BYPASS"
+    query = mock_dify.call_args.kwargs["query"]
+    assert "C'est quoi le RSA ?" in query and "Le RSA est une aide" in query
+    assert query.endswith("Et pour moi ?")
+    assert get_conversation(conversation_id).dify_conversation_id == "dify-rsa"
+
+
+def test_agent_routes_registered_once():
+    from app.api.v1 import agent
+
+    routes = [
+        (route.path, method)
+        for route in agent.router.routes
+        for method in route.methods
+    ]
+    assert len(routes) == len(set(routes)) == 5
+
+
+def test_conversations_are_paginated():
+    from app.services.conversation_session import create_conversation
+
+    created = [create_conversation().conversation_id for _ in range(3)]
+
+    first = client.get("/api/v1/conversations/", params={"limit": 2}).json()
+    second = client.get(
+        "/api/v1/conversations/", params={"limit": 2, "offset": 2}
+    ).json()
+
+    assert [c["conversation_id"] for c in first] == created[:0:-1]
+    assert [c["conversation_id"] for c in second] == created[:1]
+
+
+def test_get_single_conversation():
+    from app.services.conversation_session import create_conversation
+
+    conversation = create_conversation()
+    conversation.add_message("user", "Bonjour")
+
+    response = client.get(f"/api/v1/conversations/{conversation.conversation_id}")
+
+    assert response.status_code == 200
+    assert response.json() == conversation.to_dict()
+
+
+def test_process_audio_stops_stt_when_lookup_fails():
+    stt_cancelled = False
+
+    async def transcribe(chunks, filename):
+        nonlocal stt_cancelled
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            stt_cancelled = True
+            raise
+
+    def lookup(conversation_id):
+        raise RuntimeError("store unavailable")
+
+    with patch("app.api.v1.agent.transcribe_audio_stream", transcribe), patch(
+        "app.api.v1.agent._lookup_dify_context", lookup
+    ):
+        response = client.post(
+            "/api/v1/agent/process-audio",
+            files={"audio": ("audio.wav", b"RIFF", "audio/wav")},
+        )
+
+    assert response.status_code == 500
+    assert stt_cancelled
@@ -0,0 +1,38 @@
+"""
+Tests for Audio Bridge
+"""
+
+import numpy as np
+
+from app.services.audio_bridge import mulaw_to_pcm, pcm_to_mulaw, resample
+
+
+def test_mulaw_decode_known_values():
+    pcm = np.frombuffer(mulaw_to_pcm(bytes([0x00, 0x7F, 0x80, 0xFF])), np.int16)
+    assert pcm.tolist() == [-32124, 0, 32124, 0]
+
+
+def test_mulaw_round_trip_is_stable():
+    ulaw = bytes(range(256))
+    # 0x7F and 0xFF both decode to silence and re-encode as 0xFF
+    expected = bytes(0xFF if b == 0x7F else b for b in ulaw)
+    assert pcm_to_mulaw(mulaw_to_pcm(ulaw)) == expected
+
+
+def test_pcm_to_mulaw_clips_extremes():
+    pcm = np.array([32767, -32768], dtype=np.int16).tobytes()
+    assert pcm_to_mulaw(pcm) == bytes([0x80, 0x00])
+
+
+def test_resample_is_continuous_across_chunks():
+    t = np.arange(1600) / 8000
+    pcm = (8000 * np.sin(2 * np.pi * 440 * t)).astype(np.int16).tobytes()
+
+    whole, _ = resample(pcm, 8000, 24000)
+    state, parts = None, []
+    for i in range(0, len(pcm), 320):
+        part, state = resample(pcm[i : i + 320], 8000, 24000, state)
+        parts.append(part)
+
+    assert len(whole) == 3 * len(pcm)
+    assert b"".join(parts) == whole
@@ -0,0 +1,158 @@
+"""
+Tests for Call Media event and audio queues
+"""
+
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+import orjson
+import pytest
+
+from app.api.v1 import call_media
+from app.services.call_session import CallSession
+
+
+@pytest.mark.asyncio
+async def test_frontend_outbox_is_bounded(monkeypatch):
+    monkeypatch.setattr(call_media, "FRONTEND_OUTBOX_MAX", 3)
+    session = CallSession(call_id="test", target="caf")
+    session.frontend_ws = object()
+
+    await call_media.notify_frontend(session, "caf_said", {"french": "a"})
+    await call_media.notify_frontend(session, "caf_said", {"french": "ab"})
+    await call_media.notify_frontend(session, "agent_thinking")
+    await call_media.notify_frontend(session, "speaking_to_caf")
+    await call_media.notify_frontend(session, "caf_said", {"french": "abc"})
+
+    outbox = list(session.frontend_outbox)
+    assert [m["type"] for m in outbox] == [
+        "agent_thinking",
+        "speaking_to_caf",
+        "caf_said",
+    ]
+    assert outbox[-1]["french"] == "abc"
+    assert outbox[-1]["backpressure"] is True
+
+
+def test_stt_queue_drops_oldest_audio():
+    audio_queue = asyncio.Queue(maxsize=2)
+    for chunk in (b"a", b"b", b"c"):
+        call_media.queue_stt_audio(audio_queue, chunk)
+    call_media.queue_stt_audio(audio_queue, None)
+
+    assert [audio_queue.get_nowait() for _ in range(2)] == [b"c", None]
+
+
+class FakeFrontend:
+    """Frontend WebSocket that queues a call event before hanging up."""
+
+    def __init__(self, session):
+        self.session = session
+        self.sent = []
+        self.closed = False
+
+    async def accept(self):
+        pass
+
+    async def iter_text(self):
+        await call_media.notify_frontend(
+            self.session, "caf_finished", {"french": "Au revoir"}
+        )
+        yield '{"type": "hangup"}'
+
+    async def send_text(self, text):
+        await asyncio.sleep(0)
+        self.sent.append(text)
+
+    async def close(self):
+        self.closed = True
+
+
+@pytest.mark.asyncio
+async def test_hangup_sends_queued_events_before_call_ended(monkeypatch):
+    from app.api.v1 import call_websocket
+
+    session = CallSession(call_id="test", target="caf")
+
+    async def get_session(call_id):
+        return session
+
+    monkeypatch.setattr(call_websocket, "get_session", get_session)
+    websocket = FakeFrontend(session)
+
+    await call_websocket.frontend_websocket(websocket, "test")
+
+    assert [orjson.loads(text)["type"] for text in websocket.sent] == [
+        "session_state",
+        "caf_finished",
+        "call_ended",
+    ]
+    assert websocket.closed
+
+
+@pytest.mark.asyncio
+async def test_partial_translation_restarts_after_each_utterance(monkeypatch):
+    clock = [1000.0]
+    partials = []
+
+    async def translate(text, **kwargs):
+        return f"EN:{text}"
+
+    async def notify(session, event_type, data=None):
+        if event_type == "caf_said":
+            partials.append(data["french"])
+
+    monkeypatch.setattr(call_media, "translate_to_english", translate)
+    monkeypatch.setattr(call_media, "notify_frontend", notify)
+    monkeypatch.setattr(call_media, "get_agent_response", AsyncMock(return_value={}))
+    monkeypatch.setattr(call_media, "time", SimpleNamespace(time=lambda: clock[0]))
+
+    pause = {"type": "step", "vad": [{}, {}, {"inactivity_prob": 0.95}]}
+    first = "Bonjour, vous êtes bien à la CAF de Paris"
+    second = "Quel est votre numéro ?"
+
+    async def events():
+        yield {"type": "text", "text": first}
+        for _ in range(3):
+            yield pause
+        clock[0] += 1.5
+        yield {"type": "text", "text": second}
+        await asyncio.sleep(0.01)  # Let the partial translation run
+        yield {"type": "end_of_stream"}
+
+    async def stt_stream(*args, **kwargs):
+        return SimpleNamespace(_stream=events())
+
+    session = SimpleNamespace(
+        call_id="test",
+        phase=None,
+        user_question="",
+        twilio_call_sid=None,
+        add_transcript=lambda *args: None,
+    )
+    await call_media.process_stt(
+        session, SimpleNamespace(stt_stream=stt_stream), asyncio.Queue()
+    )
+
+    assert partials == [first, second]
+
+
+@pytest.mark.asyncio
+async def test_sentence_translator_cancel_stops_pending_sentences(monkeypatch):
+    started = []
+
+    async def translate(text):
+        started.append(text)
+        await asyncio.sleep(10)
+
+    monkeypatch.setattr(call_media, "translate_to_french", translate)
+    translator = call_media.SentenceTranslator()
+    translator.feed("Hello there. How are you? ")
+    await asyncio.sleep(0)
+
+    translator.cancel()
+    await asyncio.sleep(0)
+
+    assert started
+    assert all(task.cancelled() for task in translator._tasks)
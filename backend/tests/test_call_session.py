@@ -0,0 +1,81 @@
+"""
+Tests for Call Session serialization
+"""
+
+import pytest
+
+from app.services import call_session
+from app.services.call_session import CallSession, TranscriptEntry
+
+
+def test_session_round_trips_through_dict():
+    session = CallSession(call_id="test", target="caf")
+    session.transcript.append(TranscriptEntry("caf", "Bonjour", "Hello"))
+    session.transcript.append(TranscriptEntry("user", "Merci", "Thanks"))
+
+    data = session.to_dict()
+    restored = CallSession.from_dict(data)
+
+    assert restored.to_dict() == data
+    assert restored.last_caf_msg == "Hello"
+    assert restored.last_agent_msg == "Thanks"
+
+
+def test_legacy_transcript_keys_are_read():
+    session = CallSession.from_dict(
+        {
+            "call_id": "old",
+            "transcript": [{"speaker": "caf", "french": "Oui", "english": "Yes"}],
+        }
+    )
+
+    entry = session.transcript[0]
+    assert (entry.french_text, entry.english_text) == ("Oui", "Yes")
+
+
+@pytest.mark.asyncio
+async def test_listing_overlays_unwritten_changes(session_store):
+    oldest, deleted = call_session.create_session(), call_session.create_session()
+    session_store.flush()
+    newest = call_session.create_session()
+    call_session.delete_session(deleted.call_id)
+
+    assert session_store.pending_ids() == {newest.call_id, deleted.call_id}
+    assert await call_session.list_sessions() == [newest, oldest]
+    assert await call_session.list_sessions(limit=1, offset=1) == [oldest]
+    assert await call_session.get_session(deleted.call_id) is None
+
+
+@pytest.mark.asyncio
+async def test_evicted_session_is_read_back(session_store, monkeypatch):
+    monkeypatch.setattr(call_session, "SESSION_CACHE_MAX", 1)
+    first = call_session.create_session()
+    first.phase = call_session.CallPhase.ENDED
+    call_session.create_session()
+
+    assert first.call_id not in call_session._sessions
+    restored = await call_session.get_session(first.call_id)
+    assert restored.to_dict() == first.to_dict()
+
+
+def test_calls_in_progress_are_not_evicted(session_store, monkeypatch):
+    monkeypatch.setattr(call_session, "SESSION_CACHE_MAX", 1)
+    dialing = call_session.create_session()
+    dialing.phase = call_session.CallPhase.DIALING
+    call_session.create_session()
+
+    assert call_session._sessions[dialing.call_id] is dialing
+
+
+@pytest.mark.asyncio
+async def test_attribute_changes_are_saved(session_store):
+    session = call_session.create_session()
+    session_store.flush()
+
+    session.twilio_call_sid = "CA123"
+    session.phase = call_session.CallPhase.DIALING
+
+    assert session_store.pending_ids() == {session.call_id}
+    session_store.flush()
+    record = session_store.get(session.call_id)
+    assert (record["twilio_call_sid"], record["phase"]) == ("CA123", "dialing")
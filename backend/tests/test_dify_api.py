@@ -0,0 +1,66 @@
+"""
+Tests for Dify API response parsing
+"""
+
+import httpx
+import pytest
+
+from app.services import dify_api
+
+
+@pytest.mark.asyncio
+async def test_stream_answer_is_reassembled(monkeypatch):
+    monkeypatch.setattr(dify_api, "SSE_READ_CHUNK_SIZE", 7)
+    body = (
+        b'data: {"event": "message", "answer": "Bon"}\r\n\r\n'
+        b"event: ping\n\n"
+        b'data: {"event": "agent_message", "answer": "jour \xc3\xa9t\xc3\xa9"}\n\n'
+        b'data: {"event": "message_end", "conversation_id": "c1"}'
+    )
+    deltas = []
+
+    result = await dify_api._process_stream(
+        httpx.Response(200, content=body), deltas.append
+    )
+
+    assert deltas == ["Bon", "jour été"]
+    assert result["answer"] == "Bonjour été"
+    assert result["conversation_id"] == "c1"
+
+
+def test_json_answer_is_parsed():
+    parsed = dify_api.parse_dify_response(
+        {
+            "answer": 'Here you go: {"explanation": "Done", "email_draft": {"subject": "Hi"}}',
+            "conversation_id": "c1",
+        }
+    )
+
+    assert parsed.explanation == "Done"
+    assert parsed.email_draft == {"subject": "Hi"}
+    assert parsed.conversation_id == "c1"
+
+
+def test_json_is_found_before_trailing_braces():
+    parsed = dify_api.parse_dify_response(
+        {"answer": '{"explanation": "Use {name} here"} then see {the form}'}
+    )
+
+    assert parsed.explanation == "Use {name} here"
+
+
+@pytest.mark.asyncio
+async def test_cached_translation_matches_normalized_text():
+    dify_api._translation_cache.clear()
+    calls = []
+
+    async def translate():
+        calls.append(1)
+        return "Hello"
+
+    first = await dify_api.cached_translation("fr->en", "Bonjour", translate)
+    second = await dify_api.cached_translation("fr->en", "  bonjour ", translate)
+    other = await dify_api.cached_translation("fr->de", "Bonjour", translate)
+
+    assert first == second == other == "Hello"
+    assert len(calls) == 2
@@ -0,0 +1,100 @@
+"""
+Tests for Dify Response Cache
+"""
+
+import asyncio
+
+import pytest
+
+from app.services import dify_cache
+from app.services.dify_cache import make_cache_key, get_or_fetch
+
+
+def test_make_cache_key_normalizes_query():
+    assert make_cache_key("  What is CAF? ") == make_cache_key("what is caf?")
+    assert make_cache_key("what is caf?") != make_cache_key("what is caf?", "conv-1")
+
+
+@pytest.mark.asyncio
+async def test_get_or_fetch_hits_after_first_call():
+    dify_cache.clear_cache()
+    calls = 0
+
+    async def fetch():
+        nonlocal calls
+        calls += 1
+        return {"explanation": "answer"}
+
+    key = make_cache_key("hello")
+    first, first_hit = await get_or_fetch(key, fetch)
+    second, second_hit = await get_or_fetch(key, fetch)
+
+    assert calls == 1
+    assert (first_hit, second_hit) == (False, True)
+    assert second == {"explanation": "answer"}
+
+
+@pytest.mark.asyncio
+async def test_get_or_fetch_shares_inflight_fetch():
+    dify_cache.clear_cache()
+    calls = 0
+
+    async def fetch():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return {"explanation": "answer"}
+
+    key = make_cache_key("burst")
+    results = await asyncio.gather(*(get_or_fetch(key, fetch) for _ in range(5)))
+
+    assert calls == 1
+    assert [hit for _, hit in results].count(False) == 1
+
+
+@pytest.mark.asyncio
+async def test_get_or_fetch_skips_uncacheable_responses():
+    dify_cache.clear_cache()
+    calls = 0
+
+    async def fetch():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return {"call_id": f"call-{calls}"}
+
+    key = make_cache_key("call caf")
+    results = await asyncio.gather(
+        *(get_or_fetch(key, fetch, lambda value: False) for _ in range(2))
+    )
+    later, later_hit = await get_or_fetch(key, fetch, lambda value: False)
+
+    assert calls == 3
+    assert {r["call_id"] for r, _ in results} == {"call-1", "call-2"}
+    assert [hit for _, hit in results] == [False, False]
+    assert (later, later_hit) == ({"call_id": "call-3"}, False)
+
+
+@pytest.mark.asyncio
+async def test_get_or_fetch_survives_owner_cancellation():
+    dify_cache.clear_cache()
+    calls = 0
+
+    async def fetch():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return {"explanation": "answer"}
+
+    key = make_cache_key("cancelled")
+    owner = asyncio.create_task(get_or_fetch(key, fetch))
+    await asyncio.sleep(0)
+    waiter = asyncio.create_task(get_or_fetch(key, fetch))
+    await asyncio.sleep(0)
+    owner.cancel()
+
+    value, hit = await waiter
+
+    assert owner.cancelled()
+    assert (value, hit) == ({"explanation": "answer"}, False)
+    assert calls == 2
@@ -0,0 +1,54 @@
+"""
+Tests for Gradium STT audio conversion
+"""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from app.services import gradium_stt
+
+
+class FakeClient:
+    """Gradium client that transcribes the PCM it receives as text."""
+
+    async def stt_stream(self, setup, audio):
+        async def iter_text():
+            yield b"".join([chunk async for chunk in audio]).decode()
+
+        return SimpleNamespace(iter_text=iter_text)
+
+
+def _fake_ffmpeg(script):
+    async def start(input_path="pipe:0"):
+        return await asyncio.create_subprocess_exec(
+            "sh",
+            "-c",
+            script,
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.PIPE,
+        )
+
+    return start
+
+
+@pytest.mark.asyncio
+async def test_converted_audio_is_transcribed(monkeypatch):
+    monkeypatch.setattr(gradium_stt, "get_gradium_client", FakeClient)
+    monkeypatch.setattr(gradium_stt, "start_pcm_conversion", _fake_ffmpeg("cat"))
+
+    text = await gradium_stt.transcribe_audio(b"bonjour", "audio.webm")
+
+    assert text == "bonjour"
+
+
+@pytest.mark.asyncio
+async def test_undecodable_audio_raises(monkeypatch):
+    monkeypatch.setattr(gradium_stt, "get_gradium_client", FakeClient)
+    monkeypatch.setattr(
+        gradium_stt, "start_pcm_conversion", _fake_ffmpeg("exit 1")
+    )
+
+    with pytest.raises(gradium_stt.AudioConversionError):
+        await gradium_stt.transcribe_audio(b"not audio" * 10000, "audio.webm")
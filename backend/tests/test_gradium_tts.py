@@ -0,0 +1,37 @@
+"""
+Tests for Gradium TTS audio handling
+"""
+
+import io
+import wave
+
+from app.services.gradium_tts import chunk_text, merge_wav_audio
+
+
+def _wav(frames: bytes) -> bytes:
+    output = io.BytesIO()
+    with wave.open(output, "wb") as wav_file:
+        wav_file.setnchannels(1)
+        wav_file.setsampwidth(2)
+        wav_file.setframerate(24000)
+        wav_file.writeframes(frames)
+    return output.getvalue()
+
+
+def test_merged_wav_has_all_frames():
+    merged = merge_wav_audio([_wav(b"\x01\x00" * 10), _wav(b"\x02\x00" * 5)])
+
+    with wave.open(io.BytesIO(merged), "rb") as wav_file:
+        assert wav_file.getframerate() == 24000
+        assert wav_file.getnframes() == 15
+        assert wav_file.readframes(15) == b"\x01\x00" * 10 + b"\x02\x00" * 5
+
+
+def test_chunk_text_prefers_sentence_ends():
+    text = "Bonjour, je suis Marie. Quelle est la situation? Je ne sais pas"
+
+    assert chunk_text(text, max_chars=30) == [
+        "Bonjour, je suis Marie.",
+        "Quelle est la situation?",
+        "Je ne sais pas",
+    ]
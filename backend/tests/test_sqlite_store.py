@@ -0,0 +1,71 @@
+"""
+Tests for SQLite Store
+"""
+
+import asyncio
+
+import orjson
+
+from app.services import sqlite_store
+from app.services.sqlite_store import SqliteStore
+
+
+def _store(path, records=None):
+    records = {} if records is None else records
+    return SqliteStore(str(path / "records.db"), get_record=records.get)
+
+
+def test_records_round_trip(tmp_path):
+    store = _store(tmp_path)
+    store.write({"a": {"n": 1}, "b": {"n": 2}})
+    store.write({"a": {"n": 3}, "b": None})
+
+    assert _store(tmp_path).load() == {"a": {"n": 3}}
+
+
+def test_legacy_json_is_imported_once(tmp_path):
+    legacy = tmp_path / "records.json"
+    legacy.write_bytes(orjson.dumps({"a": {"n": 1}}))
+    store = SqliteStore(
+        str(tmp_path / "records.db"), get_record={}.get, legacy_json_path=str(legacy)
+    )
+
+    assert store.load() == {"a": {"n": 1}}
+    assert not legacy.exists()
+    assert _store(tmp_path).load() == {"a": {"n": 1}}
+
+
+def test_changes_in_event_loop_are_coalesced(tmp_path, monkeypatch):
+    monkeypatch.setattr(sqlite_store, "FLUSH_DELAY", 0.01)
+    records = {}
+    store = _store(tmp_path, records)
+    writes = []
+    write_now = store._write_now
+    monkeypatch.setattr(
+        store, "_write_now", lambda batch: writes.append(batch) or write_now(batch)
+    )
+
+    async def burst():
+        for n in range(5):
+            records["a"] = {"n": n}
+            store.mark_dirty("a")
+        await asyncio.sleep(0.05)
+
+    asyncio.run(burst())
+    store.flush()
+
+    assert [batch for batch in writes if batch] == [{"a": {"n": 4}}]
+    assert _store(tmp_path).load() == {"a": {"n": 4}}
+
+
+def test_page_orders_by_sort_field(tmp_path):
+    store = SqliteStore(
+        str(tmp_path / "records.db"), get_record={}.get, sort_field="created_at"
+    )
+    store.write(
+        {cid: {"created_at": f"2024-01-0{n}"} for n, cid in enumerate("abc", 1)}
+    )
+
+    assert [cid for cid, _ in store.page(limit=2)] == ["c", "b"]
+    assert [cid for cid, _ in store.page(offset=2)] == ["a"]
+    assert store.get("b") == {"created_at": "2024-01-02"}
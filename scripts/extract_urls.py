@@ -1,4 +1,5 @@
 import json
+from functools import lru_cache
 
 def extract_urls(json_content):
     """
@@ -12,27 +13,40 @@ def extract_urls(json_content):
         list[str]: A list of URLs found in the 'links' section of the map.
     """
     if isinstance(json_content, str):
-        try:
-            data = json.loads(json_content)
-        except json.JSONDecodeError as e:
-            print(f"Error decoding JSON: {e}")
-            return []
-    else:
-        data = json_content
-        
-    urls = []
-    
+        # Copy, so callers can't modify the cached result
+        return list(_extract_urls_from_json(json_content))
+
+    return _extract_urls_from_data(json_content)
+
+@lru_cache(maxsize=32)
+def _extract_urls_from_json(json_content):
+    """
+    Parses a JSON string and extracts its URLs, once per distinct string.
+
+    Returns:
+        tuple[str, ...]: The URLs, immutable since they are cached.
+    """
+    try:
+        data = json.loads(json_content)
+    except json.JSONDecodeError as e:
+        print(f"Error decoding JSON: {e}")
+        return ()
+
+    return tuple(_extract_urls_from_data(data))
+
+def _extract_urls_from_data(data):
     # Check if 'links' key exists and is a list
-    if 'links' in data and isinstance(data['links'], list):
-        for item in data['links']:
-            # Each item in 'links' should have a 'url' key based on API documentation/usage
-            if isinstance(item, dict) and 'url' in item:
-                urls.append(item['url'])
-            elif isinstance(item, str):
-                # Fallback in case links is just a list of strings (less common for map endpoint but possible)
-                urls.append(item)
-                
-    return urls
+    links = data.get('links') if isinstance(data, dict) else None
+    if not isinstance(links, list):
+        return []
+
+    # Each item in 'links' should have a 'url' key based on API documentation/usage,
+    # with a fallback in case links is just a list of strings (less common for map endpoint but possible)
+    return [
+        item['url'] if isinstance(item, dict) else item
+        for item in links
+        if isinstance(item, str) or (isinstance(item, dict) and 'url' in item)
+    ]
 
 if __name__ == "__main__":
     # Example usage with the file we generated earlier